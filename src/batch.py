@@ -0,0 +1,137 @@
+"""
+Пакетная обработка входных файлов в пуле процессов.
+
+Процессы пула создаются один раз для всего пакета, поэтому запуск интерпретатора и импорт библиотек
+(openpyxl, python-docx, pydantic) выполняются один раз на процесс, а не для каждого входного файла.
+"""
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# расширение входных файлов при поиске в директории
+INPUT_EXTENSION = ".xlsx"
+
+# обработка одного входного файла: принимает пути к входному и выходному файлам,
+# возвращает признак получения выходного файла из кэша результатов
+Process = Callable[[str, str], Optional[bool]]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Результат обработки входного файла.
+    """
+
+    path_input: str
+    path_output: str
+    # время обработки в секундах
+    elapsed: float
+    # описание ошибки (`None` при успешной обработке)
+    error: Optional[str] = None
+    # признак получения выходного файла из кэша результатов
+    cached: bool = False
+
+
+def find_inputs(source: Path) -> list[Path]:
+    """
+    Получение списка входных файлов.
+
+    :param Path source: Директория с входными файлами или файл-манифест: пути к входным файлам по одному на строку
+        (относительные пути отсчитываются от директории манифеста, пустые строки и строки, начинающиеся с `#`,
+        пропускаются).
+    :return: Пути к входным файлам.
+    """
+
+    if source.is_dir():
+        # временные файлы блокировки Excel ("~$input.xlsx") пропускаются
+        return sorted(
+            path for path in source.iterdir() if path.suffix == INPUT_EXTENSION and not path.name.startswith("~$")
+        )
+
+    paths = []
+    for line in source.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            paths.append(source.parent / line)
+
+    return paths
+
+
+def run_job(process: Process, path_input: str, path_output: str) -> BatchResult:
+    """
+    Обработка одного входного файла с замером времени.
+
+    Ошибки обработки не прерывают пакет, а возвращаются в результате.
+
+    :param Process process: Обработка входного файла.
+    :param str path_input: Путь к входному файлу.
+    :param str path_output: Путь к выходному файлу.
+    :return: Результат обработки.
+    """
+
+    started = time.perf_counter()
+    try:
+        cached = bool(process(path_input, path_output))
+    except Exception as ex:  # pylint: disable=W0703
+        logger.error("При обработке файла %s возникла ошибка: %s", path_input, ex)
+        logger.debug(traceback.format_exc())
+        return BatchResult(path_input, path_output, time.perf_counter() - started, f"{type(ex).__name__}: {ex}")
+
+    return BatchResult(path_input, path_output, time.perf_counter() - started, cached=cached)
+
+
+def run_batch(process: Process, inputs: list[Path], extension: str, workers: int) -> list[BatchResult]:
+    """
+    Пакетная обработка входных файлов.
+
+    Выходные файлы сохраняются рядом с входными файлами: имя выходного файла совпадает с именем входного,
+    а расширение соответствует формату (`extension`).
+
+    :param Process process: Обработка входного файла (должна поддерживать сериализацию `pickle`).
+    :param list[Path] inputs: Пути к входным файлам.
+    :param str extension: Расширение выходных файлов.
+    :param int workers: Количество процессов (1 – последовательная обработка в текущем процессе).
+    :return: Результаты обработки в порядке входных файлов.
+    """
+
+    jobs = [(str(path), str(path.with_suffix(extension))) for path in inputs]
+    if workers == 1 or len(jobs) <= 1:
+        return [run_job(process, path_input, path_output) for path_input, path_output in jobs]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        futures = [executor.submit(run_job, process, path_input, path_output) for path_input, path_output in jobs]
+
+        return [future.result() for future in futures]
+
+
+def format_summary(results: list[BatchResult]) -> str:
+    """
+    Формирование сводки пакетной обработки.
+
+    :param list[BatchResult] results: Результаты обработки.
+    :return: Текст сводки: время и результат обработки каждого файла и итоговые значения.
+    """
+
+    lines = []
+    for result in results:
+        if result.error is None:
+            status = "КЭШ   " if result.cached else "OK    "
+            lines.append(f"{result.elapsed:>8.2f} с  {status}  {result.path_input} -> {result.path_output}")
+        else:
+            lines.append(f"{result.elapsed:>8.2f} с  ОШИБКА  {result.path_input}: {result.error}")
+
+    failed = sum(result.error is not None for result in results)
+    total = sum(result.elapsed for result in results)
+    lines.append(
+        f"Обработано файлов: {len(results)}, успешно: {len(results) - failed}, с ошибками: {failed}, "
+        f"из кэша: {sum(result.cached for result in results)}, суммарное время обработки: {total:.2f} с."
+    )
+
+    return "\n".join(lines)
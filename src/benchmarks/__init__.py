@@ -0,0 +1,20 @@
+"""
+Нагрузочные тесты (бенчмарки) этапов обработки списка источников.
+
+Запуск всех бенчмарков:
+
+.. code-block:: console
+
+    python -m benchmarks
+
+Запуск отдельного бенчмарка:
+
+.. code-block:: console
+
+    python -m benchmarks.readers
+"""
+
+import logging
+
+# выключение логирования для замеров производительности
+logging.disable()
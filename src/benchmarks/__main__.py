@@ -0,0 +1,29 @@
+"""
+Запуск всех бенчмарков.
+"""
+from importlib import import_module
+
+# зарегистрированные бенчмарки
+BENCHMARKS = [
+    "benchmarks.readers",
+    "benchmarks.input_formats",
+    "benchmarks.snapshot",
+    "benchmarks.row_plan",
+    "benchmarks.models",
+    "benchmarks.records",
+    "benchmarks.dedup",
+    "benchmarks.formatters",
+    "benchmarks.collation",
+    "benchmarks.incremental",
+    "benchmarks.logging_overhead",
+    "benchmarks.renderers",
+    "benchmarks.render_latency",
+    "benchmarks.styles",
+    "benchmarks.output_formats",
+]
+
+
+if __name__ == "__main__":
+    for name in BENCHMARKS:
+        print(f"=== {name}")
+        import_module(name).main()
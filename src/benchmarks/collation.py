@@ -0,0 +1,50 @@
+"""
+Бенчмарк сортировки: сортировка по кодам символов против сортировки по заранее построенным ключам сопоставления.
+"""
+import random
+
+from benchmarks.utils import timer
+from formatters.collation import APA_COLLATOR, GOST_COLLATOR
+
+# количество сортируемых строк
+COUNT = 1_000_000
+
+# фамилии авторов для генерации строк
+AUTHORS = ("Иванов И.М.", "Петров С.Н.", "Ёлкин А.А.", "Smith J.", "Brown A.", "Émile B.", "Кожина М.Н.")
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    rng = random.Random(0)
+    items = [
+        f"{rng.choice(AUTHORS)} Наука как искусство {rng.randrange(COUNT)}. – СПб.: Просвещение, 2020. – 999 с."
+        for _ in range(COUNT)
+    ]
+
+    with timer() as elapsed_raw:
+        sorted(items)
+    print(f"{'sorted() по кодам символов':>36}: {elapsed_raw[0]:.2f} с")
+
+    for name, collator in (("ГОСТ", GOST_COLLATOR), ("APA", APA_COLLATOR)):
+        with timer() as elapsed_keys:
+            keys = list(map(collator.key, items))
+        with timer() as elapsed_sort:
+            order = sorted(range(COUNT), key=keys.__getitem__)
+        del keys, order
+
+        total = elapsed_keys[0] + elapsed_sort[0]
+        print(
+            f"{'sorted() по ключам ' + name:>36}: {total:.2f} с (ключи {elapsed_keys[0]:.2f} с, "
+            f"сортировка {elapsed_sort[0]:.2f} с, {total / elapsed_raw[0]:.1f}x)"
+        )
+
+        with timer() as elapsed_key_sort:
+            sorted(items, key=collator.key)
+        print(f"{'sorted(key=...) ' + name:>36}: {elapsed_key_sort[0]:.2f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Бенчмарк объединения повторяющихся источников: время обработки в зависимости от количества источников
+(линейная зависимость – постоянная скорость) с поиском похожих источников и без него.
+
+Среди источников 30 % – повторы ранее добавленных источников с другим регистром авторов, 5 % – с опечаткой
+(пропущенной буквой) в названии.
+"""
+import random
+import time
+from dataclasses import replace
+
+from dedup import DedupIndex
+from formatters.records import BookRecord
+
+# количество источников
+COUNTS = (100_000, 200_000, 400_000)
+# слова названий источников
+WORDS = (
+    "наука",
+    "искусство",
+    "физика",
+    "химия",
+    "история",
+    "методы",
+    "анализ",
+    "теория",
+    "практика",
+    "основы",
+    "введение",
+    "системы",
+)
+
+
+def make_records(count: int) -> list[BookRecord]:
+    """
+    Создание записей книг с повторами.
+
+    :param count: Количество записей.
+    :return: Записи книг.
+    """
+
+    rng = random.Random(0)
+    records: list[BookRecord] = []
+    for _ in range(count):
+        chance = rng.random()
+        if records and chance < 0.35:
+            record = rng.choice(records)
+            if chance < 0.3:
+                records.append(replace(record, authors=record.authors.upper()))
+            else:
+                # пропуск буквы названия
+                position = rng.randrange(len(record.title))
+                records.append(replace(record, title=record.title[:position] + record.title[position + 1 :]))
+            continue
+
+        title = " ".join(rng.choice(WORDS) for _ in range(4)).capitalize()
+        author = f"Автор{rng.randrange(10 ** 6)} И.И."
+        records.append(BookRecord(author, title, None, "М.", "Наука", rng.randrange(1990, 2020), 100))
+
+    return records
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    print(f"{'источников':>11} {'похожие':>8} {'время, с':>9} {'источников/с':>13} {'объединено':>11}")
+    for count in COUNTS:
+        # источники с наименованием листа и номером строки (см. `readers.base.Located`)
+        records = [("Книга", row, record) for row, record in enumerate(make_records(count), 2)]
+        for near in (False, True):
+            index = DedupIndex(near=near)
+            started = time.perf_counter()
+            for _ in index.filter(records):
+                pass
+            elapsed = time.perf_counter() - started
+            print(f"{count:>11} {str(near):>8} {elapsed:>9.2f} {count / elapsed:>13.0f} {len(index.duplicates):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Бенчмарк форматирования: количество отформатированных записей в секунду для каждого стиля и типа источника.
+"""
+import timeit
+
+from benchmarks.utils import SAMPLE_ROWS
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTCitationFormatter
+from readers.reader import SourcesReader
+
+# количество форматируемых записей для каждого стиля и типа источника
+COUNT = 50_000
+
+# форматтеры стилей цитирования
+FORMATTERS = (GOSTCitationFormatter, APACitationFormatter)
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    print(f"{'стиль':>22} {'тип источника':>24} {'записей/с':>10}")
+    for reader_class in SourcesReader.readers:
+        reader = reader_class()  # type: ignore
+        models = reader.build([0], [reader.convert(SAMPLE_ROWS[reader.sheet])]) * COUNT
+
+        for formatter in FORMATTERS:
+            style = formatter.formatters_map[reader.model]
+            elapsed = min(timeit.repeat(lambda: [style(model) for model in models], number=1, repeat=3))
+            print(f"{style.__name__:>22} {reader.model.__name__:>24} {COUNT / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Бенчмарк инкрементального форматирования: полное форматирование и повторное форматирование после изменения строк.
+"""
+import dataclasses
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.utils import SAMPLE_ROWS
+from formatters.records import to_record
+from formatters.styles.gost import GOSTCitationFormatter
+from incremental import format_incremental
+from readers.reader import SourcesReader
+
+# количество различных источников каждого типа
+COUNT = 4_000
+
+# количество измененных источников при повторном форматировании
+CHANGES = (1, 10, 100, 1_000)
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    records = []
+    for reader_class in SourcesReader.readers:
+        reader = reader_class()  # type: ignore
+        model = reader.build([0], [reader.convert(SAMPLE_ROWS[reader.sheet])])[0]
+        name = next(iter(model.__fields__))
+        records.extend(
+            to_record(model.copy(update={name: f"{getattr(model, name)} {number}"})) for number in range(COUNT)
+        )
+
+    started = time.perf_counter()
+    GOSTCitationFormatter(records).format()
+    print(f"полное форматирование {len(records)} источников: {time.perf_counter() - started:.3f} с")
+
+    print(f"{'изменено':>10} {'инкрементально, с':>18}")
+    for changes in CHANGES:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "output.docx"
+            format_incremental(GOSTCitationFormatter, records, path)
+
+            changed = list(records)
+            for index in range(0, len(changed), len(changed) // changes)[:changes]:
+                name = dataclasses.fields(changed[index])[0].name
+                changed[index] = dataclasses.replace(changed[index], **{name: f"Изменено {index}"})
+
+            started = time.perf_counter()
+            format_incremental(GOSTCitationFormatter, changed, path)
+            print(f"{changes:>10} {time.perf_counter() - started:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
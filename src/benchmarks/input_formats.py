@@ -0,0 +1,62 @@
+"""
+Бенчмарк чтения входных данных в разных форматах: рабочая книга Excel (openpyxl), CSV, JSON Lines
+и колоночный двоичный формат.
+
+Все форматы содержат одни и те же строки и читаются в одни и те же компактные записи.
+"""
+import tempfile
+from pathlib import Path
+
+from benchmarks.utils import make_workbook, timer
+from readers.reader import SourcesReader, write_sources
+
+# количество строк на каждом листе рабочей книги
+ROWS = 20_000
+# форматы входных данных (наименование и имя файла в директории бенчмарка)
+FORMATS = (
+    ("xlsx", "input.xlsx"),
+    ("csv", "csv"),
+    ("jsonl", "input.jsonl"),
+    ("bibcol", "input.bibcol"),
+)
+
+
+def measure(path: str) -> tuple[int, float]:
+    """
+    Чтение всех компактных записей входных данных.
+
+    :param path: Путь к входным данным.
+    :return: Количество записей и время чтения в секундах.
+    """
+
+    with timer() as elapsed:
+        with SourcesReader(path, compact=True) as reader:
+            count = sum(1 for _ in reader.iterate())
+
+    return count, elapsed[0]
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        workbook = str(make_workbook(Path(directory) / "input.xlsx", ROWS))
+        with SourcesReader(workbook, compact=True) as reader:
+            records = reader.read()
+        for _, name in FORMATS[1:]:
+            write_sources(str(Path(directory) / name), records)
+
+        print(f"{'формат':>8} {'записей':>9} {'записей/с':>11} {'размер, МБ':>11} {'ускорение':>10}")
+        baseline = 0.0
+        for fmt, name in FORMATS:
+            path = Path(directory) / name
+            size = sum(item.stat().st_size for item in path.iterdir()) if path.is_dir() else path.stat().st_size
+            count, elapsed = measure(str(path))
+            baseline = baseline or elapsed
+            print(f"{fmt:>8} {count:>9} {count / elapsed:>11.0f} {size / 2 ** 20:>11.1f} {baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
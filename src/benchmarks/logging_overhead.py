@@ -0,0 +1,84 @@
+"""
+Бенчмарк влияния логирования на скорость форматирования: записи о каждом источнике с синхронной записью
+в файл и консоль, прореженные отладочные записи через очередь фонового потока и логирование по умолчанию.
+"""
+import logging
+import os
+import tempfile
+import timeit
+from typing import Callable
+
+from benchmarks.utils import SAMPLE_ROWS
+from formatters.records import to_record
+from formatters.styles.gost import GOSTCitationFormatter
+from readers.reader import SourcesReader
+from settings import LOGGING_FORMAT
+
+# количество источников каждого типа
+COUNT = 20_000
+
+# логгер записей о каждом источнике
+STYLE_LOGGER = "formatters.styles.gost"
+
+
+def measure(records: list, configure: Callable[[logging.Logger], None]) -> float:
+    """
+    Измерение количества отформатированных источников в секунду.
+
+    :param records: Записи источников
+    :param configure: Настройка логгера записей о каждом источнике
+    :return: Количество источников в секунду
+    """
+
+    logger = logging.getLogger(STYLE_LOGGER)
+    handlers, level = list(logger.handlers), logger.level
+    configure(logger)
+    # логирование выключено для остальных бенчмарков (см. `benchmarks`)
+    logging.disable(logging.NOTSET)
+    try:
+        elapsed = min(timeit.repeat(lambda: GOSTCitationFormatter(records), number=1, repeat=3))
+    finally:
+        for handler in logger.handlers:
+            if handler not in handlers:
+                handler.close()
+        logger.handlers, logger.level = handlers, level
+        logging.disable()
+
+    return len(records) / elapsed
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    records = []
+    for reader_class in SourcesReader.readers:
+        reader = reader_class()  # type: ignore
+        records.extend([to_record(reader.build([0], [reader.convert(SAMPLE_ROWS[reader.sheet])])[0])] * COUNT)
+
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w", encoding="utf-8") as devnull:
+
+        def synchronous(logger: logging.Logger) -> None:
+            # прежняя настройка: записи о каждом источнике с синхронной записью в файл и консоль
+            logger.handlers = [logging.FileHandler(f"{directory}/{STYLE_LOGGER}.log"), logging.StreamHandler(devnull)]
+            for handler in logger.handlers:
+                handler.setFormatter(logging.Formatter(LOGGING_FORMAT))
+            logger.setLevel(logging.DEBUG)
+
+        def sampled(logger: logging.Logger) -> None:
+            # записи о каждом источнике через очередь с прореживанием (`LOGGING_SAMPLE_RATE`)
+            logger.setLevel(logging.DEBUG)
+
+        modes = (
+            ("синхронно, каждый источник", synchronous),
+            ("очередь, отладка с прореживанием", sampled),
+            ("по умолчанию", lambda logger: None),
+        )
+        print(f"{'логирование':>34} {'источников/с':>14}")
+        for name, configure in modes:
+            print(f"{name:>34} {measure(records, configure):>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Бенчмарк сборки моделей: построчная валидация pydantic против пакетной сборки с проверкой по столбцам.
+"""
+import gc
+
+from benchmarks.utils import SAMPLE_ROWS, timer
+from readers.reader import SourcesReader
+
+# количество строк на листе
+ROW_COUNTS = (10_000, 100_000, 1_000_000)
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    print(f"{'строк':>10} {'читатель':>26} {'построчно, строк/с':>19} {'пакетно, строк/с':>17} {'ускорение':>10}")
+    for rows in ROW_COUNTS:
+        for reader_class in SourcesReader.readers:
+            reader = reader_class()  # type: ignore
+            sample = reader.convert(SAMPLE_ROWS[reader.sheet])
+            numbers = list(range(2, rows + 2))
+            payloads = [sample] * rows
+
+            with timer() as elapsed_rows:
+                models = [reader.model(**dict(zip(reader.fields, payload))) for payload in payloads]
+            expected = models[0]
+            del models
+            gc.collect()
+
+            with timer() as elapsed_batch:
+                models = reader.build(numbers, payloads)
+            assert models[0] == expected
+            del models
+            gc.collect()
+
+            print(
+                f"{rows:>10} {reader_class.__name__:>26} {rows / elapsed_rows[0]:>19.0f} "
+                f"{rows / elapsed_batch[0]:>17.0f} {elapsed_rows[0] / elapsed_batch[0]:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Бенчмарк форматов выходного файла: количество записанных источников в секунду для каждого рендерера.
+"""
+import tempfile
+from pathlib import Path
+
+from benchmarks.utils import SAMPLE_ROWS, timer
+from formatters.styles.gost import GOSTCitationFormatter
+from readers.reader import SourcesReader
+from renderer import GOSTRenderer
+from text_renderer import BibTeXRenderer, CSLJSONRenderer, HTMLRenderer, MarkdownRenderer, PlainTextRenderer
+
+# количество источников (время построения документа python-docx растет быстрее линейного)
+COUNT = 10_000
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    models = []
+    for reader_class in SourcesReader.readers:
+        reader = reader_class()  # type: ignore
+        models.extend(reader.build([0], [reader.convert(SAMPLE_ROWS[reader.sheet])]) * (COUNT // 5))
+    entries = list(GOSTCitationFormatter.stream(models, entries=True))
+    rows = [row for row, _ in entries]
+
+    renderers = {
+        "docx (python-docx)": lambda: GOSTRenderer(rows),
+        "docx (потоковый)": lambda: GOSTRenderer(rows, streaming=True),
+        "txt": lambda: PlainTextRenderer(rows, title=GOSTRenderer.title, numbered=True),
+        "html": lambda: HTMLRenderer(rows, title=GOSTRenderer.title, numbered=True),
+        "md": lambda: MarkdownRenderer(rows, title=GOSTRenderer.title, numbered=True),
+        "bibtex": lambda: BibTeXRenderer(entries),
+        "csl-json": lambda: CSLJSONRenderer(entries),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "output"
+        print(f"{'формат':>20} {'источников/с':>13}")
+        for name, create in renderers.items():
+            with timer() as elapsed:
+                create().render(path)
+            print(f"{name:>20} {len(rows) / elapsed[0]:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
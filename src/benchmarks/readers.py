@@ -0,0 +1,92 @@
+"""
+Бенчмарк чтения рабочей книги: полная загрузка против потокового чтения, последовательное чтение листов
+против параллельного.
+
+Каждый замер выполняется в отдельном процессе, чтобы пиковый объем памяти (RSS) не зависел от предыдущих замеров.
+"""
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from benchmarks.utils import make_workbook, timer
+from metrics import get_peak_rss
+
+# количество строк на каждом листе рабочей книги
+ROW_COUNTS = (1_000, 10_000, 50_000)
+# количество строк на каждом листе рабочей книги для замера параллельного чтения
+PARALLEL_ROWS = 20_000
+# количество процессов для параллельного чтения
+WORKERS = (1, 2, 5)
+
+
+def measure(path: str, read_only: bool) -> tuple[int, float, int]:
+    """
+    Чтение всех моделей рабочей книги.
+
+    :param path: Путь к рабочей книге.
+    :param read_only: Потоковое чтение рабочей книги.
+    :return: Количество моделей, время чтения в секундах и пиковый объем памяти в байтах.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from readers.reader import SourcesReader
+
+    with timer() as elapsed:
+        with SourcesReader(path, read_only=read_only) as reader:
+            if read_only:
+                # модели обрабатываются по одной и не накапливаются в памяти
+                count = sum(1 for _ in reader.iterate())
+            else:
+                count = len(reader.read())
+
+    return count, elapsed[0], get_peak_rss()
+
+
+def measure_parallel(path: str, workers: int) -> tuple[int, float]:
+    """
+    Чтение всех моделей рабочей книги в пуле процессов.
+
+    :param path: Путь к рабочей книге.
+    :param workers: Количество процессов.
+    :return: Количество моделей и время чтения в секундах.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from readers.reader import SourcesReader
+
+    with timer() as elapsed:
+        with SourcesReader(path) as reader:
+            count = len(reader.read(workers))
+
+    return count, elapsed[0]
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'строк на лист':>14} {'режим':>10} {'моделей':>9} {'строк/с':>10} {'RSS, МБ':>9}")
+        for rows in ROW_COUNTS:
+            path = str(make_workbook(Path(directory) / f"input_{rows}.xlsx", rows))
+            for read_only in (False, True):
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    count, elapsed, rss = executor.submit(measure, path, read_only).result()
+                mode = "потоковый" if read_only else "полный"
+                print(f"{rows:>14} {mode:>10} {count:>9} {count / elapsed:>10.0f} {rss / 2 ** 20:>9.1f}")
+
+        path = str(make_workbook(Path(directory) / "input_parallel.xlsx", PARALLEL_ROWS))
+        print(f"\n{'процессов':>14} {'моделей':>9} {'время, с':>10} {'ускорение':>10}")
+        baseline = 0.0
+        for workers in WORKERS:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                count, elapsed = executor.submit(measure_parallel, path, workers).result()
+            baseline = baseline or elapsed
+            print(f"{workers:>14} {count:>9} {elapsed:>10.2f} {baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
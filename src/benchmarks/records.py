@@ -0,0 +1,56 @@
+"""
+Бенчмарк памяти: модели pydantic против компактных записей.
+
+Значения атрибутов общие для всех объектов, поэтому замер показывает накладные расходы на хранение одного объекта.
+"""
+import gc
+import tracemalloc
+from typing import Callable
+
+from benchmarks.utils import SAMPLE_ROWS
+from formatters.records import RECORDS
+from readers.reader import SourcesReader
+
+# количество создаваемых объектов каждого типа
+COUNT = 100_000
+
+
+def measure(factory: Callable[[], object]) -> float:
+    """
+    Замер объема памяти, занимаемой одним объектом.
+
+    :param factory: Функция создания объекта.
+    :return: Объем памяти в байтах на объект.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    items = [factory() for _ in range(COUNT)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+
+    # размер списка, хранящего объекты, не учитывается
+    return (size - COUNT * 8) / COUNT
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    print(f"{'тип источника':>24} {'модель, Б':>10} {'запись, Б':>10} {'экономия':>9}")
+    for reader_class in SourcesReader.readers:
+        reader = reader_class()  # type: ignore
+        values = dict(zip(reader.fields, reader.convert(SAMPLE_ROWS[reader.sheet])))
+        record = RECORDS[reader.model]
+
+        model_size = measure(lambda: reader.model(**values))  # pylint: disable=cell-var-from-loop
+        record_size = measure(lambda: record(**values))  # pylint: disable=cell-var-from-loop
+        print(
+            f"{reader.model.__name__:>24} {model_size:>10.0f} {record_size:>10.0f} {model_size / record_size:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
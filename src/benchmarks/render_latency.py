@@ -0,0 +1,47 @@
+"""
+Бенчмарк задержки генерации небольших Word-файлов: оформление документа для каждого вызова против кэша
+оформленных документов.
+"""
+import tempfile
+import timeit
+from pathlib import Path
+
+from renderer import APARenderer, GOSTRenderer
+
+# количество абзацев в задаче
+COUNTS = (1, 10, 100)
+# количество повторений для каждого замера
+NUMBER = 20
+
+# строка-образец списка источников
+SAMPLE = "Иванов И.М., Петров С.Н. Наука как искусство. – 3-е изд. – СПб.: Просвещение, 2020. – 999 с."
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "output.docx"
+        print(f"{'рендерер':>14} {'запись':>10} {'абзацев':>8} {'без кэша':>10} {'с кэшем':>10}")
+        for renderer in (GOSTRenderer, APARenderer):
+            for streaming in (False, True):
+                for count in COUNTS:
+                    rows = [SAMPLE] * count
+
+                    def render(cached: bool) -> None:
+                        if not cached:
+                            renderer.clear_cache()
+                        renderer(rows, streaming=streaming).render(path)
+
+                    results = [min(timeit.repeat(lambda: render(cached), number=NUMBER, repeat=3)) / NUMBER
+                               for cached in (False, True)]
+                    print(
+                        f"{renderer.__name__:>14} {'потоковая' if streaming else 'docx':>10} {count:>8} "
+                        f"{results[0] * 1000:>7.1f} мс {results[1] * 1000:>7.1f} мс"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Бенчмарк генерации Word-файла: построение документа python-docx против потоковой записи содержимого документа.
+"""
+import tempfile
+from pathlib import Path
+
+from benchmarks.utils import timer
+from metrics import get_peak_rss
+from renderer import APARenderer, GOSTRenderer
+
+# количество абзацев для каждого замера (время построения документа python-docx растет быстрее линейного)
+COUNTS = (1_000, 10_000)
+
+# строка-образец списка источников
+SAMPLE = "Иванов И.М., Петров С.Н. Наука как искусство. – 3-е изд. – СПб.: Просвещение, 2020. – 999 с."
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "output.docx"
+        print(f"{'рендерер':>14} {'абзацев':>8} {'python-docx':>12} {'потоковый':>10} {'ускорение':>10}")
+        for renderer in (GOSTRenderer, APARenderer):
+            for count in COUNTS:
+                rows = [f"{SAMPLE} {number}" for number in range(count)]
+                results = []
+                for streaming in (False, True):
+                    with timer() as elapsed:
+                        renderer(rows, streaming=streaming).render(path)
+                    results.append(elapsed[0])
+                print(
+                    f"{renderer.__name__:>14} {count:>8} {results[0]:>10.2f} с {results[1]:>8.2f} с "
+                    f"{results[0] / results[1]:>9.1f}x"
+                )
+
+        # объем памяти потоковой записи не зависит от количества строк: строки передаются генератором
+        before = get_peak_rss()
+        GOSTRenderer((f"{SAMPLE} {number}" for number in range(1_000_000)), streaming=True).render(path)
+        print(f"Прирост пикового объема памяти при потоковой записи 1000000 абзацев: "
+              f"{(get_peak_rss() - before) / 2**20:.1f} МБ")
+
+
+if __name__ == "__main__":
+    main()
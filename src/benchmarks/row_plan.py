@@ -0,0 +1,64 @@
+"""
+Микро-бенчмарк извлечения атрибутов из строки: исходный цикл против скомпилированного плана чтения.
+"""
+import timeit
+from datetime import date
+from typing import Any
+
+from benchmarks.utils import SAMPLE_ROWS
+from readers.base import BaseReader
+from readers.reader import SourcesReader
+
+# количество обрабатываемых строк для каждого читателя
+ROWS = 100_000
+
+
+def convert_legacy(reader: BaseReader, row: tuple) -> dict[str, Any]:
+    """
+    Извлечение атрибутов из строки исходным циклом (до введения плана чтения).
+
+    :param reader: Читатель листа рабочей книги.
+    :param row: Кортеж значений ячеек строки.
+    :return: Атрибуты модели.
+    """
+
+    attrs = {}
+    for attr, params in reader.attributes.items():
+        index, data_type = list(params.items())[0]
+        attrs[attr] = row[index] if index < len(row) else None
+
+        if not attrs[attr]:
+            continue
+
+        if data_type is int:
+            attrs[attr] = int(str(attrs.get(attr)))
+
+        if data_type is str:
+            attrs[attr] = str(attrs.get(attr)).strip()
+
+        if data_type is date:
+            value = attrs.get(attr)
+            if isinstance(value, date):
+                attrs[attr] = value.strftime("%d.%m.%Y")
+
+    return attrs
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    print(f"{'читатель':>26} {'цикл, строк/с':>14} {'план, строк/с':>14} {'ускорение':>10}")
+    for reader_class in SourcesReader.readers:
+        reader = reader_class(None)  # type: ignore
+        rows = [SAMPLE_ROWS[reader.sheet]] * ROWS
+        assert convert_legacy(reader, rows[0]) == dict(zip(reader.fields, reader.convert(rows[0])))
+
+        legacy = min(timeit.repeat(lambda: [convert_legacy(reader, row) for row in rows], number=1, repeat=3))
+        compiled = min(timeit.repeat(lambda: [reader.convert(row) for row in rows], number=1, repeat=3))
+        print(f"{reader_class.__name__:>26} {ROWS / legacy:>14.0f} {ROWS / compiled:>14.0f} {legacy / compiled:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
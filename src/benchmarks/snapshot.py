@@ -0,0 +1,56 @@
+"""
+Бенчмарк чтения рабочей книги: разбор рабочей книги против загрузки снимка прочитанных строк.
+"""
+import tempfile
+from pathlib import Path
+
+from benchmarks.utils import make_workbook, timer
+from readers.reader import SourcesReader
+from readers.snapshot import get_snapshot_path
+
+# количество строк на каждом листе рабочей книги
+ROW_COUNTS = (1_000, 20_000)
+
+
+def measure(path: str, snapshot: bool) -> tuple[int, float]:
+    """
+    Чтение всех компактных записей рабочей книги.
+
+    :param path: Путь к рабочей книге.
+    :param snapshot: Использование снимка прочитанных строк.
+    :return: Количество записей и время чтения в секундах.
+    """
+
+    with timer() as elapsed:
+        with SourcesReader(path, compact=True, snapshot=snapshot) as reader:
+            count = len(reader.read())
+
+    return count, elapsed[0]
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'строк на лист':>14} {'режим':>22} {'записей':>9} {'время, с':>9} {'ускорение':>10}")
+        for rows in ROW_COUNTS:
+            path = str(make_workbook(Path(directory) / f"input_{rows}.xlsx", rows))
+            modes = (
+                ("рабочая книга", False),
+                ("сохранение снимка", True),
+                ("загрузка снимка", True),
+            )
+            baseline = 0.0
+            for mode, snapshot in modes:
+                count, elapsed = measure(path, snapshot)
+                baseline = baseline or elapsed
+                print(f"{rows:>14} {mode:>22} {count:>9} {elapsed:>9.3f} {baseline / elapsed:>9.1f}x")
+
+            size = get_snapshot_path(path).stat().st_size
+            print(f"{'':>14} {'размер снимка, МБ':>22} {size / 2 ** 20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Бенчмарк генерации выходных файлов двух стилей цитирования: два отдельных запуска (чтение входного файла
+для каждого стиля) против одного запуска с несколькими стилями.
+"""
+import tempfile
+from pathlib import Path
+
+from benchmarks.utils import make_workbook, timer
+from main import generate
+
+# количество строк на каждом листе рабочей книги
+ROWS = 4_000
+# стили цитирования
+CITATIONS = ("GOST", "APA")
+# форматы выходного файла
+FORMATS = ("DOCX", "TXT")
+
+
+def main() -> None:
+    """
+    Запуск бенчмарка.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(make_workbook(Path(directory) / "input.xlsx", ROWS))
+        print(f"{'формат':>8} {'отдельные запуски, с':>21} {'один запуск, с':>15} {'ускорение':>10}")
+        for output_format in FORMATS:
+            path_output = str(Path(directory) / f"output.{output_format.lower()}")
+            with timer() as separate:
+                for citation in CITATIONS:
+                    generate(path, path_output, citation, output_format)
+            with timer() as combined:
+                generate(path, path_output, CITATIONS, output_format)
+
+            speedup = separate[0] / combined[0]
+            print(f"{output_format:>8} {separate[0]:>21.2f} {combined[0]:>15.2f} {speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Вспомогательные функции для бенчмарков.
+"""
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+from openpyxl import Workbook
+
+# строки-образцы для заполнения листов рабочей книги
+SAMPLE_ROWS = {
+    "Книга": (
+        "Иванов И.М., Петров С.Н.",
+        "Наука как искусство",
+        "3-е",
+        "СПб.",
+        "Просвещение",
+        2020,
+        999,
+    ),
+    "Интернет-ресурс": (
+        "Наука как искусство",
+        "Ведомости",
+        "https://www.vedomosti.ru",
+        datetime(2021, 1, 1),
+    ),
+    "Статья из сборника": (
+        "Иванов И.М., Петров С.Н.",
+        "Наука как искусство",
+        "Сборник научных трудов",
+        "СПб.",
+        "АСТ",
+        2020,
+        "25-30",
+    ),
+    "Диссертация": (
+        "Иванов И.М.",
+        "Наука как искусство",
+        "д-р. / канд.",
+        "экон.",
+        "01.01.01",
+        "СПб.",
+        2020,
+        199,
+    ),
+    " Закон, нормативный акт и т.п.": (
+        "Конституция Российской Федерации",
+        "Наука как искусство",
+        datetime(2000, 1, 1),
+        "1234-56",
+        "Парламентская газета",
+        2020,
+        5,
+        15,
+        datetime(2002, 9, 11),
+    ),
+}
+
+
+def make_workbook(path: Path, rows: int) -> Path:
+    """
+    Генерация рабочей книги с заданным количеством строк на каждом листе.
+
+    Строки различаются суффиксом в первом столбце, чтобы исключить совпадение записей.
+
+    :param path: Путь для сохранения рабочей книги.
+    :param rows: Количество строк на каждом листе.
+    :return: Путь к сохраненной рабочей книге.
+    """
+
+    workbook = Workbook(write_only=True)
+    for sheet, sample in SAMPLE_ROWS.items():
+        worksheet = workbook.create_sheet(sheet)
+        worksheet.append([f"Столбец {index}" for index in range(len(sample))])
+        for number in range(rows):
+            worksheet.append((f"{sample[0]} {number}",) + sample[1:])
+
+    workbook.save(path)
+
+    return path
+
+
+@contextmanager
+def timer() -> Iterator[list[float]]:
+    """
+    Замер времени выполнения блока кода.
+
+    .. code-block::
+
+        with timer() as elapsed:
+            ...
+        print(elapsed[0])
+
+    :return: Список, в который по завершении блока записывается время выполнения в секундах.
+    """
+
+    elapsed: list[float] = []
+    started = time.perf_counter()
+    try:
+        yield elapsed
+    finally:
+        elapsed.append(time.perf_counter() - started)
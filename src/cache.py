@@ -0,0 +1,210 @@
+"""
+Кэш выходных файлов с адресацией по содержимому.
+
+Ключ кэша – хэш SHA-256 содержимого входного файла, параметров генерации (стиль цитирования, формат,
+количество источников), версий правил форматирования (`STYLE_VERSION`) и генерации выходных файлов
+(`RENDERER_VERSION`). Записи хранятся файлами в директории кэша, время изменения файла обновляется при каждом
+попадании и определяет порядок вытеснения давно не использованных записей при превышении размера кэша.
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from logger import get_logger
+from metrics import CacheStats
+from renderer import RENDERER_VERSION
+from settings import CACHE_MAX_SIZE, CACHE_PATH
+
+logger = get_logger(__name__)
+
+# размер блока для чтения входного файла при вычислении хэша
+HASH_CHUNK_SIZE = 2**20
+# расширение файлов записей кэша
+ENTRY_SUFFIX = ".cache"
+
+
+class ResultCache:
+    """
+    Кэш выходных файлов на локальном диске с вытеснением давно не использованных записей.
+    """
+
+    def __init__(self, path: Union[Path, str, None] = None, max_size: Optional[int] = None) -> None:
+        """
+        Конструктор.
+
+        :param Union[Path, str, None] path: Путь к директории кэша (по умолчанию – `CACHE_PATH`).
+        :param Optional[int] max_size: Ограничение размера кэша в байтах (по умолчанию – `CACHE_MAX_SIZE`).
+        """
+
+        self.path = Path(CACHE_PATH if path is None else path)
+        self.max_size = CACHE_MAX_SIZE if max_size is None else max_size
+        self.stats = CacheStats()
+
+    @staticmethod
+    def get_key(source: Union[Path, str, bytes], *parameters: Any) -> str:
+        """
+        Получение ключа кэша.
+
+        :param Union[Path, str, bytes] source: Путь к входному файлу (директории с файлами CSV)
+            или содержимое входных данных.
+        :param parameters: Параметры генерации, влияющие на выходной файл.
+        :return: Ключ кэша (шестнадцатеричная запись хэша).
+        """
+
+        # модуль стилей импортирует pydantic, поэтому не загружается при запуске приложения
+        from formatters.styles.base import STYLE_VERSION  # pylint: disable=C0415
+
+        digest = hashlib.sha256()
+        if isinstance(source, bytes):
+            digest.update(source)
+        else:
+            is_dir = Path(source).is_dir()
+            # для директории учитываются имена и содержимое файлов в порядке имен
+            paths = sorted(path for path in Path(source).iterdir() if path.is_file()) if is_dir else [Path(source)]
+            for path in paths:
+                if is_dir:
+                    digest.update(path.name.encode("utf-8") + b"\0")
+                with open(path, "rb") as file:
+                    while chunk := file.read(HASH_CHUNK_SIZE):
+                        digest.update(chunk)
+
+        # параметры отделяются нулевыми байтами, чтобы исключить совпадение разных наборов параметров
+        versions = (STYLE_VERSION, RENDERER_VERSION)
+        digest.update(b"\0".join(str(value).encode("utf-8") for value in (*versions, *parameters)))
+
+        return digest.hexdigest()
+
+    def get_entry_path(self, key: str) -> Path:
+        """
+        Получение пути к файлу записи кэша.
+
+        :param str key: Ключ кэша.
+        :return: Путь к файлу записи.
+        """
+
+        return self.path / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, key: str, path_output: Union[Path, str]) -> bool:
+        """
+        Копирование выходного файла из кэша.
+
+        :param str key: Ключ кэша.
+        :param Union[Path, str] path_output: Путь для сохранения выходного файла.
+        :return: Признак попадания в кэш.
+        """
+
+        entry = self.get_entry_path(key)
+        try:
+            shutil.copyfile(entry, path_output)
+            # обновление времени изменения определяет порядок вытеснения
+            os.utime(entry)
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return False
+
+        self.stats.hits += 1
+
+        return True
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """
+        Получение содержимого выходного файла из кэша.
+
+        :param str key: Ключ кэша.
+        :return: Содержимое выходного файла или `None` при промахе.
+        """
+
+        entry = self.get_entry_path(key)
+        try:
+            content = entry.read_bytes()
+            os.utime(entry)
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+
+        return content
+
+    def put(self, key: str, path_output: Union[Path, str]) -> None:
+        """
+        Сохранение выходного файла в кэш.
+
+        Файл записи сначала копируется во временный файл и затем переименовывается, поэтому другие процессы
+        не могут прочитать частично записанную запись. При ошибке записи временный файл удаляется.
+
+        :param str key: Ключ кэша.
+        :param Union[Path, str] path_output: Путь к выходному файлу.
+        """
+
+        if os.path.getsize(path_output) > self.max_size:
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        file = tempfile.NamedTemporaryFile(dir=self.path, suffix=".tmp", delete=False)
+        try:
+            with file, open(path_output, "rb") as output:
+                shutil.copyfileobj(output, file)
+            os.replace(file.name, self.get_entry_path(key))
+        except BaseException:
+            # временный файл удаляется, если запись или переименование не выполнены (в том числе при прерывании)
+            os.unlink(file.name)
+            raise
+
+        self.evict()
+
+    def put_bytes(self, key: str, content: bytes) -> None:
+        """
+        Сохранение содержимого выходного файла в кэш.
+
+        :param str key: Ключ кэша.
+        :param bytes content: Содержимое выходного файла.
+        """
+
+        if len(content) > self.max_size:
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        file = tempfile.NamedTemporaryFile(dir=self.path, suffix=".tmp", delete=False)
+        try:
+            with file:
+                file.write(content)
+            os.replace(file.name, self.get_entry_path(key))
+        except BaseException:
+            os.unlink(file.name)
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Удаление давно не использованных записей при превышении размера кэша.
+        """
+
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(ENTRY_SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        if size <= self.max_size:
+            return
+
+        entries.sort()
+        evicted = 0
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # запись уже удалена другим процессом
+                pass
+            size -= entry_size
+            evicted += 1
+
+        logger.info("Из кэша результатов удалено записей: %s.", evicted)
@@ -0,0 +1,313 @@
+"""
+Объединение повторяющихся источников перед форматированием.
+
+Ключ источника – нормализованные значения ключевых атрибутов типа источника (`KEY_FIELDS`): регистр, буква «ё»,
+пробелы и знаки препинания не учитываются. Точные повторы ключа находятся по хэш-индексу.
+
+Похожими считаются источники с опечатками в названии (`TITLE_FIELDS`): остальные ключевые атрибуты должны
+совпадать после нормализации, а коэффициент Жаккара символьных n-грамм названий – быть не меньше
+`DEDUP_THRESHOLD`, числа в названиях (номера томов, частей) также должны совпадать. Различные книги одних авторов
+и издательства (например, «Сборник задач по физике» и «Сборник задач по алгебре») поэтому не объединяются.
+Похожие названия находятся по индексу MinHash LSH: для n-грамм названия вычисляется подпись MinHash (одна
+перестановка с разбиением значений хэшей на интервалы – one permutation hashing), источники с совпадающей
+полосой подписи и остальными ключевыми атрибутами сравниваются по коэффициенту Жаккара.
+
+Каждый источник обрабатывается за постоянное число операций (в индексе полосы хранится первый источник),
+поэтому время обработки линейно зависит от количества источников. Сохраняется первый из повторяющихся
+источников, объединенные источники перечисляются в отчете.
+"""
+import json
+import os
+import re
+import tempfile
+import zlib
+from dataclasses import asdict, dataclass
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from formatters.models import (
+    ArticlesCollectionModel,
+    BookModel,
+    DissertationModel,
+    InternetResourceModel,
+    NormativeActModel,
+)
+from formatters.records import Source, get_model_type
+from readers.base import Located
+from logger import get_logger
+from settings import DEDUP_THRESHOLD
+
+logger = get_logger(__name__)
+
+# ключевые атрибуты типов источников: различие остальных атрибутов (например, даты обращения к интернет-ресурсу)
+# не мешает объединению источников
+KEY_FIELDS = {
+    BookModel: ("authors", "title", "edition", "city", "publishing_house", "year"),
+    InternetResourceModel: ("article", "website", "link"),
+    ArticlesCollectionModel: ("authors", "article_title", "collection_title", "year", "pages"),
+    DissertationModel: ("author", "title", "author_degree", "science_branch", "year"),
+    NormativeActModel: ("type", "title", "acceptance_date", "number"),
+}
+# атрибуты названий, в которых допускаются опечатки при поиске похожих источников
+TITLE_FIELDS = {
+    BookModel: "title",
+    InternetResourceModel: "article",
+    ArticlesCollectionModel: "article_title",
+    DissertationModel: "title",
+    NormativeActModel: "title",
+}
+
+# длина символьных n-грамм названия
+SHINGLE_SIZE = 3
+# количество полос подписи MinHash и количество значений в полосе: похожие названия с коэффициентом
+# Жаккара 0.8 попадают в общую полосу с вероятностью 1 - (1 - 0.8 ** 3) ** 4 ≈ 0.93, 0.9 – 0.99
+BANDS = 4
+ROWS_PER_BAND = 3
+# количество значений подписи MinHash (интервалов значений хэшей n-грамм)
+SIGNATURE_SIZE = BANDS * ROWS_PER_BAND
+# суффикс файла отчета, добавляемый к пути выходного файла
+REPORT_SUFFIX = ".duplicates.json"
+
+# символы, не являющиеся буквами и цифрами
+SEPARATORS = re.compile(r"[\W_]+")
+# числа названия
+NUMBERS = re.compile(r"\d+")
+
+
+@dataclass(frozen=True)
+class Duplicate:
+    """
+    Объединенный источник.
+    """
+
+    # наименование модели источника
+    model: str
+    # расположение объединенного и сохраненного источников во входных данных: наименование листа и номер строки
+    # (см. `readers.base.Located`)
+    sheet: str
+    row: int
+    kept_sheet: str
+    kept_row: int
+    # коэффициент Жаккара n-грамм названий (1 – совпадение нормализованных ключей)
+    similarity: float
+    # нормализованный ключ объединенного источника
+    key: str
+
+
+def normalize(values: Iterable[Any]) -> str:
+    """
+    Нормализация значений ключевых атрибутов.
+
+    :param values: Значения атрибутов.
+    :return: Значения в нижнем регистре, разделенные одним пробелом, без знаков препинания.
+    """
+
+    text = " ".join(str(value) for value in values if value is not None)
+
+    return SEPARATORS.sub(" ", text.casefold().replace("ё", "е")).strip()
+
+
+def get_shingles(key: str) -> set[str]:
+    """
+    Получение символьных n-грамм названия.
+
+    :param key: Нормализованное название.
+    :return: Множество n-грамм.
+    """
+
+    if len(key) <= SHINGLE_SIZE:
+        return {key}
+
+    return {key[index : index + SHINGLE_SIZE] for index in range(len(key) - SHINGLE_SIZE + 1)}
+
+
+def get_similarity(first: set[str], second: set[str]) -> float:
+    """
+    Вычисление коэффициента Жаккара множеств n-грамм.
+
+    :param first: Первое множество.
+    :param second: Второе множество.
+    :return: Отношение размера пересечения к размеру объединения.
+    """
+
+    intersection = len(first & second)
+
+    return intersection / (len(first) + len(second) - intersection)
+
+
+class DedupIndex:
+    """
+    Индекс для поиска повторяющихся источников.
+    """
+
+    def __init__(self, near: bool = True, threshold: float = DEDUP_THRESHOLD) -> None:
+        """
+        Конструктор.
+
+        :param near: Поиск похожих (с опечатками в названии) источников, а не только совпадающих после нормализации.
+        :param threshold: Минимальный коэффициент Жаккара n-грамм названий похожих источников.
+        """
+
+        self.near = near
+        self.threshold = threshold
+        self.duplicates: list[Duplicate] = []
+        # ключ (модель, название и остальные атрибуты) – номер сохраненного источника
+        self.exact: dict[tuple[str, str, str], int] = {}
+        # полоса подписи названия (с моделью, остальными атрибутами ключа и числами названия) – номер первого
+        # сохраненного источника с такой полосой
+        self.bands: dict[tuple, int] = {}
+        # модель, нормализованные название и остальные атрибуты ключа, наименование листа и номер строки
+        # сохраненных источников
+        self.kept: dict[int, tuple[str, str, str, str, int]] = {}
+        self.getters: dict[type, tuple[str, Callable[[Any], Any], Callable[[Any], tuple]]] = {}
+        self.count = 0
+
+    def get_key(self, item: Source) -> tuple[str, str, str]:
+        """
+        Получение наименования модели, нормализованного названия и остальных атрибутов ключа источника.
+
+        :param item: Модель или запись источника.
+        :return: Наименование модели, название и остальные атрибуты ключа.
+        """
+
+        getter = self.getters.get(type(item))
+        if getter is None:
+            model = get_model_type(item)
+            fields = [field for field in KEY_FIELDS[model] if field != TITLE_FIELDS[model]]
+            getter = self.getters[type(item)] = (
+                model.__name__,
+                attrgetter(TITLE_FIELDS[model]),
+                attrgetter(*fields),
+            )
+
+        name, title, values = getter
+
+        return name, normalize((title(item),)), normalize(values(item))
+
+    def find_similar(self, name: str, title: str, rest: str) -> tuple[Optional[int], float, list[tuple]]:
+        """
+        Поиск источника с похожим названием и совпадающими остальными атрибутами ключа по полосам подписи MinHash.
+
+        :param name: Наименование модели.
+        :param title: Нормализованное название.
+        :param rest: Нормализованные остальные атрибуты ключа.
+        :return: Номер похожего источника (или `None`), коэффициент Жаккара названий и полосы подписи.
+        """
+
+        shingles = get_shingles(title)
+        # значение подписи – минимальный хэш n-граммы в интервале (остатке от деления на размер подписи):
+        # при построении словаря из хэшей по убыванию для каждого интервала остается последний, то есть минимальный,
+        # хэш, поэтому подпись вычисляется одной сортировкой без цикла Python по n-граммам.
+        # Встроенная функция `hash()` для строк зависит от процесса (PYTHONHASHSEED), поэтому используется CRC-32:
+        # объединяемые источники не меняются от запуска к запуску
+        hashes = sorted(map(zlib.crc32, map(str.encode, shingles)), reverse=True)
+        bins = dict(zip(map(SIGNATURE_SIZE.__rmod__, hashes), hashes))
+        signature = tuple(map(bins.get, range(SIGNATURE_SIZE)))
+        # остальные атрибуты ключа и числа названия входят в полосу: источники, которые не могут быть
+        # объединены, не занимают полосы друг друга
+        numbers = NUMBERS.findall(title)
+        prefix = (name, rest, *numbers)
+        bands = [
+            (prefix, band, *signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]) for band in range(BANDS)
+        ]
+
+        for band in bands:
+            candidate = self.bands.get(band)
+            if candidate is None:
+                continue
+
+            candidate_name, candidate_title, candidate_rest, _, _ = self.kept[candidate]
+            if (candidate_name, candidate_rest) != (name, rest) or NUMBERS.findall(candidate_title) != numbers:
+                continue
+
+            similarity = get_similarity(shingles, get_shingles(candidate_title))
+            if similarity >= self.threshold:
+                return candidate, similarity, bands
+
+        return None, 0.0, bands
+
+    def add(self, item: Source, sheet: str = "", row: int = 0) -> bool:
+        """
+        Добавление источника в индекс.
+
+        :param item: Модель или запись источника.
+        :param sheet: Наименование листа рабочей книги.
+        :param row: Номер строки источника.
+        :return: Признак сохранения источника (`False` для повтора ранее добавленного источника).
+        """
+
+        name, title, rest = self.get_key(item)
+        index = self.count
+        self.count += 1
+
+        exact_key = (name, title, rest)
+        kept = self.exact.get(exact_key)
+        similarity = 1.0
+        bands: list[tuple] = []
+        if kept is None and self.near:
+            kept, similarity, bands = self.find_similar(name, title, rest)
+
+        if kept is not None:
+            _, _, _, kept_sheet, kept_row = self.kept[kept]
+            key = f"{title} {rest}".strip()
+            self.duplicates.append(Duplicate(name, sheet, row, kept_sheet, kept_row, round(similarity, 3), key))
+            return False
+
+        self.exact[exact_key] = index
+        for band in bands:
+            self.bands.setdefault(band, index)
+        self.kept[index] = (name, title, rest, sheet, row)
+
+        return True
+
+    def filter(self, items: Iterable[Located]) -> Iterator[Source]:
+        """
+        Исключение повторяющихся источников.
+
+        :param items: Источники с наименованием листа и номером строки (см. `SourcesReader(located=True)`).
+        :return: Генератор источников без повторов в исходном порядке.
+        """
+
+        add = self.add
+        for sheet, row, item in items:
+            if add(item, sheet, row):
+                yield item
+
+    def __str__(self) -> str:
+        exact = sum(duplicate.similarity == 1.0 for duplicate in self.duplicates)
+        return (
+            f"источников – {self.count}, объединено – {len(self.duplicates)} "
+            f"(совпадающих – {exact}, похожих – {len(self.duplicates) - exact})"
+        )
+
+
+def get_report_path(path_output: Union[Path, str]) -> Path:
+    """
+    Получение пути к отчету об объединенных источниках.
+
+    :param Union[Path, str] path_output: Путь к выходному файлу.
+    :return: Путь к файлу отчета.
+    """
+
+    return Path(f"{path_output}{REPORT_SUFFIX}")
+
+
+def save_report(path: Path, duplicates: list[Duplicate]) -> None:
+    """
+    Сохранение отчета об объединенных источниках.
+
+    :param Path path: Путь к файлу отчета.
+    :param list[Duplicate] duplicates: Объединенные источники.
+    """
+
+    report = [asdict(duplicate) for duplicate in duplicates]
+    file = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False)
+    try:
+        with file:
+            file.write(json.dumps(report, ensure_ascii=False, indent=1))
+        os.replace(file.name, path)
+    except BaseException:
+        # временный файл удаляется, если запись или переименование не выполнены
+        os.unlink(file.name)
+        raise
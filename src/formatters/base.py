@@ -1,14 +1,24 @@
 """
 Базовые функции форматирования списка источников
 """
-from typing import Dict
-from formatters.styles.base import BaseCitationStyle
-from logger import get_logger
+import heapq
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+from formatters.collation import Collator
+from formatters.records import Source, get_model_type
+from formatters.sorting import external_sort
+from formatters.styles.base import BaseCitationStyle, SortKey
+from logger import get_logger, log_progress
+from metrics import measure_stage
 from pydantic import BaseModel
+from settings import SORT_MEMORY_LIMIT
 
 
 logger = get_logger(__name__)
 
+# отформатированная строка вместе с источником (для форматов вывода, использующих атрибуты источников)
+Entry = tuple[str, Source]
+
 
 class BaseCitationFormatter:
     """
@@ -17,24 +27,145 @@ class BaseCitationFormatter:
 
     formatters_map: Dict[BaseModel, BaseCitationStyle]
 
-    def __init__(self, models: list[BaseModel]) -> None:
+    # правила сортировки отформатированных строк (по умолчанию – по кодам символов)
+    collator: Optional[Collator] = None
+
+    def __init__(self, models: list[Source], lazy: bool = False) -> None:
         """
         Конструктор.
 
-        :param models: Список моделей для итогового форматирования
+        :param models: Список моделей (или компактных записей) для итогового форматирования
+        :param lazy: Отложенное форматирование: строки формируются только для выводимых источников
         """
 
+        self.lazy = lazy
         self.formatted_items = []
-        for model in models:
-            self.formatted_items.append(self.formatters_map.get(type(model))(model))  # type: ignore
+        with measure_stage("форматирование источников") as stage:
+            if not lazy:
+                models = log_progress(logger, models, "Отформатировано источников: %s.")  # type: ignore
+            for model in models:
+                self.formatted_items.append(self.formatters_map.get(get_model_type(model))(model, lazy))  # type: ignore
+            stage.entries = len(self.formatted_items)
 
-    def format(self) -> list[BaseCitationStyle]:
+    def format(self, limit: Optional[int] = None) -> list[BaseCitationStyle]:
         """
         Форматирование списка источников.
 
+        :param limit: Количество первых источников отсортированного списка (по умолчанию – все источники)
         :return:
         """
 
         logger.info("Общее форматирование ...")
 
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
+        key = self.get_lazy_key if self.lazy else self.get_item_key
+
+        with measure_stage("сортировка") as stage:
+            stage.entries = len(self.formatted_items)
+            if limit is not None:
+                return heapq.nsmallest(limit, self.formatted_items, key=key)
+
+            return sorted(self.formatted_items, key=key)
+
+    @classmethod
+    def get_sort_key(cls, text: str) -> Any:
+        """
+        Получение ключа сортировки отформатированной строки.
+
+        :param text: Отформатированная строка
+        :return: Ключ сортировки
+        """
+
+        return cls.collator.key(text) if cls.collator else text
+
+    def get_item_key(self, item: BaseCitationStyle) -> Any:
+        """
+        Получение ключа сортировки источника.
+
+        :param item: Объект стиля цитирования
+        :return: Ключ сортировки
+        """
+
+        return self.get_sort_key(item.formatted)
+
+    @classmethod
+    def get_entry_key(cls, entry: Entry) -> Any:
+        """
+        Получение ключа сортировки отформатированной строки вместе с источником.
+
+        :param entry: Отформатированная строка и источник
+        :return: Ключ сортировки
+        """
+
+        return cls.get_sort_key(entry[0])
+
+    def get_lazy_key(self, item: BaseCitationStyle) -> SortKey:
+        """
+        Получение ключа сортировки источника без форматирования строки.
+
+        Строка форматируется, только если префиксов ключей недостаточно для сравнения источников.
+
+        :param item: Объект стиля цитирования
+        :return: Ключ сортировки
+        """
+
+        prefix = item.sort_prefix
+
+        return SortKey(self.collator.primary(prefix) if self.collator else prefix, item, self.get_sort_key)
+
+    def format_external(
+        self, memory_limit: int = SORT_MEMORY_LIMIT, entries: bool = False
+    ) -> Iterator[Union[str, Entry]]:
+        """
+        Форматирование списка источников с внешней сортировкой слиянием.
+
+        Отформатированные строки сортируются в памяти в пределах `memory_limit`, при превышении ограничения
+        отсортированные участки сохраняются во временные файлы и объединяются слиянием при выдаче строк.
+        Объекты стилей освобождаются по мере получения строк.
+
+        :param memory_limit: Ограничение объема памяти (в байтах) для сортировки строк
+        :param entries: Выдача отформатированных строк вместе с источниками
+        :return: Генератор отсортированных отформатированных строк (или пар строк и источников)
+        """
+
+        logger.info("Общее форматирование (внешняя сортировка) ...")
+
+        items, self.formatted_items = self.formatted_items, []
+
+        def release() -> Iterator[Union[str, Entry]]:
+            for index, item in enumerate(items):
+                items[index] = None
+                yield (item.formatted, item.data) if entries else item.formatted
+
+        key = self.get_entry_key if entries else self.get_sort_key
+
+        return external_sort(release(), key=key, memory_limit=memory_limit)
+
+    @classmethod
+    def stream(
+        cls, models: Iterable[Source], memory_limit: int = SORT_MEMORY_LIMIT, entries: bool = False
+    ) -> Iterator[Union[str, Entry]]:
+        """
+        Потоковое форматирование списка источников.
+
+        Источники форматируются по мере чтения, а отформатированные строки сортируются внешней сортировкой,
+        поэтому объем памяти для хранения строк ограничен `memory_limit`.
+
+        :param models: Модели (или компактные записи) для итогового форматирования
+        :param memory_limit: Ограничение объема памяти (в байтах) для сортировки строк
+        :param entries: Выдача отформатированных строк вместе с источниками
+        :return: Генератор отсортированных отформатированных строк (или пар строк и источников)
+        """
+
+        logger.info("Потоковое форматирование ...")
+
+        models = log_progress(logger, models, "Отформатировано источников: %s.")
+        formatters_map = cls.formatters_map
+        if entries:
+            formatted: Iterator[Any] = (
+                (formatters_map[get_model_type(model)](model).formatted, model) for model in models  # type: ignore
+            )
+            return external_sort(formatted, key=cls.get_entry_key, memory_limit=memory_limit)
+
+        formatted = (formatters_map[get_model_type(model)](model).formatted for model in models)  # type: ignore
+
+        return external_sort(formatted, key=cls.get_sort_key, memory_limit=memory_limit)
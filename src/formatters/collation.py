@@ -0,0 +1,119 @@
+"""
+Правила сортировки (сопоставления) строк списка источников.
+
+Ключ сортировки строится один раз для каждой строки и представляет собой последовательность байтов:
+ранги символов без учета регистра, нулевой байт-разделитель и исходная строка в UTF-8 для различения строк,
+совпадающих без учета регистра. Сравнение таких ключей выполняется встроенным сравнением байтов.
+"""
+import codecs
+import itertools
+import unicodedata
+from typing import Any
+
+# алфавиты для определения порядка букв
+CYRILLIC = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+LATIN = "abcdefghijklmnopqrstuvwxyz"
+
+# знаки препинания, часто встречающиеся в списках источников, помимо символов ASCII
+PUNCTUATION = "–—№«»“”„‘’…"
+
+# номера для уникальных имен обработчиков ошибок кодирования
+_handler_numbers = itertools.count()
+
+
+class Collator:
+    """
+    Построение ключей сортировки строк по заданному порядку алфавитов.
+
+    Ранги начинаются с 1 (0 – разделитель ключа): сначала идут пробел, знаки препинания и цифры в порядке ASCII,
+    затем прочие знаки препинания и символы, затем буквы алфавитов в заданном порядке. Строчные и заглавные буквы
+    имеют один ранг, буквы с диакритическими знаками получают ранг базовой буквы.
+
+    Ранги строятся кодированием строки в нижнем регистре таблицей символов (`codecs.charmap_encode`), поэтому
+    символы таблицы обрабатываются без циклов на уровне Python. Символы вне таблицы обрабатываются
+    обработчиком ошибок кодирования.
+    """
+
+    def __init__(self, *alphabets: str) -> None:
+        """
+        Конструктор.
+
+        :param alphabets: Алфавиты (строчные буквы) в порядке сортировки.
+        """
+
+        # позиция символа в таблице соответствует его рангу
+        chars = ["\0"]
+        chars.extend(chr(code) for code in range(0x20, 0x7F) if not chr(code).isalpha())
+        chars.extend(PUNCTUATION)
+        self.other = len(chars)
+        chars.append("")
+        for alphabet in alphabets:
+            chars.extend(alphabet)
+
+        if len(chars) > 0x100:
+            raise ValueError("Количество рангов символов превышает размер байта.")
+
+        # свободные позиции таблицы заполняются символами из области для частного использования
+        chars.extend(chr(0xE001 + index) for index in range(0x100 - len(chars)))
+
+        self.ranks: dict[str, int] = {char: rank for rank, char in enumerate(chars)}
+        self.encoding_map = codecs.charmap_build("".join(chars))
+        self.errors = f"collation_{next(_handler_numbers)}"
+        codecs.register_error(self.errors, self.handle)
+
+    def get_rank(self, char: str) -> int:
+        """
+        Получение ранга символа вне таблицы символов.
+
+        :param char: Символ.
+        :return: Ранг символа.
+        """
+
+        base = unicodedata.normalize("NFKD", char)[:1].lower()
+        rank = self.ranks.get(base, self.other) if base != char else self.other
+
+        # ранг сохраняется, поэтому символ разбирается только при первой встрече
+        self.ranks[char] = rank
+
+        return rank
+
+    def handle(self, error: Any) -> tuple[bytes, int]:
+        """
+        Обработчик ошибок кодирования для символов вне таблицы символов.
+
+        :param error: Ошибка кодирования.
+        :return: Ранги символов и позиция продолжения кодирования.
+        """
+
+        ranks = self.ranks
+        chars = error.object[error.start : error.end]
+
+        return bytes(ranks.get(char) or self.get_rank(char) for char in chars), error.end
+
+    def primary(self, text: str) -> bytes:
+        """
+        Получение рангов символов строки без учета регистра.
+
+        Ранги строятся посимвольно, поэтому ранги начала строки являются началом рангов всей строки.
+
+        :param text: Строка.
+        :return: Ранги символов.
+        """
+
+        return codecs.charmap_encode(text.lower(), self.errors, self.encoding_map)[0]
+
+    def key(self, text: str) -> bytes:
+        """
+        Получение ключа сортировки строки.
+
+        :param text: Строка.
+        :return: Ключ сортировки.
+        """
+
+        return codecs.charmap_encode(text.lower(), self.errors, self.encoding_map)[0] + b"\0" + text.encode("utf-8")
+
+
+# ГОСТ: сначала источники на русском языке, затем на иностранных языках
+GOST_COLLATOR = Collator(CYRILLIC, LATIN)
+# APA: алфавитный порядок по автору (или заглавию при отсутствии автора), латиница перед кириллицей
+APA_COLLATOR = Collator(LATIN, CYRILLIC)
@@ -0,0 +1,170 @@
+"""
+Компактные неизменяемые записи для типов источников.
+
+Записи хранят те же атрибуты, что и модели из `formatters.models`, но без `__dict__`, множества заполненных
+атрибутов и механизма валидации pydantic. Используются при чтении и форматировании больших списков источников.
+"""
+from dataclasses import astuple, dataclass, fields
+from typing import Any, ClassVar, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from formatters.models import (
+    ArticlesCollectionModel,
+    BookModel,
+    DissertationModel,
+    InternetResourceModel,
+    NormativeActModel,
+)
+
+
+class BaseRecord:
+    """
+    Базовый класс компактной записи.
+    """
+
+    __slots__ = ()
+
+    # модель, соответствующая записи
+    model: ClassVar[Type[BaseModel]]
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "BaseRecord":
+        """
+        Создание записи из модели.
+
+        :param model: Модель объекта (строки).
+        :return: Запись.
+        """
+
+        return cls(*(getattr(model, field.name) for field in fields(cls)))  # type: ignore
+
+    def to_model(self) -> BaseModel:
+        """
+        Создание модели из записи с валидацией значений.
+
+        :return: Модель объекта (строки).
+        """
+
+        return self.model(**dict(zip((field.name for field in fields(self)), astuple(self))))  # type: ignore
+
+    def __reduce__(self) -> tuple:
+        # явная сериализация для передачи записей между процессами без `__dict__`
+        return type(self), astuple(self)  # type: ignore
+
+
+@dataclass(frozen=True, slots=True)
+class BookRecord(BaseRecord):
+    """
+    Запись книги (см. `BookModel`).
+    """
+
+    authors: str
+    title: str
+    edition: Optional[str]
+    city: str
+    publishing_house: str
+    year: int
+    pages: int
+
+    model: ClassVar[Type[BaseModel]] = BookModel
+
+
+@dataclass(frozen=True, slots=True)
+class InternetResourceRecord(BaseRecord):
+    """
+    Запись интернет-ресурса (см. `InternetResourceModel`).
+    """
+
+    article: str
+    website: str
+    link: str
+    access_date: str
+
+    model: ClassVar[Type[BaseModel]] = InternetResourceModel
+
+
+@dataclass(frozen=True, slots=True)
+class ArticlesCollectionRecord(BaseRecord):
+    """
+    Запись сборника статей (см. `ArticlesCollectionModel`).
+    """
+
+    authors: str
+    article_title: str
+    collection_title: str
+    city: str
+    publishing_house: str
+    year: int
+    pages: str
+
+    model: ClassVar[Type[BaseModel]] = ArticlesCollectionModel
+
+
+@dataclass(frozen=True, slots=True)
+class DissertationRecord(BaseRecord):
+    """
+    Запись научной диссертации (см. `DissertationModel`).
+    """
+
+    author: str
+    title: str
+    author_degree: str
+    science_branch: str
+    branch_code: str
+    city: str
+    year: int
+    page_count: int
+
+    model: ClassVar[Type[BaseModel]] = DissertationModel
+
+
+@dataclass(frozen=True, slots=True)
+class NormativeActRecord(BaseRecord):
+    """
+    Запись нормативно-правового акта (см. `NormativeActModel`).
+    """
+
+    type: str
+    title: str
+    acceptance_date: str
+    number: str
+    publication_source: str
+    publication_year: int
+    source_number: int
+    article_number: int
+    edition_date: Optional[str]
+
+    model: ClassVar[Type[BaseModel]] = NormativeActModel
+
+
+# записи, соответствующие моделям
+RECORDS: dict[Type[BaseModel], Type[BaseRecord]] = {
+    record.model: record
+    for record in (BookRecord, InternetResourceRecord, ArticlesCollectionRecord, DissertationRecord, NormativeActRecord)
+}
+
+# модель или запись типа источника
+Source = Union[BaseModel, BaseRecord]
+
+
+def get_model_type(item: Any) -> Type[BaseModel]:
+    """
+    Получение модели, соответствующей модели или записи.
+
+    :param item: Модель или запись.
+    :return: Модель объекта (строки).
+    """
+
+    return item.model if isinstance(item, BaseRecord) else type(item)
+
+
+def to_record(model: BaseModel) -> BaseRecord:
+    """
+    Преобразование модели в запись.
+
+    :param model: Модель объекта (строки).
+    :return: Запись.
+    """
+
+    return RECORDS[type(model)].from_model(model)
@@ -0,0 +1,209 @@
+"""
+Внешняя сортировка слиянием для списков источников, не помещающихся в памяти.
+"""
+import heapq
+import pickle
+import tempfile
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from pathlib import Path
+from sys import getsizeof
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional
+
+from logger import get_logger
+from metrics import measure_stage
+from settings import SORT_MEMORY_LIMIT
+
+logger = get_logger(__name__)
+
+# количество элементов, сериализуемых в файл отсортированного участка за одну операцию
+CHUNK_SIZE = 1000
+# размер ссылки на элемент в списке
+POINTER_SIZE = 8
+# интервал выборки элементов буфера, для которых вычисляется размер (остальные оцениваются по среднему)
+SIZE_SAMPLE_INTERVAL = 16
+# типы объектов без ссылок на другие объекты
+ATOMIC_TYPES = (str, bytes, int, float, type(None))
+# служебные атрибуты `__slots__` (словарь атрибутов учитывается отдельно)
+SPECIAL_SLOTS = ("__dict__", "__weakref__")
+# типы коллекций, элементы которых учитываются в объеме памяти
+CONTAINER_TYPES = (tuple, list, set, frozenset)
+
+
+def write_run(directory: Path, number: int, items: list) -> Path:
+    """
+    Сохранение отсортированного участка во временный файл.
+
+    :param directory: Директория для временных файлов.
+    :param number: Номер участка.
+    :param items: Отсортированные элементы.
+    :return: Путь к файлу участка.
+    """
+
+    path = directory / f"run_{number}.pickle"
+    with path.open("wb") as file:
+        for start in range(0, len(items), CHUNK_SIZE):
+            pickle.dump(items[start : start + CHUNK_SIZE], file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return path
+
+
+def read_run(file: BinaryIO) -> Iterator:
+    """
+    Потоковое чтение отсортированного участка из временного файла.
+
+    :param file: Файл участка, открытый для чтения.
+    :return: Генератор элементов участка.
+    """
+
+    while True:
+        try:
+            yield from pickle.load(file)
+        except EOFError:
+            return
+
+
+@lru_cache(maxsize=None)
+def get_layout(cls: type) -> tuple[Optional[Callable[[Any], tuple]], bool]:
+    """
+    Получение функции чтения атрибутов, объявленных в `__slots__` класса и его предков,
+    и признака наличия у объектов класса словаря атрибутов.
+
+    :param cls: Класс.
+    :return: Функция, возвращающая кортеж значений атрибутов (`None`, если атрибутов нет),
+        и признак наличия `__dict__`.
+    """
+
+    names: list[str] = []
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        names.extend(name for name in ((slots,) if isinstance(slots, str) else slots) if name not in SPECIAL_SLOTS)
+
+    has_dict = cls.__dictoffset__ != 0
+    if not names:
+        return None, has_dict
+
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        # `attrgetter` с одним атрибутом возвращает значение, а не кортеж значений
+        return lambda obj: (getter(obj),), has_dict
+
+    return getter, has_dict
+
+
+def get_size(value: Any) -> int:
+    """
+    Оценка объема памяти, занимаемого объектом вместе с объектами, на которые он ссылается.
+
+    Элементы кортежей, списков, множеств и словарей учитываются рекурсивно, значения атрибутов объектов
+    (`__slots__` записей и `__dict__` моделей) – без вложенных объектов: поля источников хранят строки,
+    числа и даты.
+
+    :param value: Объект без циклических ссылок.
+    :return: Объем памяти в байтах.
+    """
+
+    size = getsizeof(value)
+    if isinstance(value, ATOMIC_TYPES):
+        return size
+    if isinstance(value, CONTAINER_TYPES):
+        return size + sum(map(get_size, value))
+    if isinstance(value, dict):
+        return size + sum(map(get_size, value.keys())) + sum(map(get_size, value.values()))
+
+    getter, has_dict = get_layout(type(value))
+    if getter is not None:
+        size += sum(map(getsizeof, getter(value)))
+    if has_dict:
+        size += get_size(vars(value))
+
+    return size
+
+
+def fill_buffer(iterator: Iterator, memory_limit: int, key: Optional[Callable[[Any], Any]] = None) -> tuple[list, bool]:
+    """
+    Накопление элементов в буфере до достижения ограничения объема памяти.
+
+    Объем памяти буфера оценивается по среднему размеру выборки элементов (см. `SIZE_SAMPLE_INTERVAL`).
+
+    При указании функции ключа в буфер добавляются пары ключа и элемента: ключ вычисляется один раз
+    и используется как для сортировки буфера, так и для слияния участков.
+
+    :param iterator: Итератор элементов.
+    :param memory_limit: Ограничение объема памяти буфера в байтах.
+    :param key: Функция получения ключа сортировки.
+    :return: Элементы буфера и признак заполнения буфера (`False`, если элементы закончились раньше).
+    """
+
+    buffer: list = []
+    size = 0
+    sampled = 0
+    for index, item in enumerate(iterator):
+        if key is not None:
+            item = (key(item), item)
+        buffer.append(item)
+        # рекурсивный обход объектов дорог, поэтому размер вычисляется для каждого `SIZE_SAMPLE_INTERVAL`-го
+        # элемента (вместе с ключом, вложенными объектами и ссылкой в списке), объем буфера оценивается по среднему
+        if index % SIZE_SAMPLE_INTERVAL == 0:
+            size += get_size(item) + POINTER_SIZE
+            sampled += 1
+        if size * len(buffer) >= memory_limit * sampled:
+            return buffer, True
+
+    return buffer, False
+
+
+def external_sort(
+    items: Iterable,
+    key: Optional[Callable[[Any], Any]] = None,
+    memory_limit: int = SORT_MEMORY_LIMIT,
+) -> Iterator:
+    """
+    Сортировка элементов с ограничением объема памяти, занимаемого элементами.
+
+    Элементы накапливаются в буфере, отсортированные буферы сохраняются во временные файлы и затем
+    объединяются k-путевым слиянием. Если все элементы помещаются в буфер, временные файлы не создаются.
+    Сортировка устойчива, как и `sorted()`.
+
+    :param items: Элементы для сортировки (должны поддерживать сериализацию `pickle`).
+    :param key: Функция получения ключа сортировки.
+    :param memory_limit: Ограничение объема памяти буфера в байтах (учитывается размер элементов вместе
+        с объектами, на которые они ссылаются, и ключей сортировки).
+    :return: Генератор отсортированных элементов.
+    """
+
+    iterator = iter(items)
+    # при указании функции ключа элементы буфера – пары ключа и элемента
+    sort_key = None if key is None else itemgetter(0)
+    # замеряются накопление и сортировка буферов до выдачи первого элемента, слияние участков выполняется
+    # по мере получения элементов и учитывается в этапе получателя
+    with measure_stage("сортировка") as stage:
+        buffer, full = fill_buffer(iterator, memory_limit, key)
+        buffer.sort(key=sort_key)
+        stage.entries = len(buffer)
+    if not full:
+        yield from buffer if key is None else map(itemgetter(1), buffer)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="sort_") as name:
+        directory = Path(name)
+        paths = []
+        with measure_stage("сортировка") as stage:
+            while buffer:
+                paths.append(write_run(directory, len(paths), buffer))
+                buffer, _ = fill_buffer(iterator, memory_limit, key)
+                buffer.sort(key=sort_key)
+                stage.entries += len(buffer)
+
+        logger.info("Слияние %s отсортированных участков ...", len(paths))
+        files = [path.open("rb") for path in paths]
+        try:
+            # при равенстве ключей `heapq.merge` сохраняет порядок участков, поэтому слияние устойчиво
+            runs = [read_run(file) for file in files]
+            if key is not None:
+                yield from map(itemgetter(1), heapq.merge(*runs, key=itemgetter(0)))
+            else:
+                yield from heapq.merge(*runs)
+        finally:
+            for file in files:
+                file.close()
@@ -1,8 +1,8 @@
-from string import Template
 from typing import Dict
 from pydantic import BaseModel
 from formatters.base import BaseCitationFormatter
-from formatters.styles.base import BaseCitationStyle
+from formatters.collation import APA_COLLATOR
+from formatters.styles.base import BaseCitationStyle, CompiledTemplate
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel, DissertationModel, \
     NormativeActModel
 from logger import get_logger
@@ -18,15 +18,13 @@ class APABook(BaseCitationStyle):
 
     data: BookModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors ($year). $title $edition. $publishing_house."
-        )
+    template = CompiledTemplate(
+        "$authors ($year). $title $edition. $publishing_house."
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование книги "%s" ...', self.data.title)
+        logger.debug('Форматирование книги "%s" ...', self.data.title)
 
         return self.template.substitute(
             authors=self.data.authors,
@@ -55,15 +53,13 @@ class APAInternetResource(BaseCitationStyle):
 
     data: InternetResourceModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$article. (n.d.). $website. Retrieved $access_date, from $link"
-        )
+    template = CompiledTemplate(
+        "$article. (n.d.). $website. Retrieved $access_date, from $link"
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование интернет-ресурса "%s" ...', self.data.article)
+        logger.debug('Форматирование интернет-ресурса "%s" ...', self.data.article)
 
         return self.template.substitute(
             article=self.data.article,
@@ -80,15 +76,13 @@ class APACollectionArticle(BaseCitationStyle):
 
     data: ArticlesCollectionModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors ($year). $article_title. $collection_title, $pages."
-        )
+    template = CompiledTemplate(
+        "$authors ($year). $article_title. $collection_title, $pages."
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование сборника статей "%s" ...', self.data.article_title)
+        logger.debug('Форматирование сборника статей "%s" ...', self.data.article_title)
 
         return self.template.substitute(
             authors=self.data.authors,
@@ -108,15 +102,13 @@ class APADissertation(BaseCitationStyle):
 
     data: DissertationModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$author ($year). $title [$author_degree, some university]."
-        )
+    template = CompiledTemplate(
+        "$author ($year). $title [$author_degree, some university]."
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование диссертации "%s" ...', self.data.title)
+        logger.debug('Форматирование диссертации "%s" ...', self.data.title)
 
         return self.template.substitute(
             author=self.data.author,
@@ -137,15 +129,13 @@ class APANormativeAct(BaseCitationStyle):
 
     data: NormativeActModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$title $publication_year ($type) s.$source_number.$article_number (Russia)."
-        )
+    template = CompiledTemplate(
+        "$title $publication_year ($type) s.$source_number.$article_number (Russia)."
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование НПА "%s" ...', self.data.title)
+        logger.debug('Форматирование НПА "%s" ...', self.data.title)
 
         return self.template.substitute(
             type=self.data.type,
@@ -182,3 +172,5 @@ class APACitationFormatter(BaseCitationFormatter):
         NormativeActModel: APANormativeAct
     }
 
+    collator = APA_COLLATOR
+
@@ -4,8 +4,102 @@
 
 from abc import ABC, abstractmethod
 from string import Template
+from typing import Any, Callable, ClassVar, Optional, Union
 
-from pydantic import BaseModel
+from formatters.records import Source
+
+# версия правил форматирования (увеличивается при изменении методов `substitute()` стилей без изменения шаблонов)
+STYLE_VERSION = "1"
+
+
+class CompiledTemplate(Template):
+    """
+    Шаблон для форматирования строки, заранее преобразованный в строку формата для `str.format_map()`.
+
+    Разбор шаблона выполняется один раз при создании объекта, а подстановка значений не использует
+    регулярные выражения, поэтому объект шаблона следует создавать один раз для класса стиля:
+
+    .. code-block::
+
+        class GOSTBook(BaseCitationStyle):
+            template = CompiledTemplate("$authors $title ...")
+    """
+
+    def __init__(self, template: str) -> None:
+        super().__init__(template)
+
+        # разбор шаблона на текст и наименования заполнителей
+        parts: list[tuple[bool, str]] = []
+        position = 0
+        for match in self.pattern.finditer(template):
+            parts.append((False, template[position : match.start()]))
+            position = match.end()
+
+            name = match.group("named") or match.group("braced")
+            if name is not None:
+                parts.append((True, name))
+            elif match.group("escaped") is not None:
+                parts.append((False, self.delimiter))
+            else:
+                raise ValueError(f"Некорректный заполнитель в шаблоне: {template!r}")
+        parts.append((False, template[position:]))
+
+        self.format_string = "".join(
+            f"{{{text}}}" if is_name else text.replace("{", "{{").replace("}", "}}") for is_name, text in parts
+        )
+
+        # начало шаблона: текст до первого заполнителя, первый заполнитель и текст до следующего заполнителя
+        names = [index for index, (is_name, _) in enumerate(parts) if is_name]
+        if names:
+            first = names[0]
+            end = names[1] if len(names) > 1 else len(parts)
+            self.head: tuple[str, Optional[str], str] = (
+                "".join(text for _, text in parts[:first]),
+                parts[first][1],
+                "".join(text for _, text in parts[first + 1 : end]),
+            )
+        else:
+            self.head = (self.format_string, None, "")
+
+    def substitute(self, mapping: Any = None, /, **kwargs: Any) -> str:  # type: ignore  # pylint: disable=W0221
+        return self.format_string.format_map(kwargs if mapping is None else {**mapping, **kwargs})
+
+
+class SortKey:
+    """
+    Ключ сортировки отформатированной строки без ее обязательного форматирования.
+
+    Ключ содержит начало ключа сортировки отформатированной строки (префикс). Если префиксы двух строк
+    различаются до конца более короткого из них, порядок строк определяется префиксами, иначе строки
+    форматируются и сравниваются по полным ключам. Порядок совпадает с порядком сортировки по полным ключам.
+    """
+
+    __slots__ = ("prefix", "item", "full_key")
+
+    def __init__(
+        self,
+        prefix: Union[str, bytes],
+        item: "BaseCitationStyle",
+        full_key: Callable[[str], Any],
+    ) -> None:
+        """
+        Конструктор.
+
+        :param prefix: Начало ключа сортировки отформатированной строки.
+        :param item: Объект стиля цитирования.
+        :param full_key: Функция получения полного ключа сортировки отформатированной строки.
+        """
+
+        self.prefix = prefix
+        self.item = item
+        self.full_key = full_key
+
+    def __lt__(self, other: "SortKey") -> bool:
+        left, right = self.prefix, other.prefix
+        if left != right and not left.startswith(right) and not right.startswith(left):  # type: ignore
+            return left < right  # type: ignore
+
+        return self.full_key(self.item.formatted) < self.full_key(other.item.formatted)
 
 
 class BaseCitationStyle(ABC):
@@ -13,19 +107,20 @@ class BaseCitationStyle(ABC):
     Абстрактный базовый класс стиля цитирования.
     """
 
-    def __init__(self, data: BaseModel) -> None:
-        self.data = data
-        self.formatted = self.substitute()
-
-    @property
-    @abstractmethod
-    def template(self) -> Template:
+    def __init__(self, data: Source, lazy: bool = False) -> None:
         """
-        Получение шаблона для форматирования строки.
+        Конструктор.
 
-        :return:
+        :param data: Модель (или компактная запись) источника.
+        :param lazy: Отложенное форматирование: строка формируется при первом обращении к `formatted`.
         """
 
+        self.data = data
+        self._formatted: Optional[str] = None if lazy else self.substitute()
+
+    # шаблон для форматирования строки (создается один раз для класса стиля)
+    template: ClassVar[CompiledTemplate]
+
     @abstractmethod
     def substitute(self) -> str:
         """
@@ -34,6 +129,40 @@ class BaseCitationStyle(ABC):
         :return:
         """
 
+    @property
+    def formatted(self) -> str:
+        """
+        Получение отформатированной строки.
+
+        :return: Отформатированная строка.
+        """
+
+        if self._formatted is None:
+            self._formatted = self.substitute()
+
+        return self._formatted
+
+    @formatted.setter
+    def formatted(self, value: str) -> None:
+        self._formatted = value
+
+    @property
+    def sort_prefix(self) -> str:
+        """
+        Получение начала отформатированной строки без ее форматирования.
+
+        Префикс строится из начала шаблона, если первый заполнитель шаблона совпадает с атрибутом источника.
+        Стили, которые подставляют в первый заполнитель преобразованное значение, должны переопределить свойство.
+
+        :return: Начало отформатированной строки.
+        """
+
+        leading, name, following = self.template.head
+        if name is None or not hasattr(self.data, name):
+            return leading
+
+        return f"{leading}{getattr(self.data, name)}{following}"
+
     def __str__(self) -> str:
         return self.formatted
 
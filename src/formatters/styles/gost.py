@@ -1,15 +1,15 @@
 """
 Стиль цитирования по ГОСТ Р 7.0.5-2008.
 """
-from string import Template
 from typing import Dict
 
 from pydantic import BaseModel
 
 from formatters.base import BaseCitationFormatter
+from formatters.collation import GOST_COLLATOR
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel, DissertationModel, \
     NormativeActModel
-from formatters.styles.base import BaseCitationStyle
+from formatters.styles.base import BaseCitationStyle, CompiledTemplate
 from logger import get_logger
 
 
@@ -23,15 +23,13 @@ class GOSTBook(BaseCitationStyle):
 
     data: BookModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors $title. – $edition$city: $publishing_house, $year. – $pages с."
-        )
+    template = CompiledTemplate(
+        "$authors $title. – $edition$city: $publishing_house, $year. – $pages с."
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование книги "%s" ...', self.data.title)
+        logger.debug('Форматирование книги "%s" ...', self.data.title)
 
         return self.template.substitute(
             authors=self.data.authors,
@@ -60,15 +58,13 @@ class GOSTInternetResource(BaseCitationStyle):
 
     data: InternetResourceModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$article // $website URL: $link (дата обращения: $access_date)."
-        )
+    template = CompiledTemplate(
+        "$article // $website URL: $link (дата обращения: $access_date)."
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование интернет-ресурса "%s" ...', self.data.article)
+        logger.debug('Форматирование интернет-ресурса "%s" ...', self.data.article)
 
         return self.template.substitute(
             article=self.data.article,
@@ -85,15 +81,13 @@ class GOSTCollectionArticle(BaseCitationStyle):
 
     data: ArticlesCollectionModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors $article_title // $collection_title. – $city: $publishing_house, $year. – С. $pages."
-        )
+    template = CompiledTemplate(
+        "$authors $article_title // $collection_title. – $city: $publishing_house, $year. – С. $pages."
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование сборника статей "%s" ...', self.data.article_title)
+        logger.debug('Форматирование сборника статей "%s" ...', self.data.article_title)
 
         return self.template.substitute(
             authors=self.data.authors,
@@ -113,16 +107,14 @@ class GOSTDissertation(BaseCitationStyle):
 
     data: DissertationModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$author $title : дис. ... $author_degree $science_branch наук: $branch_code. $city,"
-            " $year. $page_count с."
-        )
+    template = CompiledTemplate(
+        "$author $title : дис. ... $author_degree $science_branch наук: $branch_code. $city,"
+        " $year. $page_count с."
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование диссертации "%s" ...', self.data.title)
+        logger.debug('Форматирование диссертации "%s" ...', self.data.title)
 
         return self.template.substitute(
             author=self.data.author,
@@ -143,16 +135,14 @@ class GOSTNormativeAct(BaseCitationStyle):
 
     data: NormativeActModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$title : $type от $acceptance_date г. №$number // $publication_source. $publication_year. "
-            "№$source_number. Ст. $article_number. $edition_date."
-        )
+    template = CompiledTemplate(
+        "$title : $type от $acceptance_date г. №$number // $publication_source. $publication_year. "
+        "№$source_number. Ст. $article_number. $edition_date."
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование НПА "%s" ...', self.data.title)
+        logger.debug('Форматирование НПА "%s" ...', self.data.title)
 
         return self.template.substitute(
             type=self.data.type,
@@ -189,3 +179,5 @@ class GOSTCitationFormatter(BaseCitationFormatter):
         NormativeActModel: GOSTNormativeAct
     }
 
+    collator = GOST_COLLATOR
+
@@ -0,0 +1,234 @@
+"""
+Инкрементальное форматирование списка источников.
+
+После генерации рядом с выходным файлом сохраняется манифест: отсортированный список хэшей источников
+(см. `get_source_hash`) и их отформатированных строк. При повторной генерации источники с хэшами из манифеста
+не форматируются, а добавленные и измененные источники вставляются в отсортированный список из манифеста
+(двоичным поиском или слиянием при большом количестве изменений).
+"""
+import hashlib
+import heapq
+import json
+import math
+import os
+import tempfile
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from operator import attrgetter
+from typing import Any, Callable, Union
+
+from formatters.base import BaseCitationFormatter
+from formatters.records import BaseRecord, Source, get_model_type
+from formatters.styles.base import STYLE_VERSION, BaseCitationStyle
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# суффикс файла манифеста, добавляемый к пути выходного файла
+MANIFEST_SUFFIX = ".manifest.json"
+
+# начала хэшируемых данных для классов стилей (см. `get_style_prefix`)
+STYLE_PREFIXES: dict[type, bytes] = {}
+# функции получения значений атрибутов для классов моделей и записей (см. `get_values_getter`)
+VALUES_GETTERS: dict[type, Callable[[Any], tuple]] = {}
+
+
+def get_style_prefix(style: type[BaseCitationStyle]) -> bytes:
+    """
+    Получение начала хэшируемых данных для класса стиля.
+
+    :param type[BaseCitationStyle] style: Класс стиля цитирования.
+    :return: Версия правил форматирования, наименование класса и шаблон стиля.
+    """
+
+    return "\0".join(
+        (STYLE_VERSION, f"{style.__module__}.{style.__qualname__}", style.template.format_string, "")
+    ).encode("utf-8")
+
+
+def get_values_getter(data_type: type) -> Callable[[Any], tuple]:
+    """
+    Получение функции получения значений атрибутов для класса модели или записи.
+
+    Атрибуты записей совпадают с атрибутами моделей, поэтому значения получаются по полям модели.
+
+    :param type data_type: Класс модели или записи.
+    :return: Функция, возвращающая кортеж значений атрибутов источника.
+    """
+
+    model = data_type.model if issubclass(data_type, BaseRecord) else data_type  # type: ignore
+
+    return attrgetter(*model.__fields__)
+
+
+def get_source_hash(item: BaseCitationStyle) -> bytes:
+    """
+    Получение хэша источника для стиля цитирования.
+
+    Хэш зависит от класса и шаблона стиля, версии правил форматирования и значений атрибутов источника,
+    поэтому совпадает для модели и компактной записи одного и того же источника.
+
+    :param BaseCitationStyle item: Объект стиля цитирования.
+    :return: Хэш (16 байт).
+    """
+
+    style, data = type(item), item.data
+    prefix = STYLE_PREFIXES.get(style)
+    if prefix is None:
+        prefix = STYLE_PREFIXES[style] = get_style_prefix(style)
+    getter = VALUES_GETTERS.get(type(data))
+    if getter is None:
+        getter = VALUES_GETTERS[type(data)] = get_values_getter(type(data))
+
+    return hashlib.blake2b(prefix + repr(getter(data)).encode("utf-8"), digest_size=16).digest()
+
+
+@dataclass
+class IncrementalStats:
+    """
+    Статистика инкрементального форматирования.
+    """
+
+    # источники, строки которых получены из манифеста
+    retained: int = 0
+    # добавленные и измененные источники
+    formatted: int = 0
+    # источники из манифеста, отсутствующие во входном файле
+    removed: int = 0
+
+    def __str__(self) -> str:
+        return f"без изменений – {self.retained}, отформатировано – {self.formatted}, удалено – {self.removed}"
+
+
+def get_manifest_path(path_output: Union[Path, str]) -> Path:
+    """
+    Получение пути к манифесту выходного файла.
+
+    :param Union[Path, str] path_output: Путь к выходному файлу.
+    :return: Путь к файлу манифеста.
+    """
+
+    return Path(f"{path_output}{MANIFEST_SUFFIX}")
+
+
+def load_manifest(path: Path, formatter: type[BaseCitationFormatter]) -> list[tuple[str, str]]:
+    """
+    Загрузка манифеста.
+
+    Манифест другого стиля цитирования или другой версии правил форматирования не используется.
+
+    :param Path path: Путь к файлу манифеста.
+    :param type[BaseCitationFormatter] formatter: Класс форматтера стиля цитирования.
+    :return: Отсортированный список хэшей (в шестнадцатеричной записи) и отформатированных строк.
+    """
+
+    try:
+        with open(path, encoding="utf-8") as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        return []
+    except ValueError:
+        logger.warning("Манифест %s поврежден и не используется.", path)
+        return []
+
+    if manifest.get("formatter") != formatter.__name__ or manifest.get("version") != STYLE_VERSION:
+        return []
+
+    return [(key, formatted) for key, formatted in manifest["entries"]]
+
+
+def save_manifest(path: Path, formatter: type[BaseCitationFormatter], entries: list[tuple[str, str]]) -> None:
+    """
+    Сохранение манифеста.
+
+    Манифест записывается во временный файл и затем переименовывается, поэтому прерванная генерация
+    не оставляет частично записанный манифест (временный файл при ошибке удаляется).
+
+    :param Path path: Путь к файлу манифеста.
+    :param type[BaseCitationFormatter] formatter: Класс форматтера стиля цитирования.
+    :param list[tuple[str, str]] entries: Отсортированный список хэшей и отформатированных строк.
+    """
+
+    file = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False)
+    try:
+        with file:
+            # `json.dumps` использует кодировщик на C, в отличие от потоковой записи `json.dump`
+            file.write(
+                json.dumps(
+                    {"formatter": formatter.__name__, "version": STYLE_VERSION, "entries": entries},
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            )
+        os.replace(file.name, path)
+    except BaseException:
+        # временный файл удаляется, если запись или переименование не выполнены
+        os.unlink(file.name)
+        raise
+
+
+def format_incremental(
+    formatter: type[BaseCitationFormatter], models: list[Source], path_output: Union[Path, str]
+) -> tuple[list[BaseCitationStyle], IncrementalStats]:
+    """
+    Инкрементальное форматирование списка источников с обновлением манифеста выходного файла.
+
+    Форматируются только источники, отсутствующие в манифесте. При небольшом количестве изменений ключи
+    сортировки вычисляются только для отформатированных источников и для строк, с которыми они сравниваются
+    при двоичном поиске позиции вставки.
+
+    :param type[BaseCitationFormatter] formatter: Класс форматтера стиля цитирования.
+    :param list[Source] models: Модели (или компактные записи) источников.
+    :param Union[Path, str] path_output: Путь к выходному файлу.
+    :return: Отсортированный список объектов стилей и статистика форматирования.
+    """
+
+    path = get_manifest_path(path_output)
+    stats = IncrementalStats()
+
+    # источники с одинаковым хэшем (повторяющиеся строки) сопоставляются с записями манифеста по одному
+    pending: dict[str, list[BaseCitationStyle]] = defaultdict(list)
+    for model in models:
+        item = formatter.formatters_map[get_model_type(model)](model, True)  # type: ignore
+        pending[get_source_hash(item).hex()].append(item)
+
+    items: list[BaseCitationStyle] = []
+    keys: list[str] = []
+    for key, formatted in load_manifest(path, formatter):
+        candidates = pending.get(key)
+        if not candidates:
+            stats.removed += 1
+            continue
+        item = candidates.pop()
+        item.formatted = formatted
+        items.append(item)
+        keys.append(key)
+    stats.retained = len(items)
+
+    def get_item_key(item: BaseCitationStyle) -> Any:
+        return formatter.get_sort_key(item.formatted)
+
+    # оставшиеся источники отсутствуют в манифесте и форматируются при вычислении ключей сортировки
+    changed = sorted(
+        ((key, item) for key, candidates in pending.items() for item in candidates),
+        key=lambda pair: get_item_key(pair[1]),
+    )
+    stats.formatted = len(changed)
+
+    if len(changed) * math.log2(len(items) + 1) < len(items):
+        # немногие изменения вставляются двоичным поиском без вычисления ключей всех строк манифеста
+        for key, item in changed:
+            position = bisect_right(items, get_item_key(item), key=get_item_key)
+            items.insert(position, item)
+            keys.insert(position, key)
+    else:
+        pairs = list(heapq.merge(zip(keys, items), changed, key=lambda pair: get_item_key(pair[1])))
+        keys = [key for key, _ in pairs]
+        items = [item for _, item in pairs]
+
+    if stats.formatted or stats.removed:
+        save_manifest(path, formatter, [(key, item.formatted) for key, item in zip(keys, items)])
+
+    return items, stats
@@ -1,9 +1,158 @@
 """
 Функции для логирования.
+
+Записи логов всех модулей передаются через очередь (`QueueHandler`) фоновому потоку (`QueueListener`),
+который записывает их в файлы модулей и выводит в консоль, поэтому запись логов не блокирует обработку.
+Обработчики создаются один раз при первом вызове `get_logger()`.
 """
+import atexit
+import itertools
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Iterator, Optional, TypeVar
+
+from settings import LOGGING_FORMAT, LOGGING_LEVEL, LOGGING_PATH, LOGGING_PROGRESS_INTERVAL, LOGGING_SAMPLE_RATE
+
+T = TypeVar("T")
+
+# идентификатор процесса, в котором импортирован модуль
+MAIN_PID = os.getpid()
+
+
+class ModuleFileHandler(logging.Handler):
+    """
+    Запись логов в файлы модулей: записи каждого логгера сохраняются в файл `<LOGGING_PATH>/<имя логгера>.log`.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к директории для логирования
+        """
+
+        super().__init__()
+        self.path = path
+        self.handlers: dict[str, logging.FileHandler] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        handler = self.handlers.get(record.name)
+        if handler is None:
+            handler = logging.FileHandler(f"{self.path}/{record.name}.log", delay=True)
+            handler.setFormatter(self.formatter)
+            self.handlers[record.name] = handler
+
+        handler.emit(record)
+
+    def close(self) -> None:
+        for handler in self.handlers.values():
+            handler.close()
+        super().close()
+
 
-from settings import LOGGING_FORMAT, LOGGING_LEVEL, LOGGING_PATH
+class SamplingFilter(logging.Filter):
+    """
+    Прореживание записей отладочного уровня: пропускается одна из `rate` записей каждого логгера.
+
+    Используется для записей о каждом источнике, которые при больших списках определяли бы время обработки.
+    """
+
+    def __init__(self, rate: int) -> None:
+        """
+        Конструктор.
+
+        :param rate: Доля пропускаемых записей (1 – все записи)
+        """
+
+        super().__init__()
+        self.rate = rate
+        self.counters: dict[str, Iterator[int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate <= 1:
+            return True
+
+        counter = self.counters.get(record.name)
+        if counter is None:
+            counter = self.counters[record.name] = itertools.count()
+
+        return next(counter) % self.rate == 0
+
+
+class ProcessQueueHandler(QueueHandler):
+    """
+    Передача записей в очередь фонового потока записи логов.
+
+    Процессы, созданные из текущего процесса (например, процессы пакетной обработки), не наследуют
+    фоновый поток, поэтому при первой записи в новом процессе поток запускается заново.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if LISTENER.pid != os.getpid():
+            LISTENER.start()
+
+        super().emit(record)
+
+
+class LogListener:
+    """
+    Фоновый поток записи логов текущего процесса.
+    """
+
+    def __init__(self, logging_format: str) -> None:
+        """
+        Конструктор.
+
+        :param logging_format: Формат логов
+        """
+
+        self.logging_format = logging_format
+        self.queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self.listener: Optional[QueueListener] = None
+        self.pid: Optional[int] = None
+
+    def start(self) -> None:
+        """
+        Запуск фонового потока записи логов.
+        """
+
+        formatter = logging.Formatter(self.logging_format)
+        handlers: list[logging.Handler] = [ModuleFileHandler(LOGGING_PATH), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        # очередь унаследованного процесса может содержать записи родительского процесса
+        self.queue = queue.SimpleQueue()
+        QUEUE_HANDLER.queue = self.queue
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self.pid = os.getpid()
+        if self.pid != MAIN_PID:
+            # процессы пулов завершаются без вызова обработчиков `atexit`, но с вызовом финализаторов
+            # `multiprocessing` (модуль импортируется только в дочерних процессах)
+            import multiprocessing.util  # pylint: disable=C0415
+
+            multiprocessing.util.Finalize(None, self.stop, exitpriority=0)
+
+    def stop(self) -> None:
+        """
+        Остановка фонового потока после записи всех записей из очереди.
+        """
+
+        if self.listener is not None and self.pid == os.getpid():
+            self.listener.stop()
+            for handler in self.listener.handlers:
+                handler.close()
+        self.listener = None
+        self.pid = None
+
+
+LISTENER = LogListener(LOGGING_FORMAT)
+QUEUE_HANDLER = ProcessQueueHandler(LISTENER.queue)
+QUEUE_HANDLER.addFilter(SamplingFilter(LOGGING_SAMPLE_RATE))
+atexit.register(LISTENER.stop)
 
 
 def get_logger(
@@ -14,22 +163,45 @@ def get_logger(
     """
     Настройка логгера.
 
+    Повторный вызов для того же модуля не добавляет обработчики.
+
     :param module_name: Наименование модуля
     :param logging_level: Уровень логирования
-    :param logging_format: Формат логов
+    :param logging_format: Формат логов (используется при первом вызове)
     :return:
     """
 
-    # запись логов в файлы
+    if LISTENER.pid != os.getpid():
+        LISTENER.logging_format = logging_format
+        LISTENER.start()
+
     logger = logging.getLogger(module_name)
     logger.setLevel(logging_level)
-    file_handler = logging.FileHandler(f"{LOGGING_PATH}/{module_name}.log")
-    file_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(file_handler)
-
-    # вывод логов в консоль
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(stream_handler)
+    if QUEUE_HANDLER not in logger.handlers:
+        logger.addHandler(QUEUE_HANDLER)
 
     return logger
+
+
+def log_progress(
+    logger: logging.Logger, items: Iterable[T], message: str, interval: int = LOGGING_PROGRESS_INTERVAL
+) -> Iterator[T]:
+    """
+    Вывод сводных записей о ходе обработки вместо записей о каждом элементе.
+
+    :param logger: Логгер
+    :param items: Обрабатываемые элементы
+    :param message: Сообщение с заполнителем для количества обработанных элементов
+    :param interval: Количество элементов между записями о ходе обработки
+    :return: Генератор элементов
+    """
+
+    count = 0
+    for count, item in enumerate(items, 1):
+        if count % interval == 0:
+            logger.info(message, count)
+        yield item
+
+    if count % interval:
+        logger.info(message, count)
+
@@ -1,16 +1,42 @@
 """
 Запуск приложения.
 """
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from enum import Enum, unique
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Sequence, Union
 
 import click
-from formatters.styles.gost import GOSTCitationFormatter
+from cache import ResultCache
+from batch import find_inputs, format_summary, run_batch
 from logger import get_logger
-from readers.reader import SourcesReader
-from renderer import BaseRenderer, GOSTRenderer, APARenderer
-from settings import INPUT_FILE_PATH, OUTPUT_FILE_PATH
-from formatters.base import BaseCitationFormatter
-from formatters.styles.apa import APACitationFormatter
+from metrics import StageTimings, get_peak_rss, profiling
+from registry import FORMAT_RENDERERS, FORMATTERS, STYLE_RENDERERS, resolve
+from settings import (
+    BATCH_WORKERS,
+    CACHE_ENABLED,
+    INPUT_FILE_PATH,
+    OUTPUT_FILE_PATH,
+    READ_WORKERS,
+    SERVICE_HOST,
+    SERVICE_PORT,
+    SERVICE_QUEUE_SIZE,
+    SERVICE_WORKERS,
+    SNAPSHOT_ENABLED,
+    SORT_EXTERNAL,
+)
+
+# модули чтения, форматирования и генерации (и библиотеки openpyxl, python-docx, pydantic) импортируются
+# при первом использовании (см. `registry`), поэтому вывод справки и запуск команд не загружают лишние модули
+if TYPE_CHECKING:
+    from dedup import DedupIndex
+    from formatters.base import BaseCitationFormatter
+    from formatters.records import Source
+    from renderer import BaseRenderer, DocxRenderer
 
 logger = get_logger(__name__)
 
@@ -25,15 +51,41 @@ class CitationEnum(Enum):
     APA = "apa"  # American Psychological Association
 
 
-@click.command()
+@unique
+class FormatEnum(Enum):
+    """
+    Поддерживаемые форматы выходного файла.
+    """
+
+    DOCX = "docx"  # Word
+    TXT = "txt"  # простой текст
+    HTML = "html"
+    MD = "md"  # Markdown
+    BIBTEX = "bibtex"
+    CSL_JSON = "csl-json"  # Citation Style Language JSON
+
+
+@click.group(invoke_without_command=True)
 @click.option(
     "--citation",
     "-c",
-    "citation",
+    "citations",
     type=click.Choice([item.name for item in CitationEnum], case_sensitive=False),
-    default=CitationEnum.GOST.name,
+    multiple=True,
+    default=[CitationEnum.GOST.name],
     show_default=True,
-    help="Стиль цитирования",
+    help="Стиль цитирования (можно указать несколько раз: источники читаются один раз, для каждого стиля "
+    "создается выходной файл с суффиксом стиля, например output_gost.docx и output_apa.docx)",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice([item.name for item in FormatEnum], case_sensitive=False),
+    default=FormatEnum.DOCX.name,
+    show_default=True,
+    help="Формат выходного файла (для форматов, отличных от DOCX, расширение пути к выходному файлу по умолчанию "
+    "заменяется расширением формата)",
 )
 @click.option(
     "--path_input",
@@ -42,7 +94,8 @@ class CitationEnum(Enum):
     type=str,
     default=INPUT_FILE_PATH,
     show_default=True,
-    help="Путь к входному файлу",
+    help="Путь к входному файлу: рабочая книга Excel, файл JSON Lines (*.jsonl), файл колоночного формата "
+    "(*.bibcol) или директория с файлами CSV",
 )
 @click.option(
     "--path_output",
@@ -53,38 +106,720 @@ class CitationEnum(Enum):
     show_default=True,
     help="Путь к выходному файлу",
 )
+@click.option(
+    "--read_workers",
+    "-rw",
+    "read_workers",
+    type=click.IntRange(min=1),
+    default=READ_WORKERS,
+    show_default=True,
+    help="Количество процессов для параллельного чтения листов входного файла",
+)
+@click.option(
+    "--limit",
+    "-l",
+    "limit",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Количество первых источников списка для вывода (по умолчанию – все источники)",
+)
+@click.option(
+    "--streaming",
+    "-s",
+    "streaming",
+    is_flag=True,
+    default=False,
+    help="Потоковая обработка: чтение, форматирование и генерация выходного файла без хранения всего списка в памяти",
+)
+@click.option(
+    "--external-sort/--no-external-sort",
+    "external_sort",
+    default=SORT_EXTERNAL,
+    show_default=True,
+    help="Внешняя сортировка отформатированных строк: при превышении ограничения SORT_MEMORY_LIMIT строки "
+    "сортируются участками во временных файлах (по умолчанию строки сортируются в памяти)",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=CACHE_ENABLED,
+    show_default=True,
+    help="Использование кэша результатов: для одинаковых входных файлов и параметров выходной файл "
+    "копируется из кэша",
+)
+@click.option(
+    "--snapshot/--no-snapshot",
+    "use_snapshot",
+    default=SNAPSHOT_ENABLED,
+    show_default=True,
+    help="Использование снимка прочитанных строк рабочей книги (файл рядом с входным файлом): повторная обработка "
+    "того же файла, например с другим стилем цитирования, не разбирает рабочую книгу",
+)
+@click.option(
+    "--incremental",
+    "incremental",
+    is_flag=True,
+    default=False,
+    help="Инкрементальная генерация: форматируются только источники, добавленные или измененные "
+    "после предыдущей генерации выходного файла",
+)
+@click.option(
+    "--dedup",
+    "dedup",
+    is_flag=True,
+    default=False,
+    help="Объединение повторяющихся и похожих источников перед форматированием (отчет об объединенных "
+    "источниках сохраняется рядом с выходным файлом, например output.docx.duplicates.json)",
+)
+@click.option(
+    "--profile",
+    "path_profile",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Путь к JSON-отчету о выполнении этапов обработки (чтение, проверка, форматирование, сортировка, "
+    "запись): время, источников в секунду и пиковый объем памяти каждого этапа",
+)
+@click.option(
+    "--profile-stage",
+    "profile_stage",
+    type=str,
+    default=None,
+    help="Этап из отчета --profile (например, самый долгий этап hot_stage) для сбора статистики cProfile: "
+    "статистика сохраняется рядом с отчетом с расширением .pstats",
+)
+@click.option(
+    "--profile-memory/--no-profile-memory",
+    "profile_memory",
+    default=True,
+    help="Замер пикового объема памяти этапов в отчете --profile (отслеживание памяти увеличивает время этапов)",
+)
+@click.pass_context
 def process_input(
-    citation: str = CitationEnum.GOST.name,
+    ctx: click.Context,
+    citations: Sequence[str] = (CitationEnum.GOST.name,),
     path_input: str = INPUT_FILE_PATH,
     path_output: str = OUTPUT_FILE_PATH,
+    read_workers: int = READ_WORKERS,
+    limit: Optional[int] = None,
+    streaming: bool = False,
+    external_sort: bool = SORT_EXTERNAL,
+    output_format: str = FormatEnum.DOCX.name,
+    use_cache: bool = CACHE_ENABLED,
+    use_snapshot: bool = SNAPSHOT_ENABLED,
+    incremental: bool = False,
+    dedup: bool = False,
+    path_profile: Optional[str] = None,
+    profile_stage: Optional[str] = None,
+    profile_memory: bool = True,
 ) -> None:
     """
-    Генерация файла Word с оформленным библиографическим списком.
+    Генерация файла с оформленным библиографическим списком.
 
-    :param str citation: Стиль цитирования
-    :param str path_input: Путь к входному файлу
+    Без подкоманды обрабатывается один входной файл, для обработки нескольких файлов используется подкоманда `batch`.
+
+    :param click.Context ctx: Контекст команды
+    :param Sequence[str] citations: Стили цитирования
+    :param str path_input: Путь к входному файлу (рабочая книга Excel, *.jsonl, *.bibcol или директория с файлами CSV)
     :param str path_output: Путь к выходному файлу
+    :param int read_workers: Количество процессов для параллельного чтения листов входного файла
+    :param Optional[int] limit: Количество первых источников списка для вывода
+    :param bool streaming: Потоковая обработка без хранения всего списка в памяти
+    :param bool external_sort: Внешняя сортировка отформатированных строк
+    :param str output_format: Формат выходного файла
+    :param bool use_cache: Использование кэша результатов
+    :param bool use_snapshot: Использование снимка прочитанных строк рабочей книги
+    :param bool incremental: Инкрементальная генерация
+    :param bool dedup: Объединение повторяющихся источников
+    :param Optional[str] path_profile: Путь к отчету о выполнении этапов обработки
+    :param Optional[str] profile_stage: Этап для сбора статистики cProfile
+    :param bool profile_memory: Замер пикового объема памяти этапов
     """
 
+    if ctx.invoked_subcommand is not None:
+        return
+
+    if profile_stage is not None and path_profile is None:
+        raise click.BadParameter("этап для профилирования указывается вместе с --profile", param_hint="--profile-stage")
+
+    output_format = output_format.upper()
+    if output_format != FormatEnum.DOCX.name and path_output == OUTPUT_FILE_PATH:
+        path_output = str(Path(path_output).with_suffix(get_format_renderer(output_format).extension))
+
     logger.info(
         """Обработка команды с параметрами:
         - Стиль цитирования: %s.
         - Путь к входному файлу: %s.
-        - Путь к выходному файлу: %s.""",
-        citation,
+        - Путь к выходному файлу: %s.
+        - Формат выходного файла: %s.""",
+        ", ".join(citations),
         path_input,
         path_output,
+        output_format,
+    )
+
+    timings = StageTimings(profile_stage)
+    with profiling(timings, profile_memory) if path_profile is not None else nullcontext(timings):
+        generate(
+            path_input,
+            path_output,
+            citations,
+            output_format,
+            read_workers,
+            limit,
+            streaming,
+            use_cache=use_cache,
+            use_snapshot=use_snapshot,
+            incremental=incremental,
+            dedup=dedup,
+            external_sort=external_sort,
+            timings=timings,
+        )
+
+    logger.info("Пиковый объем памяти: %.1f МБ.", get_peak_rss() / 2**20)
+    if path_profile is not None:
+        save_profile(timings, path_profile)
+    logger.info("Команда успешно завершена.")
+
+
+@process_input.command()
+@click.argument("source", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--citation",
+    "-c",
+    "citations",
+    type=click.Choice([item.name for item in CitationEnum], case_sensitive=False),
+    multiple=True,
+    default=[CitationEnum.GOST.name],
+    show_default=True,
+    help="Стиль цитирования (можно указать несколько раз)",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice([item.name for item in FormatEnum], case_sensitive=False),
+    default=FormatEnum.DOCX.name,
+    show_default=True,
+    help="Формат выходных файлов",
+)
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=BATCH_WORKERS,
+    show_default=True,
+    help="Количество процессов для обработки входных файлов",
+)
+@click.option(
+    "--limit",
+    "-l",
+    "limit",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Количество первых источников списка для вывода (по умолчанию – все источники)",
+)
+@click.option(
+    "--streaming",
+    "-s",
+    "streaming",
+    is_flag=True,
+    default=False,
+    help="Потоковая обработка каждого входного файла",
+)
+@click.option(
+    "--external-sort/--no-external-sort",
+    "external_sort",
+    default=SORT_EXTERNAL,
+    show_default=True,
+    help="Внешняя сортировка отформатированных строк каждого входного файла",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=CACHE_ENABLED,
+    show_default=True,
+    help="Использование кэша результатов",
+)
+@click.option(
+    "--snapshot/--no-snapshot",
+    "use_snapshot",
+    default=SNAPSHOT_ENABLED,
+    show_default=True,
+    help="Использование снимков прочитанных строк рабочих книг",
+)
+@click.option(
+    "--dedup",
+    "dedup",
+    is_flag=True,
+    default=False,
+    help="Объединение повторяющихся и похожих источников каждого входного файла",
+)
+def batch(
+    source: Path,
+    citations: Sequence[str] = (CitationEnum.GOST.name,),
+    output_format: str = FormatEnum.DOCX.name,
+    workers: int = BATCH_WORKERS,
+    limit: Optional[int] = None,
+    streaming: bool = False,
+    external_sort: bool = SORT_EXTERNAL,
+    use_cache: bool = CACHE_ENABLED,
+    use_snapshot: bool = SNAPSHOT_ENABLED,
+    dedup: bool = False,
+) -> None:
+    """
+    Пакетная генерация файлов с оформленными библиографическими списками.
+
+    SOURCE – директория с входными файлами (*.xlsx) или файл-манифест со списком путей к входным файлам
+    (по одному на строку). Выходные файлы сохраняются рядом с входными файлами с расширением формата.
+
+    :param Path source: Директория с входными файлами или файл-манифест
+    :param Sequence[str] citations: Стили цитирования
+    :param str output_format: Формат выходных файлов
+    :param int workers: Количество процессов для обработки входных файлов
+    :param Optional[int] limit: Количество первых источников списка для вывода
+    :param bool streaming: Потоковая обработка каждого входного файла
+    :param bool external_sort: Внешняя сортировка отформатированных строк
+    :param bool use_cache: Использование кэша результатов
+    :param bool use_snapshot: Использование снимков прочитанных строк рабочих книг
+    :param bool dedup: Объединение повторяющихся источников
+    """
+
+    output_format = output_format.upper()
+    inputs = find_inputs(source)
+    logger.info(
+        "Пакетная обработка %s входных файлов (стиль цитирования: %s, формат: %s, процессов: %s) ...",
+        len(inputs),
+        ", ".join(citations),
+        output_format,
+        workers,
     )
 
-    models = SourcesReader(path_input).read()
-    formatted_models = tuple(
-        str(item) for item in get_formatter(citation)(models).format()
+    # параллельное чтение листов внутри процессов пакетной обработки не используется
+    process = partial(
+        generate,
+        citation=tuple(citations),
+        output_format=output_format,
+        read_workers=1,
+        limit=limit,
+        streaming=streaming,
+        external_sort=external_sort,
+        use_cache=use_cache,
+        use_snapshot=use_snapshot,
+        dedup=dedup,
     )
+    results = run_batch(process, inputs, get_format_renderer(output_format).extension, workers)
+
+    click.echo(format_summary(results))
+    failed = sum(result.error is not None for result in results)
+    logger.info("Пакетная обработка завершена: файлов – %s, с ошибками – %s.", len(results), failed)
+    if failed:
+        raise click.exceptions.Exit(1)
+
+
+@process_input.command()
+@click.argument("source", type=click.Path(exists=True))
+@click.argument("target", type=click.Path())
+def convert(source: str, target: str) -> None:
+    """
+    Преобразование входных данных в другой формат для ускорения чтения.
+
+    SOURCE – входной файл (рабочая книга Excel, *.jsonl, *.bibcol или директория с файлами CSV),
+    TARGET – путь к файлу *.jsonl, *.bibcol или к директории для файлов CSV (по одному на тип источника).
+
+    :param str source: Путь к входному файлу
+    :param str target: Путь к преобразованному файлу
+    """
+
+    from readers.reader import SourcesReader, write_sources  # pylint: disable=C0415
+
+    with SourcesReader(source, compact=True) as reader:
+        write_sources(target, reader.iterate())
+
+    logger.info("Входные данные преобразованы: %s.", target)
+
+
+@process_input.command()
+@click.option("--host", "host", type=str, default=SERVICE_HOST, show_default=True, help="Адрес HTTP-сервиса")
+@click.option("--port", "port", type=click.IntRange(min=0), default=SERVICE_PORT, show_default=True,
+              help="Порт HTTP-сервиса")
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=SERVICE_WORKERS,
+    show_default=True,
+    help="Количество процессов для обработки запросов",
+)
+@click.option(
+    "--queue_size",
+    "-q",
+    "queue_size",
+    type=click.IntRange(min=0),
+    default=SERVICE_QUEUE_SIZE,
+    show_default=True,
+    help="Количество запросов, ожидающих свободного процесса (при превышении сервис отвечает кодом 503)",
+)
+def serve(
+    host: str = SERVICE_HOST,
+    port: int = SERVICE_PORT,
+    workers: int = SERVICE_WORKERS,
+    queue_size: int = SERVICE_QUEUE_SIZE,
+) -> None:
+    """
+    Запуск HTTP-сервиса генерации файлов с оформленными библиографическими списками.
+
+    :param str host: Адрес HTTP-сервиса
+    :param int port: Порт HTTP-сервиса
+    :param int workers: Количество процессов для обработки запросов
+    :param int queue_size: Количество запросов, ожидающих свободного процесса
+    """
+
+    # модуль сервиса импортирует функции этого модуля, поэтому импортируется только при запуске сервиса
+    from service import run_service  # pylint: disable=C0415
+
+    run_service(host, port, workers, queue_size)
+
+
+def generate(
+    path_input: str,
+    path_output: str,
+    citation: Union[str, Sequence[str]] = CitationEnum.GOST.name,
+    output_format: str = FormatEnum.DOCX.name,
+    read_workers: int = READ_WORKERS,
+    limit: Optional[int] = None,
+    streaming: bool = False,
+    use_cache: bool = False,
+    use_snapshot: bool = False,
+    incremental: bool = False,
+    dedup: bool = False,
+    external_sort: bool = False,
+    timings: Optional[StageTimings] = None,
+) -> bool:
+    """
+    Генерация файлов с оформленным библиографическим списком для одного входного файла.
+
+    Для нескольких стилей цитирования источники читаются один раз, форматирование и генерация выходных файлов
+    стилей выполняются в отдельных потоках (см. `run_styles`), выходные файлы получают суффикс стиля
+    (см. `get_style_path`). Время этапов обработки выводится в лог.
+
+    :param str path_input: Путь к входному файлу
+    :param str path_output: Путь к выходному файлу
+    :param Union[str, Sequence[str]] citation: Стиль цитирования или несколько стилей
+    :param str output_format: Формат выходного файла
+    :param int read_workers: Количество процессов для параллельного чтения листов входного файла
+    :param Optional[int] limit: Количество первых источников списка для вывода
+    :param bool streaming: Потоковая обработка без хранения всего списка в памяти
+    :param bool use_cache: Использование кэша результатов для одинаковых входных файлов и параметров
+    :param bool use_snapshot: Использование снимка прочитанных строк рабочей книги
+    :param bool incremental: Инкрементальная генерация с манифестом выходного файла (без потоковой обработки)
+    :param bool dedup: Объединение повторяющихся источников после чтения (см. `dedup`)
+    :param bool external_sort: Внешняя сортировка отформатированных строк (без потоковой обработки)
+    :param Optional[StageTimings] timings: Время выполнения этапов обработки (при профилировании)
+    :return: Признак получения всех выходных файлов из кэша результатов
+    """
+
+    citations = [citation] if isinstance(citation, str) else list(dict.fromkeys(citation))
+    paths = {style: get_style_path(path_output, style, len(citations) > 1) for style in citations}
+
+    cache = ResultCache() if use_cache else None
+    keys = {}
+    if cache is not None:
+        pending = []
+        for style in citations:
+            # режим обработки (потоковый или обычный) не влияет на выходной файл и не входит в ключ
+            keys[style] = cache.get_key(path_input, style, output_format, limit, dedup)
+            cached = cache.get(keys[style], paths[style])
+            # отчет об объединенных источниках восстанавливается из кэша вместе с выходным файлом
+            if cached and dedup:
+                cached = get_cached_report(cache, keys[style], paths[style])
+            if cached:
+                logger.info("Выходной файл %s получен из кэша результатов.", paths[style])
+            else:
+                pending.append(style)
+        # попадания и промахи учитываются для каждого стиля (и отчета об объединенных источниках)
+        logger.info("Кэш результатов: %s.", cache.stats)
+
+        if not pending:
+            return True
+        citations = pending
+
+    from readers.reader import SourcesReader  # pylint: disable=C0415
+
+    timings = timings or StageTimings()
+    models: list[Source] = []
+
+    def render(style: str) -> None:
+        if streaming:
+            # при потоковой обработке модели не хранятся в памяти, поэтому каждый стиль читает входной файл
+            process_stream(style, path_input, paths[style], limit, output_format, use_snapshot, timings, dedup)
+        elif incremental:
+            render_incremental(models, paths[style], style, output_format, limit, timings)
+        else:
+            render_models(models, paths[style], style, output_format, limit, timings, external_sort)
+
+    if not streaming:
+        with timings.measure("чтение") as stage:
+            # для отчета об объединенных источниках читаются наименования листов и номера строк
+            with SourcesReader(path_input, compact=True, snapshot=use_snapshot, located=dedup) as reader:
+                items = reader.read(read_workers)
+            stage.entries = len(items)
+        if dedup:
+            from dedup import DedupIndex  # pylint: disable=C0415
+
+            index = DedupIndex()
+            with timings.measure("удаление повторов") as stage:
+                stage.entries = len(items)
+                models = list(index.filter(items))
+            # кортежи с расположением источников больше не используются
+            del items
+            for style in citations:
+                save_duplicates(index, paths[style])
+        else:
+            models = items
+
+    run_styles(citations, render)
+
+    logger.info("Время выполнения этапов: %s.", timings)
+
+    if cache is not None:
+        for style in citations:
+            cache.put(keys[style], paths[style])
+            if dedup:
+                put_cached_report(cache, keys[style], paths[style])
+
+    return False
+
+
+def save_profile(timings: StageTimings, path_profile: str) -> None:
+    """
+    Сохранение отчета о выполнении этапов обработки и статистики cProfile профилируемого этапа.
+
+    :param StageTimings timings: Время выполнения этапов обработки
+    :param str path_profile: Путь к отчету
+    """
+
+    timings.save_report(path_profile)
+    logger.info("Отчет о выполнении этапов сохранен: %s (самый долгий этап – %s).", path_profile, timings.hot_stage)
+
+    if timings.profile_stage is None:
+        return
+
+    path_stats = Path(path_profile).with_suffix(".pstats")
+    if timings.dump_profile(path_stats):
+        logger.info("Статистика cProfile этапа «%s» сохранена: %s.", timings.profile_stage, path_stats)
+    else:
+        logger.warning("Этап «%s» не выполнялся, статистика cProfile не сохранена.", timings.profile_stage)
+
+
+def get_style_path(path_output: str, citation: str, suffixed: bool) -> str:
+    """
+    Получение пути к выходному файлу стиля цитирования.
+
+    :param str path_output: Путь к выходному файлу
+    :param str citation: Стиль цитирования
+    :param bool suffixed: Добавление суффикса стиля к имени файла (при генерации нескольких стилей)
+    :return: Путь к выходному файлу стиля (`output.docx` – `output_gost.docx`)
+    """
+
+    if not suffixed:
+        return path_output
+
+    path = Path(path_output)
+
+    return str(path.with_name(f"{path.stem}_{citation.lower()}{path.suffix}"))
+
+
+def run_styles(citations: Sequence[str], render: Callable[[str], None]) -> None:
+    """
+    Форматирование и генерация выходных файлов нескольких стилей цитирования.
+
+    Стили обрабатываются в потоках одного процесса, поэтому модели источников используются всеми стилями
+    без копирования. Форматирование выполняется под GIL, параллельно выполняются сжатие и запись выходных
+    файлов, поэтому выигрыш по сравнению с последовательной обработкой стилей ограничен.
+
+    :param Sequence[str] citations: Стили цитирования
+    :param Callable[[str], None] render: Форматирование и генерация выходного файла стиля
+    """
+
+    if len(citations) <= 1:
+        for style in citations:
+            render(style)
+        return
+
+    with ThreadPoolExecutor(max_workers=len(citations), thread_name_prefix="style") as executor:
+        # получение результатов передает исключения потоков в вызывающий поток
+        for _ in executor.map(render, citations):
+            pass
+
+
+def render_models(
+    models: list[Source],
+    path_output: str,
+    citation: str = CitationEnum.GOST.name,
+    output_format: str = FormatEnum.DOCX.name,
+    limit: Optional[int] = None,
+    timings: Optional[StageTimings] = None,
+    external_sort: bool = False,
+) -> None:
+    """
+    Форматирование источников и генерация выходного файла.
+
+    По умолчанию отформатированные строки сортируются в памяти, внешняя сортировка с ограничением объема памяти
+    (см. `format_external`) используется только для полного списка при указании `external_sort`.
+
+    :param list[Source] models: Модели (или компактные записи) источников
+    :param str path_output: Путь к выходному файлу
+    :param str citation: Стиль цитирования
+    :param str output_format: Формат выходного файла
+    :param Optional[int] limit: Количество первых источников списка для вывода
+    :param Optional[StageTimings] timings: Время выполнения этапов обработки
+    :param bool external_sort: Внешняя сортировка отформатированных строк
+    """
+
+    timings = timings or StageTimings()
+    entries = get_format_renderer(output_format).entries
+    with timings.measure(f"{citation}: форматирование") as stage:
+        stage.entries = len(models)
+        if external_sort and limit is None:
+            formatted_models: Iterable[Any] = get_formatter(citation)(models).format_external(entries=entries)
+        else:
+            # при выводе части списка форматируются только выводимые источники
+            formatter = get_formatter(citation)(models, lazy=limit is not None)
+            formatted_models = tuple(
+                (str(item), item.data) if entries else str(item) for item in formatter.format(limit)
+            )
 
     logger.info("Генерация выходного файла ...")
-    get_renderer(citation)(formatted_models).render(path_output)
+    # при внешней сортировке слияние отсортированных участков выполняется при получении строк рендерером
+    with timings.measure(f"{citation}: сортировка и генерация"):
+        create_renderer(citation, output_format, formatted_models).render(path_output)
 
-    logger.info("Команда успешно завершена.")
+
+def render_incremental(
+    models: list[Source],
+    path_output: str,
+    citation: str = CitationEnum.GOST.name,
+    output_format: str = FormatEnum.DOCX.name,
+    limit: Optional[int] = None,
+    timings: Optional[StageTimings] = None,
+) -> None:
+    """
+    Инкрементальное форматирование источников и генерация выходного файла.
+
+    Форматируются только источники, отсутствующие в манифесте предыдущей генерации выходного файла
+    (см. `incremental.format_incremental`), выходной файл генерируется заново.
+
+    :param list[Source] models: Модели (или компактные записи) источников
+    :param str path_output: Путь к выходному файлу
+    :param str citation: Стиль цитирования
+    :param str output_format: Формат выходного файла
+    :param Optional[int] limit: Количество первых источников списка для вывода
+    :param Optional[StageTimings] timings: Время выполнения этапов обработки
+    """
+
+    from incremental import format_incremental  # pylint: disable=C0415
+
+    timings = timings or StageTimings()
+    with timings.measure(f"{citation}: форматирование") as stage:
+        stage.entries = len(models)
+        items, stats = format_incremental(get_formatter(citation), models, path_output)
+    logger.info("Инкрементальное форматирование: %s.", stats)
+
+    entries = get_format_renderer(output_format).entries
+    rows = ((item.formatted, item.data) if entries else item.formatted for item in islice(items, limit))
+
+    logger.info("Генерация выходного файла ...")
+    with timings.measure(f"{citation}: генерация"):
+        create_renderer(citation, output_format, rows).render(path_output)
+
+
+def process_stream(
+    citation: str,
+    path_input: str,
+    path_output: str,
+    limit: Optional[int] = None,
+    output_format: str = FormatEnum.DOCX.name,
+    use_snapshot: bool = False,
+    timings: Optional[StageTimings] = None,
+    dedup: bool = False,
+) -> None:
+    """
+    Потоковая генерация выходного файла: модели читаются, форматируются и передаются на генерацию через генераторы.
+
+    Для сортировки используется внешняя сортировка, поэтому пиковый объем памяти не зависит от размера входного файла.
+    Этапы выполняются одновременно, поэтому время замеряется для всей обработки.
+
+    :param str citation: Стиль цитирования
+    :param str path_input: Путь к входному файлу
+    :param str path_output: Путь к выходному файлу
+    :param Optional[int] limit: Количество первых источников списка для вывода
+    :param str output_format: Формат выходного файла
+    :param bool use_snapshot: Использование ранее сохраненного снимка прочитанных строк рабочей книги
+    :param Optional[StageTimings] timings: Время выполнения этапов обработки
+    :param bool dedup: Объединение повторяющихся источников (индекс ключей источников хранится в памяти)
+    """
+
+    from dedup import DedupIndex  # pylint: disable=C0415
+    from readers.reader import SourcesReader  # pylint: disable=C0415
+
+    timings = timings or StageTimings()
+    entries = get_format_renderer(output_format).entries
+    index = DedupIndex() if dedup else None
+    with timings.measure(f"{citation}: чтение, форматирование и генерация"):
+        with SourcesReader(path_input, compact=True, snapshot=use_snapshot, located=dedup) as reader:
+            items = reader.iterate() if index is None else index.filter(reader.iterate())
+            rows = get_formatter(citation).stream(items, entries=entries)
+
+            logger.info("Генерация выходного файла ...")
+            create_renderer(citation, output_format, islice(rows, limit)).render(path_output)
+
+    if index is not None:
+        save_duplicates(index, path_output)
+
+
+def save_duplicates(index: DedupIndex, path_output: str) -> None:
+    """
+    Вывод сводки и сохранение отчета об объединенных источниках рядом с выходным файлом.
+
+    :param DedupIndex index: Индекс повторяющихся источников
+    :param str path_output: Путь к выходному файлу
+    """
+
+    from dedup import get_report_path, save_report  # pylint: disable=C0415
+
+    logger.info("Удаление повторов: %s.", index)
+    save_report(get_report_path(path_output), index.duplicates)
+
+
+def get_cached_report(cache: ResultCache, key: str, path_output: str) -> bool:
+    """
+    Копирование отчета об объединенных источниках из кэша результатов рядом с выходным файлом.
+
+    :param ResultCache cache: Кэш результатов
+    :param str key: Ключ кэша выходного файла
+    :param str path_output: Путь к выходному файлу
+    :return: Признак попадания в кэш
+    """
+
+    from dedup import REPORT_SUFFIX, get_report_path  # pylint: disable=C0415
+
+    return cache.get(f"{key}{REPORT_SUFFIX}", get_report_path(path_output))
+
+
+def put_cached_report(cache: ResultCache, key: str, path_output: str) -> None:
+    """
+    Сохранение отчета об объединенных источниках в кэш результатов вместе с выходным файлом.
+
+    :param ResultCache cache: Кэш результатов
+    :param str key: Ключ кэша выходного файла
+    :param str path_output: Путь к выходному файлу
+    """
+
+    from dedup import REPORT_SUFFIX, get_report_path  # pylint: disable=C0415
+
+    cache.put(f"{key}{REPORT_SUFFIX}", get_report_path(path_output))
 
 
 def get_formatter(style: str) -> type[BaseCitationFormatter]:
@@ -95,26 +830,50 @@ def get_formatter(style: str) -> type[BaseCitationFormatter]:
 
     :return: форматтер для заданного стиля цитирования.
     """
-    format_styles_map = {
-        CitationEnum.GOST.name: GOSTCitationFormatter,
-        CitationEnum.APA.name: APACitationFormatter
-    }
-    return format_styles_map.get(style)
+    return resolve(FORMATTERS[style])
 
 
-def get_renderer(style: str) -> type[BaseRenderer]:
+def get_renderer(style: str) -> type[DocxRenderer]:
     """
-    Возвращает объект BaseRenderer для указанного стиля цитирования.
+    Возвращает объект DocxRenderer для указанного стиля цитирования.
 
     :param str style: Стиль цитирования
 
     :return: рендерер для заданного стиля цитирования.
     """
-    render_styles_map = {
-        CitationEnum.GOST.name: GOSTRenderer,
-        CitationEnum.APA.name: APARenderer
-    }
-    return render_styles_map.get(style)
+    return resolve(STYLE_RENDERERS[style])
+
+
+def get_format_renderer(output_format: str) -> type[BaseRenderer]:
+    """
+    Возвращает рендерер для указанного формата выходного файла (для DOCX – базовый класс рендереров стилей).
+
+    :param str output_format: Формат выходного файла
+
+    :return: рендерер для заданного формата выходного файла.
+    """
+    return resolve(FORMAT_RENDERERS[output_format])
+
+
+def create_renderer(style: str, output_format: str, rows: Iterable[Any]) -> BaseRenderer:
+    """
+    Создание рендерера для указанного стиля цитирования и формата выходного файла.
+
+    Для текстовых форматов заголовок и нумерация списка соответствуют Word-файлу стиля цитирования.
+
+    :param str style: Стиль цитирования
+    :param str output_format: Формат выходного файла
+    :param Iterable[Any] rows: Отформатированные строки (или пары строк и источников)
+
+    :return: рендерер.
+    """
+    renderer = get_renderer(style)
+    if output_format == FormatEnum.DOCX.name:
+        return renderer(rows, streaming=True)
+
+    return get_format_renderer(output_format)(  # type: ignore
+        rows, title=renderer.title, numbered=renderer.numbered
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,351 @@
+"""
+Функции для сбора метрик выполнения.
+"""
+import cProfile
+import json
+import pstats
+import resource
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+
+def get_peak_rss() -> int:
+    """
+    Получение пикового объема резидентной памяти (RSS) текущего процесса.
+
+    :return: Объем памяти в байтах.
+    """
+
+    # в Linux значение `ru_maxrss` возвращается в килобайтах
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@dataclass
+class CacheStats:
+    """
+    Статистика обращений к кэшу.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Получение доли попаданий.
+
+        :return: Доля попаданий (0, если обращений не было).
+        """
+
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return f"попаданий – {self.hits}, промахов – {self.misses} ({self.hit_rate:.0%} попаданий)"
+
+
+@dataclass
+class StageStats:
+    """
+    Показатели этапа обработки (суммарно по всем вызовам этапа).
+    """
+
+    calls: int = 0
+    # время выполнения этапа и время без вложенных этапов (в секундах)
+    elapsed: float = 0.0
+    own: float = 0.0
+    # количество обработанных записей (источников, строк)
+    entries: int = 0
+    # наибольший по вызовам пиковый прирост памяти, выделенной во время этапа (в байтах, см. `tracemalloc`)
+    peak_memory: int = 0
+
+    @property
+    def entries_per_second(self) -> float:
+        """
+        Получение скорости обработки записей.
+
+        :return: Количество записей в секунду (0, если записи не учитывались).
+        """
+
+        return self.entries / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Получение показателей для отчета.
+
+        :return: Словарь показателей.
+        """
+
+        return {
+            "calls": self.calls,
+            "elapsed": round(self.elapsed, 6),
+            "own": round(self.own, 6),
+            "entries": self.entries,
+            "entries_per_second": round(self.entries_per_second, 1),
+            "peak_memory": self.peak_memory,
+        }
+
+
+class StageRun:
+    """
+    Выполнение этапа обработки: количество обработанных записей, время вложенных этапов
+    и объем отслеживаемой памяти.
+    """
+
+    def __init__(self, counted: bool = True) -> None:
+        """
+        Конструктор.
+
+        :param bool counted: Учет записей, проходящих через `count()` (без профилирования записи не учитываются).
+        """
+
+        self.counted = counted
+        self.entries = 0
+        self.nested = 0.0
+        # объем отслеживаемой памяти в начале этапа и его пиковое значение во время этапа (в байтах)
+        self.memory_start = 0
+        self.memory_peak = 0
+
+    def count(self, items: Iterable[T]) -> Iterable[T]:
+        """
+        Учет записей, обрабатываемых этапом по мере получения.
+
+        :param Iterable[T] items: Записи.
+        :return: Те же записи (без профилирования – тот же объект без обертки).
+        """
+
+        if not self.counted:
+            return items
+
+        return self.iterate(items)
+
+    def iterate(self, items: Iterable[T]) -> Iterator[T]:
+        """
+        Генератор записей с подсчетом их количества.
+
+        :param Iterable[T] items: Записи.
+        :return: Генератор записей.
+        """
+
+        for item in items:
+            self.entries += 1
+            yield item
+
+
+class StageTimings:
+    """
+    Время выполнения этапов обработки.
+
+    Этапы могут выполняться в разных потоках (например, форматирование нескольких стилей цитирования),
+    показатели этапа с одним наименованием суммируются. Вложенные этапы (например, проверка строк во время
+    чтения) учитываются отдельно, время без вложенных этапов позволяет найти самый долгий этап.
+
+    При профилировании (см. `profiling`) этапы чтения, форматирования и генерации замеряются внутри
+    читателей, форматтеров и рендереров через `measure_stage`, а для одного выбранного этапа собирается
+    статистика cProfile.
+
+    Пиковый объем памяти этапа определяется по `tracemalloc`, если отслеживание памяти запущено: пиковое значение
+    сбрасывается в начале и по завершении каждого этапа и учитывается во всех выполняемых в этот момент этапах.
+    Отслеживание охватывает все потоки, поэтому этапы, выполняемые параллельно, учитывают память друг друга.
+    """
+
+    def __init__(self, profile_stage: Optional[str] = None) -> None:
+        """
+        Конструктор.
+
+        :param Optional[str] profile_stage: Наименование этапа для сбора статистики cProfile.
+        """
+
+        self.stages: dict[str, StageStats] = {}
+        self.lock = threading.Lock()
+        # стек выполняемых этапов каждого потока
+        self.local = threading.local()
+        self.profile_stage = profile_stage
+        self.profiles: list[cProfile.Profile] = []
+        # этапы всех потоков, выполняемые при отслеживании памяти
+        self.traced: list[StageRun] = []
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[StageRun]:
+        """
+        Замер времени выполнения, количества записей и пикового прироста памяти этапа.
+
+        :param str stage: Наименование этапа.
+        :return: Выполнение этапа для учета обработанных записей.
+        """
+
+        run = StageRun()
+        runs = self.local.__dict__.setdefault("runs", [])
+        # этапы перечисляются в отчете в порядке начала выполнения
+        with self.lock:
+            stats = self.stages.setdefault(stage, StageStats())
+            if tracemalloc.is_tracing():
+                run.memory_start = run.memory_peak = self.update_memory()
+                self.traced.append(run)
+        profile = self.start_profile() if stage == self.profile_stage else None
+        runs.append(run)
+        started = time.perf_counter()
+        try:
+            yield run
+        finally:
+            elapsed = time.perf_counter() - started
+            runs.pop()
+            if runs:
+                runs[-1].nested += elapsed
+            if profile is not None:
+                profile.disable()
+                self.local.profile = None
+            with self.lock:
+                if run in self.traced:
+                    self.update_memory()
+                    self.traced.remove(run)
+                    stats.peak_memory = max(stats.peak_memory, run.memory_peak - run.memory_start)
+                stats.calls += 1
+                stats.elapsed += elapsed
+                stats.own += elapsed - run.nested
+                stats.entries += run.entries
+                if profile is not None:
+                    self.profiles.append(profile)
+
+    def update_memory(self) -> int:
+        """
+        Учет пикового объема отслеживаемой памяти с предыдущего начала или завершения этапа во всех выполняемых
+        этапах и сброс пикового значения (вызывается под блокировкой).
+
+        :return: Текущий объем отслеживаемой памяти в байтах.
+        """
+
+        current, peak = tracemalloc.get_traced_memory()
+        for run in self.traced:
+            run.memory_peak = max(run.memory_peak, peak)
+        tracemalloc.reset_peak()
+
+        return current
+
+    def start_profile(self) -> Optional[cProfile.Profile]:
+        """
+        Запуск сбора статистики cProfile в текущем потоке.
+
+        :return: Профилировщик или `None`, если в потоке уже выполняется профилирование (вложенный вызов этапа
+            собирается профилировщиком внешнего вызова).
+        """
+
+        if getattr(self.local, "profile", None) is not None:
+            return None
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # другой инструмент профилирования уже запущен
+            return None
+        self.local.profile = profile
+
+        return profile
+
+    @property
+    def hot_stage(self) -> Optional[str]:
+        """
+        Получение этапа с наибольшим временем выполнения без учета вложенных этапов.
+
+        :return: Наименование этапа или `None`, если этапы не замерялись.
+        """
+
+        return max(self.stages, key=lambda stage: self.stages[stage].own, default=None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Получение отчета о выполнении этапов.
+
+        :return: Словарь с показателями этапов, самым долгим этапом и пиковым объемом памяти процесса.
+        """
+
+        with self.lock:
+            stages = {stage: stats.to_dict() for stage, stats in self.stages.items()}
+
+        return {"stages": stages, "hot_stage": self.hot_stage, "peak_rss": get_peak_rss()}
+
+    def save_report(self, path: Union[Path, str]) -> None:
+        """
+        Сохранение отчета о выполнении этапов в формате JSON.
+
+        :param Union[Path, str] path: Путь к файлу отчета.
+        """
+
+        Path(path).write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=1), encoding="utf-8")
+
+    def dump_profile(self, path: Union[Path, str]) -> bool:
+        """
+        Сохранение объединенной статистики cProfile профилируемого этапа (для `pstats` и `snakeviz`).
+
+        :param Union[Path, str] path: Путь к файлу статистики.
+        :return: Признак сохранения (`False`, если этап не выполнялся).
+        """
+
+        if not self.profiles:
+            return False
+
+        stats = pstats.Stats(*self.profiles)
+        stats.dump_stats(str(path))
+
+        return True
+
+    def __str__(self) -> str:
+        return "; ".join(f"{stage} – {stats.elapsed:.3f} с" for stage, stats in self.stages.items())
+
+
+# время этапов запуска с профилированием: этапы внутри читателей, форматтеров и рендереров замеряются,
+# только пока профилирование включено, поэтому параллельные запросы сервиса не смешивают показатели
+_profiled: Optional[StageTimings] = None
+
+
+@contextmanager
+def profiling(timings: StageTimings, trace_memory: bool = True) -> Iterator[StageTimings]:
+    """
+    Включение замера этапов внутри читателей, форматтеров и рендереров (см. `measure_stage`).
+
+    :param StageTimings timings: Время выполнения этапов, в которое добавляются замеры.
+    :param bool trace_memory: Отслеживание памяти для замера пикового объема памяти этапов
+        (замедляет выделение памяти, поэтому увеличивает время этапов).
+    :return: То же время выполнения этапов.
+    """
+
+    global _profiled  # pylint: disable=W0603
+    previous, _profiled = _profiled, timings
+    # отслеживание памяти, запущенное ранее (например, `python -X tracemalloc`), не останавливается
+    started = trace_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield timings
+    finally:
+        if started:
+            tracemalloc.stop()
+        _profiled = previous
+
+
+@contextmanager
+def measure_stage(stage: str) -> Iterator[StageRun]:
+    """
+    Замер этапа обработки при включенном профилировании (см. `profiling`), без профилирования этап
+    не замеряется.
+
+    :param str stage: Наименование этапа.
+    :return: Выполнение этапа для учета обработанных записей.
+    """
+
+    timings = _profiled
+    if timings is None:
+        yield StageRun(counted=False)
+        return
+
+    with timings.measure(stage) as run:
+        yield run
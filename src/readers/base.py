@@ -2,29 +2,153 @@
 Функции чтения исходного файла.
 """
 
+import re
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Type
+from functools import cached_property
+from itertools import islice
+from typing import Any, Callable, Iterator, Optional, Type, Union
 from openpyxl.workbook import Workbook
 from pydantic import BaseModel
+from formatters.records import RECORDS, Source
 from logger import get_logger
+from metrics import measure_stage
+from readers.batch import build_models
+from settings import READ_BATCH_SIZE
 
 logger = get_logger(__name__)
 
+# источник вместе с расположением во входных данных: наименование листа рабочей книги и номер строки
+# (для файлов CSV и JSON Lines – номер строки файла, для колоночного формата – номер записи)
+Located = tuple[str, int, Source]
+
+
+def to_int(value: Any) -> int:
+    """
+    Преобразование значения ячейки в целое число.
+
+    Значение, которое не удается преобразовать, возвращается без изменений: проверка значений столбца
+    и валидация модели сообщают об ошибке вместе с наименованием листа, номером строки и атрибутом
+    (см. `readers.batch.build_models`), а ошибки остальных строк листа также собираются.
+
+    :param value: Значение ячейки.
+    :return: Целое число (или исходное значение ячейки, если оно не является целым числом).
+    """
+
+    try:
+        return int(str(value))
+    except ValueError:
+        return value
+
+
+def to_str(value: Any) -> str:
+    """
+    Преобразование значения ячейки в строку без пробельных символов по краям.
+
+    :param value: Значение ячейки.
+    :return: Строка.
+    """
+
+    return str(value).strip()
+
+
+def to_date(value: Any) -> Any:
+    """
+    Преобразование значения ячейки с датой в строку формата `ДД.ММ.ГГГГ`.
+
+    Значения, не являющиеся датой, возвращаются без изменений.
+
+    :param value: Значение ячейки.
+    :return: Строка с датой.
+    """
+
+    # форматирование через оператор `%` быстрее `strftime("%d.%m.%Y")` при том же результате
+    return "%02d.%02d.%04d" % (value.day, value.month, value.year) if isinstance(value, date) else value
+
+
+def to_any(value: Any) -> Any:
+    """
+    Значение ячейки для атрибутов без заданного преобразования.
+
+    :param value: Значение ячейки.
+    :return: Значение ячейки без изменений.
+    """
+
+    return value
+
+
+# функции преобразования значений ячеек по типу данных атрибута
+CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    int: to_int,
+    str: to_str,
+    date: to_date,
+}
+
+
+def compile_plan(attributes: dict) -> tuple[tuple[str, int, Callable[[Any], Any]], ...]:
+    """
+    Построение плана извлечения атрибутов из строки.
+
+    :param attributes: Атрибуты с информацией об индексе столбца и типе данных (см. `BaseReader.attributes`).
+    :return: Кортеж из наименования атрибута, индекса столбца и функции преобразования значения.
+    """
+
+    plan = []
+    for attr, params in attributes.items():
+        ((index, data_type),) = params.items()
+        plan.append((attr, index, CONVERTERS.get(data_type, to_any)))
+
+    return tuple(plan)
+
+
+class RowSource(ABC):
+    """
+    Базовый класс источника строк в формате, отличном от рабочей книги Excel (см. `readers.formats`).
+
+    Строки каждого типа источника передаются читателю в виде кортежей значений в порядке индексов столбцов,
+    заданных в `BaseReader.attributes`, поэтому модели собираются так же, как из строк листа рабочей книги.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к исходному файлу (директории) для чтения.
+        """
+
+        self.path = path
+
+    @abstractmethod
+    def iter_rows(self, reader: "BaseReader") -> Iterator[tuple[int, tuple]]:
+        """
+        Ленивое чтение строк типа источника читателя.
+
+        :param reader: Читатель типа источника.
+        :return: Генератор из номера строки (записи) в исходном файле и кортежа значений.
+        """
+
+    def close(self) -> None:
+        """
+        Освобождение ресурсов источника строк.
+        """
+
 
 class BaseReader(ABC):
     """
     Базовый класс читателя исходного файла.
     """
 
-    def __init__(self, workbook: Workbook) -> None:
+    def __init__(self, workbook: Optional[Union[Workbook, RowSource]] = None, compact: bool = False) -> None:
         """
         Конструктор.
 
-        :param workbook: Рабочая книга Excel.
+        :param workbook: Рабочая книга Excel или источник строк другого формата (не требуется для сборки моделей
+            из строк, прочитанных в другом процессе).
+        :param compact: Чтение строк в компактные записи (см. `formatters.records`) вместо моделей pydantic.
         """
 
         self.workbook = workbook
+        self.compact = compact
 
     @property
     @abstractmethod
@@ -65,40 +189,170 @@ class BaseReader(ABC):
         :return: Атрибуты с информацией об индексе столбца и типе данных
         """
 
-    def read(self) -> list[BaseModel]:
+    @cached_property
+    def source_type(self) -> str:
         """
-        Чтение исходного файла.
+        Получение наименования типа источника для форматов, отличных от рабочей книги (см. `readers.formats`).
 
-        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        Наименование строится по имени модели: `BookModel` – `book`, `InternetResourceModel` – `internet_resource`.
+
+        :return: Наименование типа источника.
         """
 
-        models = []
-        # чтение со второй строки таблицы (первая строка содержит заголовок)
-        for row in self.workbook[self.sheet].iter_rows(min_row=2):
+        return re.sub(r"(?<!^)(?=[A-Z])", "_", self.model.__name__.removesuffix("Model")).lower()
+
+    def rows(self) -> Iterator[tuple[int, tuple]]:
+        """
+        Ленивое чтение строк листа рабочей книги (или источника строк другого формата) в виде кортежей значений.
+
+        Строки, в которых не заполнен первый (обязательный) столбец, пропускаются.
+
+        :return: Генератор из номера строки на листе и кортежа значений ячеек.
+        """
+
+        if isinstance(self.workbook, RowSource):
+            rows = self.workbook.iter_rows(self)
+        else:
+            # чтение со второй строки таблицы (первая строка содержит заголовок)
+            rows = enumerate(self.workbook[self.sheet].iter_rows(min_row=2, values_only=True), start=2)
+
+        for number, row in rows:
             # обработка строки идет только, если заполнены обязательные столбцы
-            if row[0].value:
-                attrs = {}
+            if row and row[0]:
+                yield number, row
+
+    @cached_property
+    def plan(self) -> tuple[tuple[str, int, Callable[[Any], Any]], ...]:
+        """
+        Получение плана извлечения атрибутов из строки.
+
+        План строится один раз для читателя на основе атрибутов, заданных в методе `attributes()`:
+
+        .. code-block::
+
+            (
+                ("authors", 0, to_str),
+                ...
+                ("year", 5, to_int),
+            )
+
+        :return: Кортеж из наименования атрибута, индекса столбца и функции преобразования значения.
+        """
+
+        return compile_plan(self.attributes)
+
+    @cached_property
+    def fields(self) -> tuple[str, ...]:
+        """
+        Получение наименований атрибутов в порядке плана чтения.
+
+        :return: Наименования атрибутов.
+        """
+
+        return tuple(attr for attr, _, _ in self.plan)
+
+    @cached_property
+    def width(self) -> int:
+        """
+        Получение минимального количества столбцов строки, необходимого для извлечения всех атрибутов.
+
+        :return: Количество столбцов.
+        """
+
+        return max(index for _, index, _ in self.plan) + 1
+
+    def convert(self, row: tuple) -> tuple:
+        """
+        Извлечение значений атрибутов модели из строки по плану чтения.
+
+        :param row: Кортеж значений ячеек строки.
+        :return: Кортеж значений атрибутов в порядке плана чтения.
+        """
 
-                # обработка заданных в методе `attributes()` атрибутов
-                for attr, params in self.attributes.items():
-                    index, data_type = list(params.items())[0]
-                    attrs[attr] = row[index].value
+        # в режиме только для чтения пустые ячейки в конце строки могут отсутствовать
+        if len(row) < self.width:
+            row = row + (None,) * (self.width - len(row))
 
-                    if not attrs[attr]:
-                        continue
+        # пустые значения передаются в модель без преобразования
+        return tuple([converter(value) if (value := row[index]) else value for _, index, converter in self.plan])
 
-                    if data_type is int:
-                        attrs[attr] = int(str(attrs.get(attr)))
+    def payloads(self) -> tuple[list[int], list[tuple]]:
+        """
+        Чтение строк листа в компактном виде (в том числе для передачи между процессами).
+
+        :return: Номера строк на листе и список кортежей значений атрибутов в порядке плана чтения.
+        """
+
+        numbers, payloads = [], []
+        convert = self.convert
+        with measure_stage("чтение строк") as stage:
+            for number, row in self.rows():
+                numbers.append(number)
+                payloads.append(convert(row))
+            stage.entries = len(payloads)
 
-                    if data_type is str:
-                        attrs[attr] = str(attrs.get(attr)).strip()
+        return numbers, payloads
 
-                    if data_type is date:
-                        value = attrs.get(attr)
-                        if isinstance(value, date):
-                            attrs[attr] = value.strftime("%d.%m.%Y")
+    def build(self, numbers: list[int], payloads: list[tuple]) -> list[Source]:
+        """
+        Пакетная сборка моделей из значений атрибутов, полученных методом `payloads()`.
+
+        Типы значений проверяются сразу для каждого столбца, строки без ошибок собираются без повторной валидации.
 
-                # добавление считанной и обработанной строки в список моделей
-                models.append(self.model(**attrs))
+        :param numbers: Номера строк на листе рабочей книги.
+        :param payloads: Список кортежей значений атрибутов в порядке плана чтения.
+        :raises ReaderValidationError: Если хотя бы одна строка не прошла валидацию.
+        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        record = RECORDS[self.model] if self.compact else None
+        with measure_stage("проверка и сборка моделей") as stage:
+            models = build_models(self.model, self.sheet, self.fields, numbers, payloads, record)
+            stage.entries = len(payloads)
 
         return models
+
+    def batches(self) -> Iterator[tuple[list[int], list[Source]]]:
+        """
+        Ленивое чтение моделей строк исходного файла пакетами по `READ_BATCH_SIZE` строк.
+
+        :return: Генератор номеров строк и моделей строк пакета.
+        """
+
+        convert = self.convert
+        rows = self.rows()
+        while True:
+            numbers, payloads = [], []
+            # чтение строк пакета замеряется отдельно от обработки моделей пакета получателем генератора
+            with measure_stage("чтение строк") as stage:
+                for number, row in islice(rows, READ_BATCH_SIZE):
+                    numbers.append(number)
+                    payloads.append(convert(row))
+                stage.entries = len(payloads)
+
+            yield numbers, self.build(numbers, payloads)
+            if len(payloads) < READ_BATCH_SIZE:
+                return
+
+    def iterate(self) -> Iterator[Source]:
+        """
+        Ленивое чтение моделей строк исходного файла.
+
+        Модели собираются пакетами по `READ_BATCH_SIZE` строк (см. `batches()`).
+
+        :return: Генератор моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        for _, models in self.batches():
+            yield from models
+
+    def read(self) -> list[Source]:
+        """
+        Чтение исходного файла.
+
+        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        numbers, payloads = self.payloads()
+
+        return self.build(numbers, payloads)
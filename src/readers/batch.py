@@ -0,0 +1,216 @@
+"""
+Пакетная сборка моделей из строк листа рабочей книги.
+
+Вместо валидации каждой строки моделью pydantic типы значений проверяются сразу для всего столбца,
+а строки, прошедшие проверку, собираются без повторной валидации.
+"""
+from operator import itemgetter
+from typing import Any, Callable, Optional, Type
+
+from pydantic import BaseModel, ConstrainedInt, ValidationError
+from pydantic.fields import ModelField
+
+from formatters.records import BaseRecord, Source
+
+# проверка значений столбца: возвращает `True`, если все значения допустимы для атрибута модели
+ColumnCheck = Callable[[list], bool]
+
+
+class ReaderValidationError(ValueError):
+    """
+    Ошибка валидации строк листа рабочей книги.
+    """
+
+    def __init__(self, errors: list[tuple[str, int, str]]) -> None:
+        """
+        Конструктор.
+
+        :param errors: Список ошибок в виде наименования листа, номера строки и описания ошибки.
+        """
+
+        self.errors = errors
+        super().__init__(
+            "\n".join(f'Лист "{sheet}", строка {number}: {message}' for sheet, number, message in errors)
+        )
+
+
+def get_bounds_check(field: ModelField) -> Optional[Callable[[Any], bool]]:
+    """
+    Получение проверки числовых ограничений атрибута (`gt`, `ge`, `lt`, `le`).
+
+    :param field: Атрибут модели.
+    :return: Проверка значения или `None`, если ограничения не заданы.
+    """
+
+    gt, ge, lt, le = (getattr(field.field_info, name) for name in ("gt", "ge", "lt", "le"))
+    if gt is None and ge is None and lt is None and le is None:
+        return None
+
+    def check(value: Any) -> bool:
+        return (
+            (gt is None or value > gt)
+            and (ge is None or value >= ge)
+            and (lt is None or value < lt)
+            and (le is None or value <= le)
+        )
+
+    return check
+
+
+def get_column_check(field: ModelField) -> ColumnCheck:
+    """
+    Получение проверки значений столбца для атрибута модели.
+
+    Поддерживаются строковые и целочисленные атрибуты (в том числе с числовыми ограничениями).
+    Для остальных типов проверка всегда неуспешна, и строки валидируются моделью pydantic.
+
+    :param field: Атрибут модели.
+    :return: Проверка значений столбца.
+    """
+
+    allowed: set[type] = {type(None)} if field.allow_none else set()
+    bounds = None
+    if field.type_ is str:
+        allowed.add(str)
+    elif field.type_ is int or (
+        issubclass(field.type_, ConstrainedInt) and not field.type_.strict and field.type_.multiple_of is None
+    ):
+        allowed.add(int)
+        bounds = get_bounds_check(field)
+    else:
+        return lambda column: False
+
+    def check(column: list) -> bool:
+        # проверка типов значений выполняется без цикла на уровне Python
+        if not set(map(type, column)) <= allowed:
+            return False
+        if bounds is None:
+            return True
+
+        return all(map(bounds, (value for value in column if value is not None)))
+
+    return check
+
+
+def get_column_checks(model: Type[BaseModel], fields: tuple[str, ...]) -> tuple[ColumnCheck, ...]:
+    """
+    Получение проверок значений столбцов для атрибутов модели.
+
+    :param model: Модель объекта (строки).
+    :param fields: Наименования атрибутов в порядке значений строки.
+    :return: Проверки значений столбцов в порядке атрибутов.
+    """
+
+    return tuple(get_column_check(model.__fields__[field]) for field in fields)
+
+
+def is_trusted(model: Type[BaseModel], fields: tuple[str, ...]) -> bool:
+    """
+    Проверка возможности сборки модели без валидации.
+
+    Сборка без валидации допустима, если строка содержит все атрибуты модели в порядке их объявления,
+    а модель не содержит собственных валидаторов и преобразований строк, которые пропускались бы при сборке.
+
+    :param model: Модель объекта (строки).
+    :param fields: Наименования атрибутов в порядке значений строки.
+    :return: Признак возможности сборки модели без валидации.
+    """
+
+    config = model.__config__
+
+    return (
+        fields == tuple(model.__fields__)
+        and not model.__validators__
+        and not model.__pre_root_validators__
+        and not model.__post_root_validators__
+        and not config.anystr_strip_whitespace
+        and not config.anystr_lower
+        and not config.anystr_upper
+        and not config.min_anystr_length
+        and config.max_anystr_length is None
+    )
+
+
+def find_invalid_rows(checks: tuple[ColumnCheck, ...], payloads: list[tuple]) -> set[int]:
+    """
+    Поиск строк, не прошедших проверку значений столбцов.
+
+    :param checks: Проверки значений столбцов в порядке атрибутов.
+    :param payloads: Список кортежей значений атрибутов.
+    :return: Индексы строк в списке `payloads`.
+    """
+
+    invalid: set[int] = set()
+    for index, check in enumerate(checks):
+        column = list(map(itemgetter(index), payloads))
+        if check(column):
+            continue
+
+        # поиск конкретных строк выполняется только для столбцов, не прошедших проверку целиком
+        invalid.update(number for number, value in enumerate(column) if not check([value]))
+
+    return invalid
+
+
+def build_models(
+    model: Type[BaseModel],
+    sheet: str,
+    fields: tuple[str, ...],
+    numbers: list[int],
+    payloads: list[tuple],
+    record: Optional[Type[BaseRecord]] = None,
+) -> list[Source]:
+    """
+    Пакетная сборка моделей из строк листа рабочей книги.
+
+    Строки, прошедшие проверку значений столбцов, собираются без валидации.
+    Остальные строки валидируются моделью pydantic: значения, которые модель может привести к нужному типу,
+    обрабатываются так же, как при построчной валидации, а ошибки собираются для всех строк листа.
+
+    :param model: Модель объекта (строки).
+    :param sheet: Наименование листа рабочей книги.
+    :param fields: Наименования атрибутов в порядке значений строки.
+    :param numbers: Номера строк на листе рабочей книги.
+    :param payloads: Список кортежей значений атрибутов.
+    :param record: Компактная запись, создаваемая вместо модели (см. `formatters.records`).
+    :raises ReaderValidationError: Если хотя бы одна строка не прошла валидацию.
+    :return: Список моделей (или записей) строк.
+    """
+
+    if not payloads:
+        return []
+
+    invalid = find_invalid_rows(get_column_checks(model, fields), payloads)
+
+    trusted = is_trusted(model, fields)
+    create = model.__new__
+    setattr_ = object.__setattr__
+
+    models: list[Source] = []
+    errors = []
+    for index, payload in enumerate(payloads):
+        if index in invalid or not trusted:
+            try:
+                validated = model(**dict(zip(fields, payload)))
+            except ValidationError as ex:
+                message = "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in ex.errors())
+                errors.append((sheet, numbers[index], message))
+            else:
+                models.append(record.from_model(validated) if record else validated)
+            continue
+
+        if record:
+            # порядок атрибутов записи совпадает с порядком атрибутов модели
+            models.append(record(*payload))
+            continue
+
+        values = dict(zip(fields, payload))
+        instance = create(model)
+        setattr_(instance, "__dict__", values)
+        setattr_(instance, "__fields_set__", set(fields))
+        models.append(instance)
+
+    if errors:
+        raise ReaderValidationError(errors)
+
+    return models
@@ -0,0 +1,362 @@
+"""
+Чтение и запись исходных данных в форматах, отличных от рабочей книги Excel.
+
+Поддерживаются форматы:
+
+- CSV – директория с файлами `<тип источника>.csv` (по одному файлу на тип источника, первая строка – заголовок,
+  столбцы расположены в том же порядке, что и на листах рабочей книги);
+- JSON Lines – файл `*.jsonl`, каждая строка которого содержит объект с атрибутами модели и наименованием
+  типа источника в ключе `source_type`;
+- колоночный двоичный формат – файл `*.bibcol`, в котором значения каждого столбца хранятся подряд: целые числа
+  в виде массива `array("q")`, строки – одним блоком UTF-8 с разделителем `\\0`.
+
+Наименования типов источников – `BaseReader.source_type` (`book`, `internet_resource`, `articles_collection`,
+`dissertation`, `normative_act`). Даты во всех форматах записываются строками `ДД.ММ.ГГГГ`.
+Значения передаются читателям в порядке индексов столбцов из `BaseReader.attributes`, поэтому модели
+собираются так же, как из строк листа рабочей книги.
+"""
+import array
+import csv
+import json
+import struct
+import sys
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional, Type
+
+from readers.base import BaseReader, RowSource
+
+# ключ наименования типа источника в записях формата JSON Lines
+SOURCE_TYPE_KEY = "source_type"
+# расширение файлов формата JSON Lines
+JSON_LINES_SUFFIX = ".jsonl"
+
+# расширение файлов колоночного двоичного формата
+COLUMNAR_SUFFIX = ".bibcol"
+# сигнатура файла колоночного двоичного формата (с версией формата)
+COLUMNAR_MAGIC = b"BIBCOL1\n"
+# вид столбца колоночного формата: целые числа или строки
+INT_COLUMN = b"q"
+STR_COLUMN = b"s"
+# заголовки: количество таблиц; длина наименования таблицы; количество строк и столбцов; вид и размер столбца
+TABLES_HEADER = struct.Struct("<I")
+NAME_HEADER = struct.Struct("<H")
+TABLE_HEADER = struct.Struct("<IH")
+COLUMN_HEADER = struct.Struct("<cQ")
+
+
+def get_columns(reader: BaseReader) -> list[tuple[Optional[str], Optional[type]]]:
+    """
+    Получение наименований атрибутов и типов данных в порядке индексов столбцов.
+
+    :param reader: Читатель типа источника.
+    :return: Список из наименования атрибута и типа данных для каждого столбца (`None` для неиспользуемых столбцов).
+    """
+
+    columns: list[tuple[Optional[str], Optional[type]]] = [(None, None)] * reader.width
+    for attr, params in reader.attributes.items():
+        ((index, data_type),) = params.items()
+        columns[index] = (attr, data_type)
+
+    return columns
+
+
+class CSVSource(RowSource):
+    """
+    Чтение директории с файлами CSV (по одному файлу на тип источника).
+    """
+
+    def iter_rows(self, reader: BaseReader) -> Iterator[tuple[int, tuple]]:
+        path = Path(self.path) / f"{reader.source_type}.csv"
+        if not path.exists():
+            return
+
+        # кодировка `utf-8-sig` допускает файлы, сохраненные из Excel с меткой порядка байтов
+        with open(path, encoding="utf-8-sig", newline="") as file:
+            rows = csv.reader(file)
+            # первая строка содержит заголовок
+            next(rows, None)
+            for number, row in enumerate(rows, start=2):
+                # пустые значения соответствуют пустым ячейкам рабочей книги
+                yield number, tuple([value or None for value in row])
+
+    @staticmethod
+    def write(path: str, tables: Iterable[tuple[BaseReader, list[tuple]]]) -> None:
+        """
+        Запись строк в директорию с файлами CSV.
+
+        :param path: Путь к директории.
+        :param tables: Читатели типов источников и строки в порядке индексов столбцов.
+        """
+
+        Path(path).mkdir(parents=True, exist_ok=True)
+        for reader, rows in tables:
+            with open(Path(path) / f"{reader.source_type}.csv", "w", encoding="utf-8", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow([attr or "" for attr, _ in get_columns(reader)])
+                writer.writerows(rows)
+
+
+class JSONLinesSource(RowSource):
+    """
+    Чтение файла формата JSON Lines.
+
+    Записи разных типов источников могут чередоваться, поэтому при первом обращении файл читается целиком
+    и записи группируются по типу источника.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.groups: Optional[dict[str, list[tuple[int, dict]]]] = None
+
+    def load(self) -> dict[str, list[tuple[int, dict]]]:
+        """
+        Чтение записей файла с группировкой по типу источника.
+
+        :return: Номера строк файла и записи для каждого типа источника.
+        """
+
+        groups: dict[str, list[tuple[int, dict]]] = {}
+        with open(self.path, encoding="utf-8") as file:
+            for number, line in enumerate(file, start=1):
+                if line.strip():
+                    record = json.loads(line)
+                    groups.setdefault(record.get(SOURCE_TYPE_KEY), []).append((number, record))
+
+        return groups
+
+    def iter_rows(self, reader: BaseReader) -> Iterator[tuple[int, tuple]]:
+        if self.groups is None:
+            self.groups = self.load()
+
+        # для неиспользуемых столбцов `dict.get(None)` возвращает `None`
+        names = [attr for attr, _ in get_columns(reader)]
+        for number, record in self.groups.get(reader.source_type, ()):
+            yield number, tuple(map(record.get, names))  # type: ignore
+
+    def close(self) -> None:
+        self.groups = None
+
+    @staticmethod
+    def write(path: str, tables: Iterable[tuple[BaseReader, list[tuple]]]) -> None:
+        """
+        Запись строк в файл формата JSON Lines.
+
+        :param path: Путь к файлу.
+        :param tables: Читатели типов источников и строки в порядке индексов столбцов.
+        """
+
+        with open(path, "w", encoding="utf-8") as file:
+            for reader, rows in tables:
+                names = [(index, attr) for index, (attr, _) in enumerate(get_columns(reader)) if attr]
+                for row in rows:
+                    record = {SOURCE_TYPE_KEY: reader.source_type, **{attr: row[index] for index, attr in names}}
+                    file.write(json.dumps(record, ensure_ascii=False))
+                    file.write("\n")
+
+
+# таблица колоночного формата: количество строк и столбцы (вид, признаки пустых значений, данные)
+Table = tuple[int, list[tuple[bytes, memoryview, memoryview]]]
+
+
+def decode_column(rows: int, kind: bytes, nulls: memoryview, data: memoryview) -> list:
+    """
+    Декодирование значений столбца колоночного формата.
+
+    :param rows: Количество строк.
+    :param kind: Вид столбца.
+    :param nulls: Признаки пустых значений.
+    :param data: Данные столбца.
+    :return: Список значений столбца.
+    """
+
+    values: list
+    if kind == INT_COLUMN:
+        numbers = array.array("q")
+        numbers.frombytes(data)
+        if sys.byteorder == "big":
+            numbers.byteswap()
+        values = numbers.tolist()
+    else:
+        values = str(data, "utf-8").split("\0") if rows else []
+
+    if 1 in nulls:
+        values = [None if null else value for value, null in zip(values, nulls)]
+
+    return values
+
+
+def encode_column(kind: bytes, values: list) -> tuple[bytes, bytes]:
+    """
+    Кодирование значений столбца колоночного формата.
+
+    :param kind: Вид столбца.
+    :param values: Значения столбца.
+    :raises ValueError: Если строковое значение содержит символ-разделитель `\\0`.
+    :return: Признаки пустых значений и данные столбца.
+    """
+
+    nulls = bytes(value is None for value in values)
+    if kind == INT_COLUMN:
+        numbers = array.array("q", [0 if value is None else value for value in values])
+        if sys.byteorder == "big":
+            numbers.byteswap()
+        return nulls, numbers.tobytes()
+
+    strings = ["" if value is None else str(value) for value in values]
+    if any("\0" in value for value in strings):
+        raise ValueError("Строковые значения не могут содержать символ \\0.")
+
+    return nulls, "\0".join(strings).encode("utf-8")
+
+
+def parse_tables(data: memoryview, offset: int) -> dict[str, Table]:
+    """
+    Разбор заголовков таблиц колоночного формата без копирования данных столбцов.
+
+    :param data: Содержимое файла.
+    :param offset: Смещение начала таблиц (после сигнатуры и заголовка файла).
+    :return: Таблицы по наименованиям.
+    """
+
+    (count,) = TABLES_HEADER.unpack_from(data, offset)
+    offset += TABLES_HEADER.size
+
+    tables = {}
+    for _ in range(count):
+        (length,) = NAME_HEADER.unpack_from(data, offset)
+        offset += NAME_HEADER.size
+        name = str(data[offset : offset + length], "utf-8")
+        offset += length
+        rows, width = TABLE_HEADER.unpack_from(data, offset)
+        offset += TABLE_HEADER.size
+
+        columns = []
+        for _ in range(width):
+            kind, size = COLUMN_HEADER.unpack_from(data, offset)
+            offset += COLUMN_HEADER.size
+            nulls = data[offset : offset + rows]
+            offset += rows
+            columns.append((kind, nulls, data[offset : offset + size]))
+            offset += size
+
+        tables[name] = (rows, columns)
+
+    return tables
+
+
+def write_tables(file: BinaryIO, tables: list[tuple[str, int, list[tuple[bytes, list]]]]) -> None:
+    """
+    Запись таблиц колоночного формата.
+
+    :param file: Файл, открытый для записи в двоичном режиме.
+    :param tables: Наименование, количество строк и столбцы (вид и значения) каждой таблицы.
+    :raises ValueError: Если значения столбца не могут быть закодированы.
+    """
+
+    file.write(TABLES_HEADER.pack(len(tables)))
+    for name, rows, columns in tables:
+        encoded = name.encode("utf-8")
+        file.write(NAME_HEADER.pack(len(encoded)) + encoded)
+        file.write(TABLE_HEADER.pack(rows, len(columns)))
+
+        for kind, values in columns:
+            nulls, data = encode_column(kind, values)
+            file.write(COLUMN_HEADER.pack(kind, len(data)))
+            file.write(nulls)
+            file.write(data)
+
+
+class ColumnarSource(RowSource):
+    """
+    Чтение файла колоночного двоичного формата.
+
+    Структура файла (порядок байтов – little-endian):
+
+    .. code-block::
+
+        сигнатура `COLUMNAR_MAGIC`, количество таблиц (uint32)
+        для каждой таблицы (типа источника):
+            длина наименования (uint16), наименование (UTF-8), количество строк (uint32) и столбцов (uint16)
+            для каждого столбца:
+                вид столбца (`q` или `s`) и размер данных (uint64)
+                признаки пустых значений (по байту на строку)
+                данные: массив int64 или строки в UTF-8, разделенные байтом `\\0`
+
+    Столбец строк декодируется и разделяется одним вызовом, поэтому чтение не требует разбора каждого значения.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.tables: Optional[dict[str, Table]] = None
+
+    def load(self) -> dict[str, Table]:
+        """
+        Чтение файла и разбор заголовков таблиц.
+
+        :raises ValueError: Если файл не является файлом колоночного формата.
+        :return: Таблицы по наименованиям типов источников.
+        """
+
+        with open(self.path, "rb") as file:
+            data = memoryview(file.read())
+
+        if data[: len(COLUMNAR_MAGIC)] != COLUMNAR_MAGIC:
+            raise ValueError(f"Файл {self.path} не является файлом колоночного формата.")
+
+        return parse_tables(data, len(COLUMNAR_MAGIC))
+
+    def iter_rows(self, reader: BaseReader) -> Iterator[tuple[int, tuple]]:
+        if self.tables is None:
+            self.tables = self.load()
+
+        if reader.source_type not in self.tables:
+            return
+
+        rows, columns = self.tables[reader.source_type]
+        values = [decode_column(rows, kind, nulls, data) for kind, nulls, data in columns]
+        yield from enumerate(zip(*values), start=1)
+
+    def close(self) -> None:
+        self.tables = None
+
+    @staticmethod
+    def write(path: str, tables: Iterable[tuple[BaseReader, list[tuple]]]) -> None:
+        """
+        Запись строк в файл колоночного двоичного формата.
+
+        :param path: Путь к файлу.
+        :param tables: Читатели типов источников и строки в порядке индексов столбцов.
+        """
+
+        encoded = []
+        for reader, rows in tables:
+            columns = [
+                (INT_COLUMN if data_type is int else STR_COLUMN, [row[index] for row in rows])
+                for index, (_, data_type) in enumerate(get_columns(reader))
+            ]
+            encoded.append((reader.source_type, len(rows), columns))
+
+        with open(path, "wb") as file:
+            file.write(COLUMNAR_MAGIC)
+            write_tables(file, encoded)
+
+
+# классы источников строк по расширению файла (директория читается как набор файлов CSV)
+FORMATS: dict[str, Type[RowSource]] = {
+    JSON_LINES_SUFFIX: JSONLinesSource,
+    COLUMNAR_SUFFIX: ColumnarSource,
+}
+
+
+def get_source_class(path: str) -> Optional[Type[RowSource]]:
+    """
+    Получение класса источника строк по пути к исходным данным.
+
+    :param path: Путь к исходному файлу (директории).
+    :return: Класс источника строк или `None` для рабочей книги Excel.
+    """
+
+    if Path(path).is_dir():
+        return CSVSource
+
+    return FORMATS.get(Path(path).suffix.lower())
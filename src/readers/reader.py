@@ -1,16 +1,25 @@
 """
 Чтение исходного файла.
 """
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
-from typing import Type
+from functools import cached_property
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Type, Union
 
 import openpyxl
 from openpyxl.workbook import Workbook
 
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel, DissertationModel, \
     NormativeActModel
+from formatters.records import RECORDS, Source
 from logger import get_logger
-from readers.base import BaseReader
+from metrics import measure_stage
+from readers.base import BaseReader, Located, RowSource
+from readers.formats import CSVSource, get_columns, get_source_class
+from readers.snapshot import Sheet, load_snapshot, save_snapshot
+from settings import READ_BATCH_SIZE, READ_WORKERS
 
 logger = get_logger(__name__)
 
@@ -159,26 +168,229 @@ class SourcesReader:
         NormativeActReader
     ]
 
-    def __init__(self, path: str) -> None:
+    def __init__(
+        self, path: str, read_only: bool = True, compact: bool = False, snapshot: bool = False, located: bool = False
+    ) -> None:
         """
         Конструктор.
 
-        :param path: Путь к исходному файлу для чтения.
+        :param path: Путь к исходному файлу для чтения (рабочая книга Excel, файл `*.jsonl`, файл `*.bibcol`
+            или директория с файлами CSV, см. `readers.formats`).
+        :param read_only: Потоковое чтение рабочей книги (только для чтения, без загрузки всех ячеек в память).
+        :param compact: Чтение строк в компактные записи (см. `formatters.records`) вместо моделей pydantic.
+        :param snapshot: Использование снимка прочитанных строк рабочей книги (см. `readers.snapshot`).
+        :param located: Чтение источников вместе с наименованием листа и номером строки (см. `Located`).
         """
 
+        self.path = path
+        self.read_only = read_only
+        self.compact = compact
+        self.located = located
+        # снимок используется только для рабочей книги: остальные форматы читаются без разбора XML
+        self.snapshot = snapshot and get_source_class(path) is None
+
+    @cached_property
+    def workbook(self) -> Union[Workbook, RowSource]:
+        """
+        Загрузка рабочей книги или источника строк другого формата.
+
+        Рабочая книга загружается при первом обращении: при параллельном чтении каждый процесс открывает файл сам.
+
+        :return: Рабочая книга Excel или источник строк.
+        """
+
+        source_class = get_source_class(self.path)
+        if source_class is not None:
+            logger.info("Открытие входных данных (%s) ...", source_class.__name__)
+            return source_class(self.path)
+
         logger.info("Загрузка рабочей книги ...")
-        self.workbook: Workbook = openpyxl.load_workbook(path)
+        return openpyxl.load_workbook(self.path, read_only=self.read_only, keep_links=False)
+
+    def __enter__(self) -> "SourcesReader":
+        return self
 
-    def read(self) -> list:
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрытие рабочей книги.
+
+        В режиме только для чтения рабочая книга удерживает открытым исходный файл до явного закрытия.
+        """
+
+        if "workbook" in self.__dict__:
+            self.workbook.close()
+
+    def iterate(self) -> Iterator[Source]:
+        """
+        Ленивое чтение исходного файла.
+
+        :return: Генератор прочитанных моделей (строк), при чтении с расположением – кортежей `Located`.
+        """
+
+        # при потоковом чтении снимок только загружается: для сохранения потребовалось бы хранить все строки
+        sheets = load_snapshot(self.path, self.get_readers()) if self.snapshot else None
+        if sheets is not None:
+            for reader, (numbers, payloads) in zip(self.get_readers(), sheets):
+                for start in range(0, len(payloads), READ_BATCH_SIZE):
+                    batch = numbers[start : start + READ_BATCH_SIZE]
+                    yield from self.locate(reader, batch, reader.build(batch, payloads[start : start + READ_BATCH_SIZE]))
+            return
+
+        for reader in self.get_readers(self.workbook):
+            logger.info("Чтение %s ...", type(reader))
+            for numbers, models in reader.batches():
+                yield from self.locate(reader, numbers, models)
+
+    def read(self, workers: int = READ_WORKERS) -> list:
         """
         Чтение исходного файла.
 
+        :param workers: Количество процессов для параллельного чтения листов рабочей книги.
+        :return: Список прочитанных моделей (строк), при чтении с расположением – кортежей `Located`.
+        """
+
+        with measure_stage("чтение источников") as stage:
+            if self.snapshot:
+                items = self.read_snapshot(workers)
+            elif workers > 1:
+                items = self.read_parallel(workers)
+            else:
+                items = list(self.iterate())
+            stage.entries = len(items)
+
+        return items
+
+    def read_parallel(self, workers: int) -> list:
+        """
+        Параллельное чтение листов рабочей книги в пуле процессов.
+
+        Каждый процесс самостоятельно открывает исходный файл и возвращает строки листа в компактном виде,
+        модели собираются в текущем процессе в порядке зарегистрированных читателей.
+
+        :param workers: Количество процессов.
+        :return: Список прочитанных моделей (строк).
+        """
+
+        return self.build(self.read_sheets(workers))
+
+    def read_snapshot(self, workers: int) -> list:
+        """
+        Чтение строк рабочей книги из снимка, при отсутствии действительного снимка – чтение листов
+        и сохранение снимка.
+
+        :param workers: Количество процессов для параллельного чтения листов рабочей книги.
+        :return: Список прочитанных моделей (строк).
+        """
+
+        readers = self.get_readers()
+        sheets = load_snapshot(self.path, readers)
+        if sheets is None:
+            sheets = self.read_sheets(workers)
+            save_snapshot(self.path, readers, sheets)
+
+        return self.build(sheets)
+
+    def read_sheets(self, workers: int) -> list[Sheet]:
+        """
+        Чтение строк всех листов рабочей книги в компактном виде.
+
+        :param workers: Количество процессов для параллельного чтения листов рабочей книги.
+        :return: Строки каждого листа в порядке зарегистрированных читателей.
+        """
+
+        if workers <= 1:
+            sheets = []
+            for reader in self.get_readers(self.workbook):
+                logger.info("Чтение %s ...", type(reader))
+                sheets.append(reader.payloads())
+
+            return sheets
+
+        logger.info("Параллельное чтение листов (процессов: %s) ...", workers)
+        with ProcessPoolExecutor(max_workers=min(workers, len(self.readers))) as executor:
+            return list(executor.map(read_sheet, repeat(self.path), range(len(self.readers))))
+
+    def get_readers(self, workbook: Union[Workbook, RowSource, None] = None) -> list[BaseReader]:
+        """
+        Получение экземпляров зарегистрированных читателей.
+
+        :param workbook: Рабочая книга Excel или источник строк (не требуется для сборки моделей).
+        :return: Читатели в порядке регистрации.
+        """
+
+        return [reader(workbook, self.compact) for reader in self.readers]  # type: ignore
+
+    def build(self, sheets: list[Sheet]) -> list:
+        """
+        Сборка моделей из строк листов рабочей книги.
+
+        :param sheets: Строки каждого листа в порядке зарегистрированных читателей.
         :return: Список прочитанных моделей (строк).
         """
 
         items = []
-        for reader in self.readers:
-            logger.info("Чтение %s ...", reader)
-            items.extend(reader(self.workbook).read())  # type: ignore
+        for reader, (numbers, payloads) in zip(self.get_readers(), sheets):
+            items.extend(self.locate(reader, numbers, reader.build(numbers, payloads)))
 
         return items
+
+    def locate(self, reader: BaseReader, numbers: list[int], models: list[Source]) -> Iterable[Union[Source, Located]]:
+        """
+        Добавление к моделям наименования листа и номеров строк при чтении источников с расположением.
+
+        :param reader: Читатель листа.
+        :param numbers: Номера строк.
+        :param models: Модели строк в том же порядке.
+        :return: Модели строк или кортежи из наименования листа, номера строки и модели (см. `Located`).
+        """
+
+        if not self.located:
+            return models
+
+        return zip(repeat(reader.sheet.strip()), numbers, models)
+
+
+def write_sources(path: str, items: Iterable[Source]) -> None:
+    """
+    Запись моделей в формате, отличном от рабочей книги Excel (формат определяется по пути, см. `readers.formats`).
+
+    :param path: Путь к выходному файлу (директории для формата CSV).
+    :param items: Модели или компактные записи источников.
+    :raises ValueError: Если формат не поддерживает запись.
+    """
+
+    source_class = get_source_class(path) or (CSVSource if not Path(path).suffix else None)
+    if source_class is None:
+        raise ValueError(f"Формат входных данных для пути {path} не поддерживает запись.")
+
+    readers = [reader() for reader in SourcesReader.readers]  # type: ignore
+    # модели и компактные записи одного типа источника обрабатываются одним читателем
+    by_type = {data_type: reader for reader in readers for data_type in (reader.model, RECORDS[reader.model])}
+    fields = {reader: [attr for attr, _ in get_columns(reader)] for reader in readers}
+
+    tables: dict[BaseReader, list[tuple]] = {reader: [] for reader in readers}
+    for item in items:
+        reader = by_type[type(item)]
+        tables[reader].append(tuple(getattr(item, attr) if attr else None for attr in fields[reader]))
+
+    logger.info("Запись входных данных (%s) ...", source_class.__name__)
+    source_class.write(path, tables.items())  # type: ignore
+
+
+def read_sheet(path: str, index: int) -> Sheet:
+    """
+    Чтение листа рабочей книги в отдельном процессе.
+
+    :param path: Путь к исходному файлу для чтения.
+    :param index: Индекс читателя в списке зарегистрированных читателей `SourcesReader.readers`.
+    :return: Номера строк на листе и список кортежей значений атрибутов в порядке плана чтения.
+    """
+
+    with SourcesReader(path) as sources:
+        reader = SourcesReader.readers[index]
+        logger.info("Чтение %s ...", reader)
+
+        return reader(sources.workbook).payloads()  # type: ignore
@@ -0,0 +1,199 @@
+"""
+Снимки прочитанных строк рабочей книги.
+
+Снимок сохраняется рядом с входным файлом (`<входной файл>.snapshot`) и содержит номера строк и значения
+атрибутов всех листов после преобразования (см. `BaseReader.payloads()`) в колоночном двоичном формате
+(см. `readers.formats`). Повторное чтение того же файла (например, с другим стилем цитирования или форматом
+выходного файла) загружает снимок через отображение файла в память без разбора рабочей книги.
+
+Снимок действителен, если совпадают размер и время изменения входного файла либо, при изменившемся времени
+изменения, хэш SHA-256 его содержимого, а также набор читателей и их атрибутов.
+"""
+import hashlib
+import io
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Optional, Sequence
+
+from logger import get_logger
+from readers.base import BaseReader
+from readers.formats import INT_COLUMN, STR_COLUMN, decode_column, parse_tables, write_tables
+
+logger = get_logger(__name__)
+
+# расширение файла снимка
+SNAPSHOT_SUFFIX = ".snapshot"
+# сигнатура файла снимка (с версией формата, увеличивается при изменении преобразования значений)
+SNAPSHOT_MAGIC = b"BIBSNAP1"
+# заголовок: время изменения (нс) и размер входного файла, хэш его содержимого и хэш набора атрибутов читателей
+SNAPSHOT_HEADER = struct.Struct("<qQ32s32s")
+# размер блока для чтения входного файла при вычислении хэша
+HASH_CHUNK_SIZE = 2**20
+
+# строки листа: номера строк и кортежи значений атрибутов в порядке плана чтения
+Sheet = tuple[list[int], list[tuple]]
+
+
+def get_snapshot_path(path: str) -> Path:
+    """
+    Получение пути к файлу снимка входного файла.
+
+    :param path: Путь к входному файлу.
+    :return: Путь к файлу снимка.
+    """
+
+    return Path(f"{path}{SNAPSHOT_SUFFIX}")
+
+
+def get_file_hash(path: str) -> bytes:
+    """
+    Вычисление хэша SHA-256 содержимого файла.
+
+    :param path: Путь к файлу.
+    :return: Хэш содержимого.
+    """
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+
+    return digest.digest()
+
+
+def get_layout_hash(readers: Sequence[BaseReader]) -> bytes:
+    """
+    Вычисление хэша набора читателей и атрибутов: снимок недействителен после изменения читателей.
+
+    :param readers: Читатели листов рабочей книги.
+    :return: Хэш набора атрибутов.
+    """
+
+    layout = [(reader.source_type, reader.sheet, reader.fields) for reader in readers]
+
+    return hashlib.sha256(repr(layout).encode("utf-8")).digest()
+
+
+def get_column_kind(values: list) -> Optional[bytes]:
+    """
+    Определение вида столбца колоночного формата по значениям.
+
+    :param values: Значения столбца.
+    :return: Вид столбца или `None`, если значения не являются только целыми числами или только строками.
+    """
+
+    types = {type(value) for value in values if value is not None}
+    if types <= {int}:
+        return INT_COLUMN
+    if types == {str}:
+        return STR_COLUMN
+
+    return None
+
+
+def decode_snapshot(data: memoryview, readers: Sequence[BaseReader]) -> list[Sheet]:
+    """
+    Декодирование строк листов из содержимого файла снимка.
+
+    Представления данных столбцов существуют только во время вызова, поэтому после возврата отображение
+    файла в память может быть закрыто.
+
+    :param data: Содержимое файла снимка.
+    :param readers: Читатели листов рабочей книги.
+    :return: Строки каждого листа в порядке читателей.
+    """
+
+    tables = parse_tables(data, len(SNAPSHOT_MAGIC) + SNAPSHOT_HEADER.size)
+
+    sheets = []
+    for reader in readers:
+        rows, columns = tables[reader.source_type]
+        numbers, *values = [decode_column(rows, kind, nulls, column) for kind, nulls, column in columns]
+        sheets.append((numbers, list(zip(*values))))
+
+    return sheets
+
+
+def load_snapshot(path: str, readers: Sequence[BaseReader]) -> Optional[list[Sheet]]:
+    """
+    Загрузка снимка строк входного файла.
+
+    :param path: Путь к входному файлу.
+    :param readers: Читатели листов рабочей книги.
+    :return: Строки каждого листа в порядке читателей или `None`, если снимок отсутствует или недействителен.
+    """
+
+    snapshot_path = get_snapshot_path(path)
+    if not snapshot_path.exists() or snapshot_path.stat().st_size < len(SNAPSHOT_MAGIC) + SNAPSHOT_HEADER.size:
+        return None
+
+    stat = os.stat(path)
+    with open(snapshot_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if data[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            return None
+
+        mtime, size, file_hash, layout_hash = SNAPSHOT_HEADER.unpack_from(data, len(SNAPSHOT_MAGIC))
+        if size != stat.st_size or layout_hash != get_layout_hash(readers):
+            return None
+        # после копирования или сохранения без изменений время изменения отличается при том же содержимом
+        if mtime != stat.st_mtime_ns and file_hash != get_file_hash(path):
+            return None
+
+        with memoryview(data) as view:
+            sheets = decode_snapshot(view, readers)
+
+    logger.info("Строки входного файла загружены из снимка %s.", snapshot_path)
+
+    return sheets
+
+
+def save_snapshot(path: str, readers: Sequence[BaseReader], sheets: Sequence[Sheet]) -> bool:
+    """
+    Сохранение снимка строк входного файла.
+
+    Файл снимка записывается во временный файл и заменяется атомарно. Ошибки записи (например, для входного
+    файла в директории только для чтения) не прерывают обработку.
+
+    :param path: Путь к входному файлу.
+    :param readers: Читатели листов рабочей книги.
+    :param sheets: Строки каждого листа в порядке читателей.
+    :return: Признак сохранения снимка.
+    """
+
+    tables = []
+    for reader, (numbers, payloads) in zip(readers, sheets):
+        columns = [(INT_COLUMN, numbers)]
+        for index in range(len(reader.fields)):
+            values = [payload[index] for payload in payloads]
+            kind = get_column_kind(values)
+            if kind is None:
+                logger.info("Снимок не сохранен: значения атрибута %s имеют разные типы.", reader.fields[index])
+                return False
+            columns.append((kind, values))
+        tables.append((reader.source_type, len(numbers), columns))
+
+    stat = os.stat(path)
+    buffer = io.BytesIO()
+    buffer.write(SNAPSHOT_MAGIC)
+    buffer.write(SNAPSHOT_HEADER.pack(stat.st_mtime_ns, stat.st_size, get_file_hash(path), get_layout_hash(readers)))
+    try:
+        write_tables(buffer, tables)  # type: ignore
+    except (OverflowError, ValueError) as error:
+        logger.info("Снимок не сохранен: %s", error)
+        return False
+
+    snapshot_path = get_snapshot_path(path)
+    try:
+        with tempfile.NamedTemporaryFile("wb", dir=snapshot_path.parent, suffix=".tmp", delete=False) as file:
+            file.write(buffer.getbuffer())
+        os.replace(file.name, snapshot_path)
+    except OSError as error:
+        logger.warning("Снимок не сохранен: %s", error)
+        return False
+
+    logger.info("Снимок строк входного файла сохранен: %s.", snapshot_path)
+
+    return True
@@ -0,0 +1,46 @@
+"""
+Реестр форматтеров стилей цитирования и рендереров.
+
+Классы задаются путями импорта и загружаются при первом обращении, поэтому запуск приложения (в том числе
+вывод справки) не импортирует модули стилей и библиотеки (openpyxl, python-docx, pydantic), которые
+не используются выполняемой командой.
+"""
+from functools import lru_cache
+from importlib import import_module
+from typing import Any
+
+# форматтеры стилей цитирования (ключи – наименования элементов `main.CitationEnum`)
+FORMATTERS = {
+    "GOST": "formatters.styles.gost:GOSTCitationFormatter",
+    "APA": "formatters.styles.apa:APACitationFormatter",
+}
+
+# рендереры Word-файлов стилей цитирования (ключи – наименования элементов `main.CitationEnum`)
+STYLE_RENDERERS = {
+    "GOST": "renderer:GOSTRenderer",
+    "APA": "renderer:APARenderer",
+}
+
+# рендереры форматов выходного файла (ключи – наименования элементов `main.FormatEnum`)
+FORMAT_RENDERERS = {
+    "DOCX": "renderer:DocxRenderer",
+    "TXT": "text_renderer:PlainTextRenderer",
+    "HTML": "text_renderer:HTMLRenderer",
+    "MD": "text_renderer:MarkdownRenderer",
+    "BIBTEX": "text_renderer:BibTeXRenderer",
+    "CSL_JSON": "text_renderer:CSLJSONRenderer",
+}
+
+
+@lru_cache(maxsize=None)
+def resolve(path: str) -> Any:
+    """
+    Загрузка объекта по пути импорта.
+
+    :param str path: Путь импорта в виде `<модуль>:<атрибут>`.
+    :return: Объект модуля.
+    """
+
+    module_name, _, name = path.partition(":")
+
+    return getattr(import_module(module_name), name)
@@ -2,39 +2,315 @@
 Функции для генерации выходного файла с оформленным списком использованных источников.
 """
 from __future__ import annotations
+import re
+import zipfile
 from abc import ABC, abstractmethod
+from io import BytesIO
 from pathlib import Path
-from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH  # pylint: disable=E0611
-from docx.shared import Pt, Mm
+from typing import IO, TYPE_CHECKING, Any, ClassVar, Iterable
+
+from metrics import measure_stage
+
+# python-docx импортируется при первом создании документа, поэтому импорт модуля (например, для получения
+# расширения выходного файла или при генерации текстовых форматов) не загружает библиотеку
+if TYPE_CHECKING:
+    from docx.document import Document as DocumentType
+
+# версия генерации выходных файлов: входит в ключ кэша результатов (см. `cache.ResultCache`) и должна
+# увеличиваться при любом изменении форматирования или генерации, влияющем на содержимое выходных файлов
+RENDERER_VERSION = "1"
+
+# наименование части пакета с содержимым документа
+DOCUMENT_PART = "word/document.xml"
+# текст абзаца-шаблона, по которому определяется разметка абзацев источников
+PARAGRAPH_MARKER = "{row}"
+# количество абзацев, записываемых в архив за одну операцию
+WRITE_BATCH_SIZE = 1000
+
+# символы, недопустимые в XML (так же, как в python-docx, приводят к ошибке)
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+# символы строки, заменяемые отдельными элементами разметки
+RUN_SEPARATORS = re.compile("([\t\r\n])")
+
+
+def escape(text: str) -> str:
+    """
+    Замена специальных символов XML (как `xml.sax.saxutils.escape`, импорт которого загружает `urllib`).
+
+    :param text: Текст.
+    :return: Текст для вставки в разметку.
+    """
+
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+class WordprocessingWriter:
+    """
+    Потоковая запись абзацев в пакет Word-файла без построения дерева документа.
+
+    Пакет-шаблон создается python-docx и содержит оформление документа и абзац-шаблон с текстом `PARAGRAPH_MARKER`.
+    Содержимое документа разделяется по абзацу-шаблону, все остальные части пакета копируются без изменений
+    (часть с содержимым документа дописывается в архив последней), а вместо абзаца-шаблона записываются абзацы
+    источников с той же разметкой, что формирует python-docx.
+    """
+
+    def __init__(self, template: bytes) -> None:
+        """
+        Конструктор.
+
+        :param bytes template: Пакет-шаблон Word-файла.
+        """
+
+        # остальные части пакета сжимаются один раз и дописываются в выходной файл без изменений
+        buffer = BytesIO()
+        with zipfile.ZipFile(BytesIO(template)) as package, zipfile.ZipFile(
+            buffer, "w", compression=zipfile.ZIP_DEFLATED
+        ) as parts:
+            for info in package.infolist():
+                if info.filename != DOCUMENT_PART:
+                    parts.writestr(info, package.read(info))
+            xml = package.read(DOCUMENT_PART).decode("utf-8")
+        self.parts = buffer.getvalue()
+
+        # абзац-шаблон добавлен последним, поэтому является последним абзацем документа
+        start = xml.rindex("<w:p>")
+        run = xml.index("<w:r>", start)
+        end = xml.index("</w:p>", run) + len("</w:p>")
+        if PARAGRAPH_MARKER not in xml[run:end]:
+            raise ValueError("Пакет-шаблон не содержит абзац-шаблон.")
+
+        self.head = xml[:start].encode("utf-8")
+        self.tail = xml[end:].encode("utf-8")
+        self.paragraph_start = xml[start:run]
+        self.empty_paragraph = f"{self.paragraph_start}</w:p>"
+
+    @staticmethod
+    def get_text_xml(text: str) -> str:
+        """
+        Получение разметки текста фрагмента абзаца.
+
+        Как и в python-docx, табуляция заменяется элементом `w:tab`, перевод строки – элементом `w:br`,
+        а для текста с пробелами в начале или в конце указывается `xml:space="preserve"`.
+
+        :param str text: Текст.
+        :return: Разметка текста.
+        """
+
+        parts = []
+        for part in RUN_SEPARATORS.split(text):
+            if part == "\t":
+                parts.append("<w:tab/>")
+            elif part in ("\r", "\n"):
+                parts.append("<w:br/>")
+            elif part:
+                space = ' xml:space="preserve"' if len(part.strip()) < len(part) else ""
+                parts.append(f"<w:t{space}>{escape(part)}</w:t>")
+
+        return "".join(parts)
+
+    def get_paragraph_xml(self, text: str) -> str:
+        """
+        Получение разметки абзаца.
+
+        :param str text: Текст абзаца.
+        :raises ValueError: Если текст содержит символы, недопустимые в XML.
+        :return: Разметка абзаца.
+        """
+
+        if not text:
+            return self.empty_paragraph
+        if INVALID_XML_CHARS.search(text):
+            raise ValueError(f"Текст содержит символы, недопустимые в XML: {text!r}")
+        if "\t" in text or "\r" in text or "\n" in text or len(text.strip()) < len(text):
+            content = self.get_text_xml(text)
+        else:
+            content = f"<w:t>{escape(text)}</w:t>"
+
+        return f"{self.paragraph_start}<w:r>{content}</w:r></w:p>"
+
+    def write(self, file: Path | str | IO[bytes], rows: Iterable[str]) -> None:
+        """
+        Запись Word-файла.
+
+        Абзацы записываются в архив пакетами по `WRITE_BATCH_SIZE`, поэтому объем памяти не зависит
+        от количества строк.
+
+        :param Path | str | IO[bytes] file: Путь или файл для сохранения выходного файла (файл должен
+            поддерживать чтение и перемещение позиции, например, `BytesIO`).
+        :param Iterable[str] rows: Текст абзацев.
+        """
+
+        if isinstance(file, (str, Path)):
+            with open(file, "w+b") as output:
+                self.write(output, rows)
+            return
+
+        file.write(self.parts)
+        with zipfile.ZipFile(file, "a", compression=zipfile.ZIP_DEFLATED) as package:
+            with package.open(DOCUMENT_PART, "w", force_zip64=True) as document:
+                document.write(self.head)
+                batch = []
+                for row in rows:
+                    batch.append(self.get_paragraph_xml(row))
+                    if len(batch) >= WRITE_BATCH_SIZE:
+                        document.write("".join(batch).encode("utf-8"))
+                        batch.clear()
+                document.write("".join(batch).encode("utf-8"))
+                document.write(self.tail)
+
 
 class BaseRenderer(ABC):
     """
-        Базовый класс для создания word-файла
+        Базовый класс для создания выходного файла
     """
 
-    def __init__(self, rows: tuple[str, ...]):
+    # расширение и тип содержимого (MIME) выходного файла
+    extension: ClassVar[str]
+    media_type: ClassVar[str]
+    # признак передачи строк вместе с источниками (см. `formatters.base.Entry`) вместо отформатированных строк
+    entries: ClassVar[bool] = False
+
+    def __init__(self, rows: Iterable[Any]):
+        """
+            Конструктор.
+
+            :param Iterable[Any] rows: Отформатированные строки или пары строк и источников, если установлен
+                признак `entries` (в том числе генератор при потоковой обработке).
+        """
+
         self.rows = rows
 
     @abstractmethod
     def render(self, path: Path | str) -> None:
         """
-            Метод генерации Word-файла со списком использованных источников.
+            Метод генерации выходного файла со списком использованных источников.
 
             :param Path | str path: Путь для сохранения выходного файла.
         """
 
 
-class GOSTRenderer(BaseRenderer):
+class DocxRenderer(BaseRenderer):
+    """
+        Базовый класс для создания word-файла
+    """
+
+    extension = ".docx"
+    media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+    # заголовок списка использованных источников
+    title: ClassVar[str]
+    # признак нумерации источников
+    numbered: ClassVar[bool] = False
+    # стиль абзацев источников
+    paragraph_style: ClassVar[str]
+
+    # кэш оформленных документов в сериализованном виде и объектов потоковой записи по классам рендереров
+    _documents: ClassVar[dict[type[DocxRenderer], bytes]] = {}
+    _writers: ClassVar[dict[type[DocxRenderer], WordprocessingWriter]] = {}
+
+    def __init__(self, rows: Iterable[str], streaming: bool = False):
+        """
+            Конструктор.
+
+            :param Iterable[str] rows: Отформатированные строки (в том числе генератор при потоковой обработке).
+            :param bool streaming: Потоковая запись содержимого документа в архив Word-файла
+                (см. `WordprocessingWriter`) вместо построения документа python-docx.
+        """
+
+        super().__init__(rows)
+        self.streaming = streaming
+
+    @classmethod
+    @abstractmethod
+    def create_document(cls) -> DocumentType:
+        """
+            Создание документа с оформлением и заголовком списка использованных источников.
+
+            :return: Документ python-docx.
+        """
+
+    @classmethod
+    def get_base_document(cls) -> DocumentType:
+        """
+            Получение копии документа с оформлением и заголовком.
+
+            Документ оформляется один раз для класса рендерера и хранится в сериализованном виде,
+            каждый вызов возвращает новую копию документа.
+
+            :return: Документ python-docx.
+        """
+
+        if cls not in DocxRenderer._documents:
+            buffer = BytesIO()
+            cls.create_document().save(buffer)
+            DocxRenderer._documents[cls] = buffer.getvalue()
+
+        from docx import Document  # pylint: disable=C0415
+
+        return Document(BytesIO(DocxRenderer._documents[cls]))
+
+    @classmethod
+    def get_writer(cls) -> WordprocessingWriter:
+        """
+            Получение объекта потоковой записи Word-файла.
+
+            Пакет-шаблон создается и разбирается один раз для класса рендерера.
+
+            :return: Объект потоковой записи.
+        """
+
+        if cls not in DocxRenderer._writers:
+            document = cls.get_base_document()
+            document.add_paragraph(PARAGRAPH_MARKER, style=cls.paragraph_style)
+            buffer = BytesIO()
+            document.save(buffer)
+            DocxRenderer._writers[cls] = WordprocessingWriter(buffer.getvalue())
+
+        return DocxRenderer._writers[cls]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+            Очистка кэша оформленных документов и пакетов-шаблонов всех рендереров.
+        """
+
+        DocxRenderer._documents.clear()
+        DocxRenderer._writers.clear()
 
     def render(self, path: Path | str) -> None:
+        with measure_stage("запись выходного файла") as stage:
+            rows = stage.count(self.rows)
+            if self.streaming:
+                self.get_writer().write(path, rows)
+                return
+
+            document = self.get_base_document()
+            for row in rows:
+                # добавление источника
+                document.add_paragraph(row, style=self.paragraph_style)
+
+            # сохранение файла Word
+            document.save(path)
+
+
+class GOSTRenderer(DocxRenderer):
+
+    title = "Список использованной литературы"
+    numbered = True
+    paragraph_style = "List Number"
+
+    @classmethod
+    def create_document(cls) -> DocumentType:
+        from docx import Document  # pylint: disable=C0415
+        from docx.enum.text import WD_ALIGN_PARAGRAPH  # pylint: disable=C0415,E0611
+        from docx.shared import Pt  # pylint: disable=C0415
 
         document = Document()
 
         # стилизация заголовка
         paragraph = document.add_paragraph()
         paragraph.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        runner = paragraph.add_run("Список использованной литературы")
+        runner = paragraph.add_run(cls.title)
         runner.font.size = Pt(16)
         runner.bold = True
 
@@ -46,23 +322,26 @@ class GOSTRenderer(BaseRenderer):
         style_normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
         style_normal.paragraph_format.keep_together = True
 
-        for row in self.rows:
-            # добавление источника
-            document.add_paragraph(row, style="List Number")
+        return document
 
-        # сохранение файла Word
-        document.save(path)
 
+class APARenderer(DocxRenderer):
 
-class APARenderer(BaseRenderer):
+    title = "References"
+    paragraph_style = "Normal"
+
+    @classmethod
+    def create_document(cls) -> DocumentType:
+        from docx import Document  # pylint: disable=C0415
+        from docx.enum.text import WD_ALIGN_PARAGRAPH  # pylint: disable=C0415,E0611
+        from docx.shared import Mm, Pt  # pylint: disable=C0415
 
-    def render(self, path: Path | str) -> None:
         document = Document()
 
         # стилизация заголовка
         paragraph = document.add_paragraph()
         paragraph.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        runner = paragraph.add_run("References")
+        runner = paragraph.add_run(cls.title)
         runner.font.size = Pt(14)
         runner.bold = True
 
@@ -76,9 +355,4 @@ class APARenderer(BaseRenderer):
         style_normal.paragraph_format.first_line_indent = Mm(-10)
         style_normal.paragraph_format.keep_together = True
 
-        for row in self.rows:
-            # добавление источника
-            document.add_paragraph(row, style="Normal")
-
-        # сохранение файла Word
-        document.save(path)
+        return document
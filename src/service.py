@@ -0,0 +1,429 @@
+"""
+HTTP-сервис генерации библиографических списков.
+
+Сервис принимает рабочую книгу (содержимое xlsx-файла) или список источников в формате JSON и возвращает
+выходной файл. Чтение, форматирование и генерация выполняются в пуле процессов, который создается и прогревается
+при запуске сервиса, поэтому запросы не тратят время на запуск интерпретатора и импорт библиотек.
+
+Количество одновременно обрабатываемых и ожидающих запросов ограничено: при превышении ограничения
+сервис сразу отвечает кодом 503, не читая тело запроса.
+
+.. code-block::
+
+    POST /render?citation=gost&format=docx&limit=10
+    Content-Type: application/vnd.openxmlformats-officedocument.spreadsheetml.sheet
+
+    POST /render?citation=apa&format=html
+    Content-Type: application/json
+
+    {"sources": [{"type": "book", "authors": "Иванов И.М.", "title": "Наука как искусство", ...}]}
+"""
+import asyncio
+import json
+import os
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from openpyxl.utils.exceptions import InvalidFileException
+from pydantic import BaseModel
+
+from formatters.models import (
+    ArticlesCollectionModel,
+    BookModel,
+    DissertationModel,
+    InternetResourceModel,
+    NormativeActModel,
+)
+from cache import ResultCache
+from logger import get_logger
+from metrics import CacheStats
+from main import CitationEnum, FormatEnum, generate, get_format_renderer, render_models
+from renderer import APARenderer, GOSTRenderer
+from settings import (
+    CACHE_ENABLED,
+    SERVICE_HOST,
+    SERVICE_MAX_UPLOAD_SIZE,
+    SERVICE_PORT,
+    SERVICE_QUEUE_SIZE,
+    SERVICE_WORKERS,
+)
+
+logger = get_logger(__name__)
+
+# типы источников в запросах в формате JSON
+SOURCE_TYPES: dict[str, type[BaseModel]] = {
+    "book": BookModel,
+    "internet_resource": InternetResourceModel,
+    "articles_collection": ArticlesCollectionModel,
+    "dissertation": DissertationModel,
+    "normative_act": NormativeActModel,
+}
+
+# ошибки входных данных, для которых возвращается код 400 (`ValueError` включает ошибки валидации pydantic
+# и `ReaderValidationError`), остальные ошибки считаются внутренними и возвращают код 500
+CLIENT_ERRORS = (ValueError, json.JSONDecodeError, zipfile.BadZipFile, InvalidFileException)
+
+
+class HTTPError(Exception):
+    """
+    Ошибка обработки запроса с кодом ответа HTTP.
+    """
+
+    def __init__(self, status: HTTPStatus, message: str, headers: Optional[dict[str, str]] = None) -> None:
+        """
+        Конструктор.
+
+        :param HTTPStatus status: Код ответа.
+        :param str message: Описание ошибки.
+        :param Optional[dict[str, str]] headers: Дополнительные заголовки ответа.
+        """
+
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+
+def warm_up() -> int:
+    """
+    Прогрев процесса пула: импорт библиотек выполнен при импорте модуля, здесь создаются кэши рендереров.
+
+    :return: Идентификатор процесса.
+    """
+
+    for renderer in (GOSTRenderer, APARenderer):
+        renderer.get_writer()
+
+    return os.getpid()
+
+
+def parse_sources(payload: bytes) -> list[BaseModel]:
+    """
+    Получение моделей источников из запроса в формате JSON.
+
+    :param bytes payload: Тело запроса: объект с ключом `sources` или массив источников, тип источника
+        указывается ключом `type` (см. `SOURCE_TYPES`).
+    :raises ValueError: Если тело запроса не соответствует формату или источник не прошел валидацию.
+    :return: Модели источников.
+    """
+
+    data = json.loads(payload)
+    sources = data.get("sources") if isinstance(data, dict) else data
+    if not isinstance(sources, list):
+        raise ValueError("Список источников должен быть массивом.")
+
+    models = []
+    for number, source in enumerate(sources, start=1):
+        if not isinstance(source, dict):
+            raise ValueError(f"Источник {number}: источник должен быть объектом.")
+        fields = dict(source)
+        source_type = fields.pop("type", None)
+        if source_type not in SOURCE_TYPES:
+            raise ValueError(f"Источник {number}: неизвестный тип источника {source_type!r}.")
+        models.append(SOURCE_TYPES[source_type](**fields))
+
+    return models
+
+
+def render_job(
+    payload: bytes, is_json: bool, citation: str, output_format: str, limit: Optional[int], use_cache: bool = False
+) -> tuple[HTTPStatus, bytes, bool]:
+    """
+    Генерация выходного файла в процессе пула.
+
+    Ошибки возвращаются в результате, чтобы исключения не передавались между процессами.
+
+    :param bytes payload: Содержимое рабочей книги или список источников в формате JSON.
+    :param bool is_json: Признак списка источников в формате JSON.
+    :param str citation: Стиль цитирования.
+    :param str output_format: Формат выходного файла.
+    :param Optional[int] limit: Количество первых источников списка для вывода.
+    :param bool use_cache: Использование кэша результатов.
+    :return: Код ответа, содержимое выходного файла (или описание ошибки) и признак попадания в кэш.
+    """
+
+    cache = ResultCache() if use_cache else None
+    if cache is not None:
+        key = cache.get_key(payload, is_json, citation, output_format, limit)
+        content = cache.get_bytes(key)
+        if content is not None:
+            return HTTPStatus.OK, content, True
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="render_") as directory:
+            path_output = str(Path(directory) / f"output{get_format_renderer(output_format).extension}")
+            if is_json:
+                render_models(parse_sources(payload), path_output, citation, output_format, limit)
+            else:
+                path_input = Path(directory) / "input.xlsx"
+                path_input.write_bytes(payload)
+                generate(str(path_input), path_output, citation, output_format, read_workers=1, limit=limit)
+
+            content = Path(path_output).read_bytes()
+    except CLIENT_ERRORS as ex:
+        return HTTPStatus.BAD_REQUEST, f"{type(ex).__name__}: {ex}".encode("utf-8"), False
+    except Exception as ex:  # pylint: disable=W0703
+        logger.exception("При генерации выходного файла возникла ошибка: %s", ex)
+        return HTTPStatus.INTERNAL_SERVER_ERROR, "Внутренняя ошибка сервиса.".encode("utf-8"), False
+
+    if cache is not None:
+        cache.put_bytes(key, content)
+
+    return HTTPStatus.OK, content, False
+
+
+class RenderService:
+    """
+    HTTP-сервис генерации библиографических списков.
+    """
+
+    def __init__(
+        self,
+        workers: int = SERVICE_WORKERS,
+        queue_size: int = SERVICE_QUEUE_SIZE,
+        max_upload_size: int = SERVICE_MAX_UPLOAD_SIZE,
+        use_cache: bool = CACHE_ENABLED,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param int workers: Количество процессов пула.
+        :param int queue_size: Количество запросов, ожидающих свободного процесса.
+        :param int max_upload_size: Ограничение размера тела запроса в байтах.
+        :param bool use_cache: Использование кэша результатов.
+        """
+
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.max_upload_size = max_upload_size
+        self.use_cache = use_cache
+
+        # статистика обращений к кэшу результатов процессов пула
+        self.cache_stats = CacheStats()
+
+        # количество обрабатываемых и ожидающих запросов
+        self.pending = 0
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.server: Optional[asyncio.Server] = None
+
+    @property
+    def port(self) -> int:
+        """
+        Получение порта, на котором запущен сервис (в том числе при запуске на порту 0).
+
+        :return: Номер порта.
+        """
+
+        if self.server is None:
+            raise RuntimeError("Сервис не запущен.")
+
+        return self.server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT) -> None:
+        """
+        Запуск сервиса: создание и прогрев пула процессов и открытие сокета.
+
+        :param str host: Адрес.
+        :param int port: Порт (0 – свободный порт).
+        """
+
+        loop = asyncio.get_running_loop()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        pids = await asyncio.gather(*(loop.run_in_executor(self.executor, warm_up) for _ in range(self.workers)))
+        logger.info("Пул процессов прогрет: %s.", ", ".join(map(str, sorted(set(pids)))))
+
+        self.server = await asyncio.start_server(self.handle, host, port)
+        logger.info("Сервис запущен на %s:%s.", host, self.port)
+
+    async def close(self) -> None:
+        """
+        Остановка сервиса и пула процессов.
+        """
+
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    async def serve_forever(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT) -> None:
+        """
+        Запуск сервиса до остановки процесса.
+
+        :param str host: Адрес.
+        :param int port: Порт.
+        """
+
+        await self.start(host, port)
+        try:
+            await self.server.serve_forever()  # type: ignore  # сервер создается в `start()`
+        finally:
+            await self.close()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Обработка соединения: один запрос на соединение.
+
+        :param asyncio.StreamReader reader: Поток чтения.
+        :param asyncio.StreamWriter writer: Поток записи.
+        """
+
+        headers: dict[str, str] = {}
+        try:
+            status, content_type, body = await self.dispatch(reader)
+        except HTTPError as ex:
+            status, content_type = ex.status, "application/json"
+            body = json.dumps({"error": ex.message}, ensure_ascii=False).encode("utf-8")
+            headers = ex.headers
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+
+        head = [f"HTTP/1.1 {status.value} {status.phrase}", f"Content-Type: {content_type}"]
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        head.extend([f"Content-Length: {len(body)}", "Connection: close", "", ""])
+        try:
+            writer.write("\r\n".join(head).encode("latin-1") + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, reader: asyncio.StreamReader) -> tuple[HTTPStatus, str, bytes]:
+        """
+        Разбор запроса и выбор обработчика.
+
+        :param asyncio.StreamReader reader: Поток чтения.
+        :raises HTTPError: Если запрос некорректен или сервис перегружен.
+        :return: Код ответа, тип содержимого и тело ответа.
+        """
+
+        try:
+            # размер заголовков ограничен размером буфера потока чтения (64 КБ)
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError as ex:
+            raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Слишком большие заголовки запроса.") from ex
+
+        request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError as ex:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Некорректная строка запроса.") from ex
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        url = urlsplit(target)
+        if url.path == "/health" and method == "GET":
+            status = {
+                "status": "ok",
+                "pending": self.pending,
+                "capacity": self.capacity,
+                "cache": {"hits": self.cache_stats.hits, "misses": self.cache_stats.misses},
+            }
+            return HTTPStatus.OK, "application/json", json.dumps(status).encode("utf-8")
+        if url.path != "/render":
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Неизвестный адрес.")
+        if method != "POST":
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Поддерживается только метод POST.", {"Allow": "POST"})
+
+        # ограничение нагрузки проверяется до чтения тела запроса
+        if self.pending >= self.capacity:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Сервис перегружен, повторите запрос позже.",
+                            {"Retry-After": "1"})
+
+        citation, output_format, limit = self.get_parameters(url.query)
+        length = self.get_content_length(headers)
+
+        self.pending += 1
+        try:
+            payload = await reader.readexactly(length)
+            is_json = headers.get("content-type", "").split(";")[0].strip() == "application/json"
+            status, body, cached = await asyncio.get_running_loop().run_in_executor(
+                self.executor, render_job, payload, is_json, citation, output_format, limit, self.use_cache
+            )
+        finally:
+            self.pending -= 1
+
+        if self.use_cache and status == HTTPStatus.OK:
+            if cached:
+                self.cache_stats.hits += 1
+            else:
+                self.cache_stats.misses += 1
+
+        if status != HTTPStatus.OK:
+            raise HTTPError(status, body.decode("utf-8"))
+
+        return status, get_format_renderer(output_format).media_type, body
+
+    def get_content_length(self, headers: dict[str, str]) -> int:
+        """
+        Получение размера тела запроса.
+
+        :param dict[str, str] headers: Заголовки запроса (наименования в нижнем регистре).
+        :raises HTTPError: Если размер не указан или превышает ограничение.
+        :return: Размер тела запроса в байтах.
+        """
+
+        try:
+            length = int(headers["content-length"])
+        except (KeyError, ValueError) as ex:
+            raise HTTPError(HTTPStatus.LENGTH_REQUIRED, "Не указан размер тела запроса.") from ex
+        if length > self.max_upload_size:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Превышен допустимый размер тела запроса.")
+
+        return length
+
+    @staticmethod
+    def get_parameters(query: str) -> tuple[str, str, Optional[int]]:
+        """
+        Получение параметров генерации из строки запроса.
+
+        :param str query: Строка запроса.
+        :raises HTTPError: Если параметры некорректны.
+        :return: Стиль цитирования, формат выходного файла и количество источников для вывода.
+        """
+
+        parameters: dict[str, Any] = {name: values[-1] for name, values in parse_qs(query).items()}
+        citation = parameters.get("citation", CitationEnum.GOST.name).upper()
+        output_format = parameters.get("format", FormatEnum.DOCX.name).upper().replace("-", "_")
+        if citation not in CitationEnum.__members__:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Неизвестный стиль цитирования: {citation}.")
+        if output_format not in FormatEnum.__members__:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Неизвестный формат выходного файла: {output_format}.")
+
+        limit = parameters.get("limit")
+        if limit is not None:
+            if not limit.isdigit() or int(limit) < 1:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Параметр limit должен быть положительным целым числом.")
+            limit = int(limit)
+
+        return citation, output_format, limit
+
+
+def run_service(
+    host: str = SERVICE_HOST,
+    port: int = SERVICE_PORT,
+    workers: int = SERVICE_WORKERS,
+    queue_size: int = SERVICE_QUEUE_SIZE,
+) -> None:
+    """
+    Запуск сервиса до остановки процесса.
+
+    :param str host: Адрес.
+    :param int port: Порт.
+    :param int workers: Количество процессов пула.
+    :param int queue_size: Количество запросов, ожидающих свободного процесса.
+    """
+
+    try:
+        asyncio.run(RenderService(workers, queue_size).serve_forever(host, port))
+    except KeyboardInterrupt:
+        logger.info("Сервис остановлен.")
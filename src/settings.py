@@ -12,6 +12,46 @@ INPUT_FILE_PATH: str = os.getenv("INPUT_FILE_PATH", "../media/input.xlsx")
 # путь к выходному файлу
 OUTPUT_FILE_PATH: str = os.getenv("OUTPUT_FILE_PATH", "../media/output.docx")
 
+# количество строк, для которых модели собираются одним пакетом при потоковом чтении
+READ_BATCH_SIZE: int = int(os.getenv("READ_BATCH_SIZE", "10000"))
+# количество процессов для параллельного чтения листов входного файла (1 – последовательное чтение)
+READ_WORKERS: int = int(os.getenv("READ_WORKERS", "1"))
+# использование снимков прочитанных строк рабочих книг (файлы `<входной файл>.snapshot`) по умолчанию
+SNAPSHOT_ENABLED: bool = os.getenv("SNAPSHOT_ENABLED", "false").lower() in ("1", "true", "yes")
+# количество процессов для пакетной обработки входных файлов
+BATCH_WORKERS: int = int(os.getenv("BATCH_WORKERS", str(os.cpu_count() or 1)))
+
+# минимальный коэффициент Жаккара символьных n-грамм названий похожих источников при объединении повторов
+# (остальные ключевые атрибуты похожих источников должны совпадать)
+DEDUP_THRESHOLD: float = float(os.getenv("DEDUP_THRESHOLD", "0.8"))
+
+# ограничение объема памяти (в байтах) для сортировки отформатированных строк (вместе с источниками и ключами)
+# (при превышении строки сортируются участками во временных файлах)
+SORT_MEMORY_LIMIT: int = int(os.getenv("SORT_MEMORY_LIMIT", str(256 * 2**20)))
+# внешняя сортировка отформатированных строк с ограничением объема памяти `SORT_MEMORY_LIMIT`
+# (по умолчанию строки сортируются в памяти)
+SORT_EXTERNAL: bool = os.getenv("SORT_EXTERNAL", "false").lower() in ("1", "true", "yes")
+
+# размер буфера (в байтах) для записи выходных файлов текстовых форматов
+WRITE_BUFFER_SIZE: int = int(os.getenv("WRITE_BUFFER_SIZE", str(2**20)))
+
+# использование кэша результатов по умолчанию
+CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+# путь к директории кэша результатов
+CACHE_PATH: str = os.getenv("CACHE_PATH", "../cache")
+# ограничение размера кэша результатов (в байтах)
+CACHE_MAX_SIZE: int = int(os.getenv("CACHE_MAX_SIZE", str(512 * 2**20)))
+
+# адрес и порт HTTP-сервиса генерации
+SERVICE_HOST: str = os.getenv("SERVICE_HOST", "127.0.0.1")
+SERVICE_PORT: int = int(os.getenv("SERVICE_PORT", "8080"))
+# количество процессов HTTP-сервиса для обработки запросов
+SERVICE_WORKERS: int = int(os.getenv("SERVICE_WORKERS", str(os.cpu_count() or 1)))
+# количество запросов, ожидающих свободного процесса (при превышении сервис отвечает кодом 503)
+SERVICE_QUEUE_SIZE: int = int(os.getenv("SERVICE_QUEUE_SIZE", "16"))
+# ограничение размера тела запроса (в байтах)
+SERVICE_MAX_UPLOAD_SIZE: int = int(os.getenv("SERVICE_MAX_UPLOAD_SIZE", str(50 * 2**20)))
+
 # путь к директории для логирования
 LOGGING_PATH: str = os.getenv("LOGGING_PATH", "../logs")
 # формат для записей логов
@@ -20,3 +60,7 @@ LOGGING_FORMAT: str = os.getenv(
 )
 # уровень логирования
 LOGGING_LEVEL: str = os.getenv("LOGGING_LEVEL", "INFO")
+# доля записей отладочного уровня о каждом источнике, попадающих в лог (1 – все записи, 100 – каждая сотая)
+LOGGING_SAMPLE_RATE: int = int(os.getenv("LOGGING_SAMPLE_RATE", "100"))
+# количество источников между записями о ходе обработки
+LOGGING_PROGRESS_INTERVAL: int = int(os.getenv("LOGGING_PROGRESS_INTERVAL", "10000"))
@@ -0,0 +1,72 @@
+"""
+Тестирование правил сортировки строк списка источников.
+"""
+from formatters.collation import APA_COLLATOR, GOST_COLLATOR
+from formatters.models import BookModel, InternetResourceModel
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+class TestCollation:
+    """
+    Тестирование правил сортировки строк списка источников.
+    """
+
+    def test_gost(self) -> None:
+        """
+        Тестирование порядка сортировки по ГОСТ: кириллица перед латиницей без учета регистра.
+        """
+
+        items = ["Smith J.", "ёлкин А.", "Яковлев В.", "adams B.", "Елкин А.", "Ежов Б.", "Иванов", "Иванова", "Иванов И."]
+
+        assert sorted(items, key=GOST_COLLATOR.key) == [
+            "Ежов Б.",
+            "Елкин А.",
+            "ёлкин А.",
+            "Иванов",
+            "Иванов И.",
+            "Иванова",
+            "Яковлев В.",
+            "adams B.",
+            "Smith J.",
+        ]
+
+    def test_apa(self) -> None:
+        """
+        Тестирование порядка сортировки по APA: латиница перед кириллицей, буквы с диакритикой рядом с базовыми.
+        """
+
+        items = ["Иванов И.", "Zimmer K.", "Émile A.", "Brown J. (2020)", "Browning A.", "Brown J. (2019)"]
+
+        assert sorted(items, key=APA_COLLATOR.key) == [
+            "Brown J. (2019)",
+            "Brown J. (2020)",
+            "Browning A.",
+            "Émile A.",
+            "Zimmer K.",
+            "Иванов И.",
+        ]
+
+    def test_formatter(self, internet_resource_model_fixture: InternetResourceModel) -> None:
+        """
+        Тестирование сортировки списка источников с учетом правил сортировки стиля.
+
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        """
+
+        book = BookModel(
+            authors="Adams B.",
+            title="Science",
+            edition=None,
+            city="London",
+            publishing_house="Penguin",
+            year=2020,
+            pages=100,
+        )
+        models = [internet_resource_model_fixture, book]
+
+        for formatter, first in ((GOSTCitationFormatter, "Наука"), (APACitationFormatter, "Adams")):
+            for lazy in (False, True):
+                assert str(formatter(models, lazy=lazy).format()[0]).startswith(first)
+            assert next(formatter(models).format_external()).startswith(first)
+            assert next(formatter.stream(models)).startswith(first)
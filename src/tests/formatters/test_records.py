@@ -0,0 +1,62 @@
+"""
+Тестирование компактных записей типов источников.
+"""
+import dataclasses
+import pickle
+
+import pytest
+
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.records import BookRecord, RECORDS, get_model_type, to_record
+from formatters.styles.gost import GOSTCitationFormatter
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestRecords:
+    """
+    Тестирование компактных записей типов источников.
+    """
+
+    def test_conversion(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование преобразования моделей в записи и обратно.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        """
+
+        for model in (book_model_fixture, internet_resource_model_fixture, articles_collection_model_fixture):
+            record = to_record(model)
+
+            assert isinstance(record, RECORDS[type(model)])
+            assert get_model_type(record) is type(model)
+            assert record.to_model() == model
+            assert pickle.loads(pickle.dumps(record)) == record
+
+        record = BookRecord.from_model(book_model_fixture)
+        # записи неизменяемы и не содержат `__dict__`
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.title = "Другое название"  # type: ignore
+
+    def test_pipeline(self) -> None:
+        """
+        Тестирование чтения и форматирования компактных записей.
+        """
+
+        with SourcesReader(TEMPLATE_FILE_PATH) as reader:
+            models = reader.read()
+        with SourcesReader(TEMPLATE_FILE_PATH, compact=True) as reader:
+            records = reader.read()
+
+        assert records == [to_record(model) for model in models]
+        assert [str(item) for item in GOSTCitationFormatter(records).format()] == [
+            str(item) for item in GOSTCitationFormatter(models).format()
+        ]
@@ -0,0 +1,113 @@
+"""
+Тестирование внешней сортировки слиянием.
+"""
+import random
+import tempfile
+from pathlib import Path
+from sys import getsizeof
+
+import pytest
+
+from formatters.models import ArticlesCollectionModel, BookModel, InternetResourceModel
+from formatters.records import BookRecord
+from formatters import sorting
+from formatters.sorting import POINTER_SIZE, SIZE_SAMPLE_INTERVAL, external_sort, fill_buffer, get_size
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+class TestExternalSort:
+    """
+    Тестирование внешней сортировки слиянием.
+    """
+
+    @pytest.mark.parametrize("memory_limit", [1, 1000, 10_000, 2**20])
+    def test_sort(self, memory_limit: int) -> None:
+        """
+        Тестирование совпадения результата с `sorted()`, в том числе при сохранении участков во временные файлы.
+
+        :param int memory_limit: Ограничение объема памяти буфера в байтах
+        """
+
+        items = [f"Строка {random.randint(0, 50)}" for _ in range(500)]
+
+        assert list(external_sort(items, memory_limit=memory_limit)) == sorted(items)
+
+    def test_stable(self) -> None:
+        """
+        Тестирование устойчивости сортировки по ключу.
+        """
+
+        items = [(random.randint(0, 5), number) for number in range(300)]
+
+        assert list(external_sort(items, key=lambda item: item[0], memory_limit=1000)) == sorted(
+            items, key=lambda item: item[0]
+        )
+
+    def test_fill_buffer(self) -> None:
+        """
+        Тестирование учета в объеме буфера строки, источника и ключа сортировки
+        и сохранения ключей вместе с элементами.
+        """
+
+        record = BookRecord("Иванов И.М.", "Наука как искусство", None, "СПб.", "Просвещение", 2020, 999)
+        entry = ("Иванов И.М. Наука как искусство. – СПб.: Просвещение, 2020. – 999 с.", record)
+        key = entry[0].lower()
+        size = get_size((key, entry))
+        assert size > getsizeof(entry[0]) + getsizeof(record) + getsizeof(key) + getsizeof(record.title)
+
+        buffer, full = fill_buffer(iter([entry] * 10), size * 3, key=lambda item: item[0].lower())
+        assert full
+        assert buffer == [(key, entry)] * 3
+
+    def test_fill_buffer_sample(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование вычисления размера только для выборки элементов и оценки объема буфера по среднему.
+
+        :param monkeypatch: Фикстура для подмены атрибутов
+        """
+
+        sizes = []
+        monkeypatch.setattr(sorting, "get_size", lambda item: sizes.append(item) or 100)
+
+        buffer, full = fill_buffer(iter(range(1000)), (100 + POINTER_SIZE) * 100)
+        assert full
+        assert buffer == list(range(100))
+        assert sizes == list(range(0, 100, SIZE_SAMPLE_INTERVAL))
+
+    def test_cleanup(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """
+        Тестирование удаления временных файлов после завершения сортировки.
+
+        :param monkeypatch: Фикстура для подмены атрибутов
+        :param Path tmp_path: Фикстура пути для временных файлов
+        """
+
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+        result = external_sort(map(str, range(100)), memory_limit=500)
+        next(result)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        list(result)
+        assert not list(tmp_path.iterdir())
+
+    def test_format_external(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование форматирования списка источников с внешней сортировкой.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        """
+
+        models = [book_model_fixture, internet_resource_model_fixture, articles_collection_model_fixture] * 20
+        expected = [str(item) for item in GOSTCitationFormatter(models).format()]
+
+        formatter = GOSTCitationFormatter(models)
+        assert list(formatter.format_external(memory_limit=1000)) == expected
+        assert not formatter.formatted_items
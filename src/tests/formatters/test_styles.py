@@ -0,0 +1,111 @@
+"""
+Тестирование базовых функций стилей цитирования.
+"""
+from string import Template
+
+import pytest
+
+from formatters.base import BaseCitationFormatter
+from formatters.models import BookModel
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.base import CompiledTemplate
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+class TestCompiledTemplate:
+    """
+    Тестирование шаблонов, заранее преобразованных в строку формата.
+    """
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "$authors $title. – $edition$city: $publishing_house, $year.",
+            "${authors}x {title} $$5 {{}}",
+            *(
+                style.template.template
+                for formatter in (GOSTCitationFormatter, APACitationFormatter)
+                for style in formatter.formatters_map.values()
+            ),
+        ],
+    )
+    def test_substitute(self, template: str) -> None:
+        """
+        Тестирование совпадения результата подстановки с `string.Template`.
+
+        :param str template: Шаблон для форматирования строки.
+        """
+
+        names = {match.group("named") or match.group("braced") for match in Template.pattern.finditer(template)}
+        values = {name: f"<{name}>" for name in names if name}
+        values["year"] = 2020
+
+        assert CompiledTemplate(template).substitute(**values) == Template(template).substitute(**values)
+
+    def test_class_level(self) -> None:
+        """
+        Тестирование создания шаблона один раз для класса стиля.
+        """
+
+        for style in GOSTCitationFormatter.formatters_map.values():
+            assert isinstance(style.template, CompiledTemplate)
+            assert style.__dict__["template"] is style.template
+
+
+class TestLazyFormatting:
+    """
+    Тестирование отложенного форматирования.
+    """
+
+    @pytest.fixture
+    def models(self) -> list[BookModel]:
+        """
+        Получение моделей книг, отформатированные строки которых начинаются одинаково.
+
+        :return: Список моделей книг.
+        """
+
+        authors = ("Smith J.", "Smith J. and Jones", "Smith J.", "Adams", "Smith J. Be", "Иванов И.М.")
+        titles = ("Zeta", "Alpha", "Beta", "Omega", "Gamma", "Наука")
+
+        return [
+            BookModel(
+                authors=author,
+                title=title,
+                edition=None,
+                city="М.",
+                publishing_house="АСТ",
+                year=2020,
+                pages=100,
+            )
+            for author, title in zip(authors, titles)
+        ]
+
+    @pytest.mark.parametrize("formatter", [GOSTCitationFormatter, APACitationFormatter])
+    def test_order(self, formatter: type[BaseCitationFormatter], models: list[BookModel]) -> None:
+        """
+        Тестирование совпадения порядка сортировки с порядком сортировки отформатированных строк.
+
+        :param formatter: Класс форматирования списка источников
+        :param models: Список моделей книг
+        """
+
+        expected = [str(item) for item in formatter(models).format()]
+
+        assert [str(item) for item in formatter(models, lazy=True).format()] == expected
+        assert [str(item) for item in formatter(models, lazy=True).format(limit=2)] == expected[:2]
+
+    def test_partial(self, models: list[BookModel]) -> None:
+        """
+        Тестирование форматирования только выводимых источников.
+
+        :param models: Список моделей книг
+        """
+
+        formatter = GOSTCitationFormatter([models[0], models[3], models[5]], lazy=True)
+        result = formatter.format(limit=1)
+
+        # по ГОСТ источники на русском языке идут перед источниками на иностранных языках
+        assert str(result[0]).startswith("Иванов")
+        # префиксы источников не являются началом друг друга, поэтому строки остальных источников не формировались
+        assert sum(item._formatted is not None for item in formatter.formatted_items) == 1
@@ -0,0 +1,121 @@
+"""
+Тестирование чтения входных данных в форматах CSV, JSON Lines и колоночном двоичном формате.
+"""
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from main import process_input
+from readers.formats import ColumnarSource, get_source_class
+from readers.reader import BookReader, InternetResourceReader, SourcesReader, write_sources
+from settings import TEMPLATE_FILE_PATH
+
+# пути к входным данным каждого формата относительно временной директории
+FORMAT_PATHS = ("csv", "sources.jsonl", "sources.bibcol")
+
+
+@pytest.fixture(name="models")
+def models_fixture() -> list:
+    """
+    Фикстура моделей из файла шаблона.
+
+    :return: Модели источников
+    """
+
+    with SourcesReader(TEMPLATE_FILE_PATH) as reader:
+        return reader.read()
+
+
+class TestFormats:
+    """
+    Тестирование чтения входных данных в форматах, отличных от рабочей книги Excel.
+    """
+
+    @pytest.mark.parametrize("name", FORMAT_PATHS)
+    def test_same_models(self, tmp_path: Path, models: list, name: str) -> None:
+        """
+        Тестирование чтения тех же моделей и компактных записей, что и из рабочей книги.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param list models: Фикстура моделей источников
+        :param str name: Путь к входным данным относительно временной директории
+        """
+
+        path = str(tmp_path / name)
+        write_sources(path, models)
+
+        with SourcesReader(path) as reader:
+            assert reader.read() == models
+
+        with SourcesReader(TEMPLATE_FILE_PATH, compact=True) as reader:
+            records = reader.read()
+        with SourcesReader(path, compact=True) as reader:
+            assert list(reader.iterate()) == records
+
+    def test_csv(self, tmp_path: Path) -> None:
+        """
+        Тестирование чтения файлов CSV, подготовленных вручную: пустые значения, пропуск строк без первого столбца
+        и отсутствующие файлы типов источников.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        (tmp_path / "book.csv").write_text(
+            "authors,title,edition,city,publishing_house,year,pages\n"
+            " Иванов И.М. ,Наука как искусство,,СПб.,Просвещение,2020,999\n"
+            ",,,,,,\n",
+            encoding="utf-8-sig",
+        )
+
+        with SourcesReader(str(tmp_path)) as reader:
+            models = reader.read()
+
+        assert len(models) == 1
+        assert models[0].authors == "Иванов И.М."
+        assert models[0].edition is None
+        assert models[0].year == 2020
+
+    def test_source_type(self) -> None:
+        """
+        Тестирование наименований типов источников и определения формата по пути.
+        """
+
+        assert BookReader().source_type == "book"
+        assert InternetResourceReader().source_type == "internet_resource"
+        assert get_source_class("input.bibcol") is ColumnarSource
+        assert get_source_class(TEMPLATE_FILE_PATH) is None
+
+    def test_columnar_invalid(self, tmp_path: Path) -> None:
+        """
+        Тестирование ошибки чтения файла, не являющегося файлом колоночного формата.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "sources.bibcol"
+        path.write_bytes(b"not a columnar file")
+
+        with pytest.raises(ValueError):
+            with SourcesReader(str(path)) as reader:
+                reader.read()
+
+    def test_convert(self, tmp_path: Path) -> None:
+        """
+        Тестирование преобразования рабочей книги и генерации выходного файла из преобразованных данных.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        contents = []
+        for path_input in (TEMPLATE_FILE_PATH, str(tmp_path / "sources.bibcol")):
+            if path_input != TEMPLATE_FILE_PATH:
+                result = CliRunner().invoke(process_input, ["convert", TEMPLATE_FILE_PATH, path_input])
+                assert result.exit_code == 0, result.output
+
+            path = tmp_path / "output.txt"
+            result = CliRunner().invoke(process_input, ["-pi", path_input, "-po", str(path), "-f", "txt"])
+            assert result.exit_code == 0, result.output
+            contents.append(path.read_text(encoding="utf-8"))
+
+        assert contents[0] == contents[1]
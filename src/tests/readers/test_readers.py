@@ -1,6 +1,7 @@
 """
 Тестирование функций чтения данных из источника.
 """
+from datetime import datetime
 from typing import Any
 
 import pytest
@@ -11,6 +12,7 @@ from src.readers.reader import (
     SourcesReader,
     InternetResourceReader,
     ArticlesCollectionReader,
+    NormativeActReader,
 )
 from src.settings import TEMPLATE_FILE_PATH
 
@@ -120,3 +122,103 @@ class TestReaders:
             InternetResourceModel.__name__,
             ArticlesCollectionModel.__name__,
         }
+
+    def test_sources_reader_read_only(self) -> None:
+        """
+        Тестирование потокового чтения рабочей книги в режиме только для чтения.
+        """
+
+        with SourcesReader(TEMPLATE_FILE_PATH, read_only=False) as reader:
+            expected = reader.read()
+
+        with SourcesReader(TEMPLATE_FILE_PATH, read_only=True) as reader:
+            iterator = reader.iterate()
+            # модели считываются лениво, по мере обхода генератора
+            assert not isinstance(iterator, list)
+            assert list(iterator) == expected
+
+    def test_sources_reader_parallel(self) -> None:
+        """
+        Тестирование параллельного чтения листов рабочей книги.
+        """
+
+        with SourcesReader(TEMPLATE_FILE_PATH) as reader:
+            expected = reader.read()
+
+        with SourcesReader(TEMPLATE_FILE_PATH) as reader:
+            models = reader.read(workers=2)
+            # при параллельном чтении рабочая книга в текущем процессе не загружается
+            assert "workbook" not in reader.__dict__
+
+        assert models == expected
+        assert [type(model).__name__ for model in models] == [type(model).__name__ for model in expected]
+
+    def test_build(self) -> None:
+        """
+        Тестирование пакетной сборки моделей с проверкой значений по столбцам.
+        """
+
+        reader = BookReader()
+        payloads = [
+            ("Иванов И.М.", "Наука", None, "СПб.", "Просвещение", 2020, 999),
+            # значение, которое модель может привести к нужному типу
+            ("Петров С.Н.", "Искусство", "3-е", "М.", "АСТ", 2021, "120"),
+        ]
+
+        models = reader.build([2, 3], payloads)
+        assert models == [BookModel(**dict(zip(reader.fields, payload))) for payload in payloads]
+        assert models[1].pages == 120
+
+        # ошибки валидации собираются для всех строк листа с указанием номеров строк
+        with pytest.raises(ValueError) as error:
+            reader.build([2, 3, 5], payloads[:1] + [payloads[1][:5] + (0, 10), payloads[1][:6] + (None,)])
+
+        assert [(sheet, number) for sheet, number, _ in error.value.errors] == [("Книга", 3), ("Книга", 5)]
+
+    def test_build_convert_error(self) -> None:
+        """
+        Тестирование сбора ошибки преобразования значения ячейки вместе с ошибками остальных строк листа.
+        """
+
+        reader = BookReader()
+        rows = [
+            ("Иванов И.М.", "Наука", None, "СПб.", "Просвещение", "две тысячи", 999),
+            # значение вне допустимого диапазона
+            ("Петров С.Н.", "Искусство", "3-е", "М.", "АСТ", 2021, 0),
+        ]
+
+        with pytest.raises(ValueError) as error:
+            reader.build([2, 3], [reader.convert(row) for row in rows])
+
+        assert type(error.value).__name__ == "ReaderValidationError"
+        assert [(sheet, number) for sheet, number, _ in error.value.errors] == [("Книга", 2), ("Книга", 3)]
+        assert error.value.errors[0][2].startswith("year:")
+        assert error.value.errors[1][2].startswith("pages:")
+
+    def test_plan(self, workbook: Any) -> None:
+        """
+        Тестирование плана извлечения атрибутов из строки.
+
+        :param workbook: Объект тестовой рабочей книги.
+        """
+
+        reader = NormativeActReader(workbook)
+
+        plan = [(attr, index, converter.__name__) for attr, index, converter in reader.plan]
+        assert plan[:3] == [("type", 0, "to_str"), ("title", 1, "to_str"), ("acceptance_date", 2, "to_date")]
+        assert plan[5] == ("publication_year", 5, "to_int")
+        assert reader.width == 9
+
+        # отсутствующие в конце строки ячейки считаются пустыми
+        values = reader.convert((" Закон ", "Название", datetime(2000, 1, 1), "1234-56", "Газета", "2020", 5, 15))
+        assert dict(zip(reader.fields, values)) == {
+            "type": "Закон",
+            "title": "Название",
+            "acceptance_date": "01.01.2000",
+            "number": "1234-56",
+            "publication_source": "Газета",
+            "publication_year": 2020,
+            "source_number": 5,
+            "article_number": 15,
+            "edition_date": None,
+        }
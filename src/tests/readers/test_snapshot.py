@@ -0,0 +1,82 @@
+"""
+Тестирование снимков прочитанных строк рабочей книги.
+"""
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from readers.reader import SourcesReader
+from readers.snapshot import get_snapshot_path, load_snapshot
+from settings import TEMPLATE_FILE_PATH
+
+
+@pytest.fixture(name="path_input")
+def path_input_fixture(tmp_path: Path) -> str:
+    """
+    Фикстура копии файла шаблона во временной директории.
+
+    :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+    :return: Путь к входному файлу
+    """
+
+    return shutil.copy(TEMPLATE_FILE_PATH, tmp_path / "input.xlsx")
+
+
+class TestSnapshot:
+    """
+    Тестирование снимков прочитанных строк рабочей книги.
+    """
+
+    def test_read(self, path_input: str) -> None:
+        """
+        Тестирование сохранения снимка и чтения тех же моделей из снимка.
+
+        :param str path_input: Фикстура пути к входному файлу
+        """
+
+        for compact in (False, True):
+            with SourcesReader(path_input, compact=compact) as reader:
+                expected = reader.read()
+
+            # первое чтение сохраняет снимок, последующие читают строки из снимка без загрузки рабочей книги
+            for _ in range(2):
+                with SourcesReader(path_input, compact=compact, snapshot=True) as reader:
+                    assert reader.read() == expected
+                    assert list(reader.iterate()) == expected
+                assert get_snapshot_path(path_input).exists()
+
+            with SourcesReader(path_input, compact=compact, snapshot=True) as reader:
+                reader.read()
+                assert "workbook" not in reader.__dict__
+
+    def test_invalidation(self, path_input: str) -> None:
+        """
+        Тестирование проверки снимка по времени изменения, размеру и хэшу входного файла.
+
+        :param str path_input: Фикстура пути к входному файлу
+        """
+
+        readers = SourcesReader(path_input).get_readers()
+        assert load_snapshot(path_input, readers) is None
+
+        with SourcesReader(path_input, snapshot=True) as reader:
+            reader.read()
+        assert load_snapshot(path_input, readers) is not None
+
+        # изменение времени изменения без изменения содержимого
+        stat = os.stat(path_input)
+        os.utime(path_input, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert load_snapshot(path_input, readers) is not None
+
+        # изменение содержимого того же размера
+        data = bytearray(Path(path_input).read_bytes())
+        data[-1] ^= 0xFF
+        Path(path_input).write_bytes(data)
+        assert load_snapshot(path_input, readers) is None
+
+        # изменение размера
+        with open(path_input, "ab") as file:
+            file.write(b"\0")
+        assert load_snapshot(path_input, readers) is None
@@ -0,0 +1,153 @@
+"""
+Тестирование кэша выходных файлов.
+"""
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+import cache
+from cache import ResultCache
+from formatters.styles import base
+from main import process_input
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestResultCache:
+    """
+    Тестирование кэша выходных файлов.
+    """
+
+    def test_key(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование зависимости ключа от содержимого входного файла, параметров генерации
+        и версии правил форматирования.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param pytest.MonkeyPatch monkeypatch: Фикстура для подмены версии правил форматирования
+        """
+
+        path = tmp_path / "input.xlsx"
+        path.write_bytes(b"content")
+
+        key = ResultCache.get_key(path, "GOST", "DOCX", None)
+        assert key == ResultCache.get_key(b"content", "GOST", "DOCX", None)
+        assert key != ResultCache.get_key(path, "APA", "DOCX", None)
+        assert key != ResultCache.get_key(path, "GOST", "DOCX", 10)
+        assert key != ResultCache.get_key(b"other", "GOST", "DOCX", None)
+
+        monkeypatch.setattr(base, "STYLE_VERSION", "0")
+        assert key != ResultCache.get_key(path, "GOST", "DOCX", None)
+
+    def test_get_put(self, tmp_path: Path) -> None:
+        """
+        Тестирование сохранения и получения выходного файла и статистики обращений.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        result_cache = ResultCache(tmp_path / "cache", max_size=100)
+        output = tmp_path / "output.docx"
+        output.write_bytes(b"output")
+
+        assert not result_cache.get("key", tmp_path / "copy.docx")
+        result_cache.put("key", output)
+        assert result_cache.get("key", tmp_path / "copy.docx")
+        assert (tmp_path / "copy.docx").read_bytes() == b"output"
+        assert result_cache.get_bytes("key") == b"output"
+        assert (result_cache.stats.hits, result_cache.stats.misses) == (2, 1)
+
+        # записи больше ограничения размера кэша не сохраняются
+        result_cache.put_bytes("large", b"x" * 101)
+        assert result_cache.get_bytes("large") is None
+
+    def test_put_failure(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование удаления временного файла при ошибке сохранения записи.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param monkeypatch: Фикстура для подмены атрибутов
+        """
+
+        def fail(*args: object) -> None:
+            raise OSError("нет места на диске")
+
+        result_cache = ResultCache(tmp_path / "cache")
+        output = tmp_path / "output.docx"
+        output.write_bytes(b"output")
+        monkeypatch.setattr(cache.os, "replace", fail)
+
+        with pytest.raises(OSError):
+            result_cache.put("key", output)
+        with pytest.raises(OSError):
+            result_cache.put_bytes("key", b"output")
+        assert not list(result_cache.path.iterdir())
+
+    def test_eviction(self, tmp_path: Path) -> None:
+        """
+        Тестирование вытеснения давно не использованных записей.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        result_cache = ResultCache(tmp_path, max_size=25)
+        for number, key in enumerate(("first", "second")):
+            result_cache.put_bytes(key, b"x" * 10)
+            os.utime(result_cache.get_entry_path(key), (number, number))
+
+        # обращение к первой записи делает вторую запись давно не использованной
+        assert result_cache.get_bytes("first") is not None
+        result_cache.put_bytes("third", b"x" * 10)
+
+        assert result_cache.get_bytes("second") is None
+        assert result_cache.get_bytes("first") is not None
+        assert result_cache.get_bytes("third") is not None
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_process_input(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, streaming: bool) -> None:
+        """
+        Тестирование получения выходного файла из кэша при повторной обработке входного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param pytest.MonkeyPatch monkeypatch: Фикстура для подмены директории кэша
+        :param bool streaming: Потоковая обработка
+        """
+
+        monkeypatch.setattr(cache, "CACHE_PATH", str(tmp_path / "cache"))
+
+        contents = []
+        for number in range(2):
+            path = tmp_path / f"output_{number}.docx"
+            args = ["--cache", "-pi", TEMPLATE_FILE_PATH, "-po", str(path)] + (["-s"] if streaming else [])
+            result = CliRunner().invoke(process_input, args)
+            assert result.exit_code == 0, result.output
+            contents.append(path.read_bytes())
+
+        assert contents[0] == contents[1]
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def test_stats(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+        """
+        Тестирование статистики кэша при частичном попадании для нескольких стилей цитирования.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param pytest.MonkeyPatch monkeypatch: Фикстура для подмены директории кэша
+        :param pytest.LogCaptureFixture caplog: Фикстура для получения записей лога
+        """
+
+        monkeypatch.setattr(cache, "CACHE_PATH", str(tmp_path / "cache"))
+
+        path = tmp_path / "output.txt"
+        args = ["--cache", "-pi", TEMPLATE_FILE_PATH, "-po", str(path), "-f", "txt"]
+        result = CliRunner().invoke(process_input, args + ["-c", "gost"])
+        assert result.exit_code == 0, result.output
+
+        # выходной файл стиля ГОСТ получается из кэша, стиля APA – генерируется
+        caplog.clear()
+        with caplog.at_level("INFO"):
+            result = CliRunner().invoke(process_input, args + ["-c", "gost", "-c", "apa"])
+        assert result.exit_code == 0, result.output
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert "Кэш результатов: попаданий – 1, промахов – 1 (50% попаданий)." in messages
@@ -0,0 +1,183 @@
+"""
+Тестирование объединения повторяющихся источников.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+import cache
+import dedup
+from dedup import DedupIndex, get_report_path, normalize, save_report
+from formatters.models import BookModel, InternetResourceModel
+from main import process_input
+from readers.reader import SourcesReader, write_sources
+from settings import TEMPLATE_FILE_PATH
+
+# директория исходного кода (рабочая директория процессов с другой инициализацией хэшей)
+SOURCE_PATH = Path(__file__).resolve().parents[1]
+
+
+class TestDedup:
+    """
+    Тестирование индекса повторяющихся источников.
+    """
+
+    def test_normalize(self) -> None:
+        """
+        Тестирование нормализации значений ключевых атрибутов.
+        """
+
+        assert normalize(["  Ёлкин И.М.,", None, "Наука—как   искусство", 2020]) == "елкин и м наука как искусство 2020"
+
+    def test_duplicates(
+        self, book_model_fixture: BookModel, internet_resource_model_fixture: InternetResourceModel
+    ) -> None:
+        """
+        Тестирование объединения совпадающих и похожих источников.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        """
+
+        book = book_model_fixture
+        items = [
+            book,
+            internet_resource_model_fixture,
+            # повтор с другим регистром, пробелами и количеством страниц (не является ключевым атрибутом)
+            book.copy(update={"title": "наука  как Искусство", "pages": 100}),
+            # опечатка в названии
+            book.copy(update={"title": "Наука как искуство"}),
+            # другой год издания
+            book.copy(update={"year": 2021}),
+            internet_resource_model_fixture.copy(update={"access_date": "02.02.2022"}),
+        ]
+
+        index = DedupIndex()
+        located = [("Лист", row, item) for row, item in enumerate(items, 2)]
+        assert list(index.filter(located)) == [items[0], items[1], items[4]]
+        assert [(item.model, item.row, item.kept_row) for item in index.duplicates] == [
+            ("BookModel", 4, 2),
+            ("BookModel", 5, 2),
+            ("InternetResourceModel", 7, 3),
+        ]
+        assert index.duplicates[0].similarity == 1.0
+        assert 0.8 < index.duplicates[1].similarity < 1.0
+
+        # без поиска похожих источников объединяются только совпадающие ключи
+        assert list(DedupIndex(near=False).filter(located)) == [items[0], items[1], items[3], items[4]]
+
+    def test_different_titles(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование сохранения различных книг одних авторов и издательства с близкими названиями.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        items = [
+            book_model_fixture.copy(update={"title": "Сборник задач по физике"}),
+            book_model_fixture.copy(update={"title": "Сборник задач по алгебре"}),
+            # та же опечатка в названии, но другое издательство
+            book_model_fixture.copy(update={"title": "Наука как искуство", "publishing_house": "Наука"}),
+            book_model_fixture,
+        ]
+
+        index = DedupIndex()
+        assert list(index.filter(("Книга", row, item) for row, item in enumerate(items, 2))) == items
+        assert not index.duplicates
+
+    def test_hash_seed(self) -> None:
+        """
+        Тестирование независимости объединенных источников от случайной инициализации хэшей строк (PYTHONHASHSEED).
+        """
+
+        code = (
+            "from benchmarks.dedup import make_records; from dedup import DedupIndex; index = DedupIndex(); "
+            "items = (('Книга', row, item) for row, item in enumerate(make_records(3000), 2)); "
+            "print(sum(1 for _ in index.filter(items)), *index.duplicates)"
+        )
+        outputs = []
+        for seed in ("1", "2"):
+            env = {**os.environ, "PYTHONHASHSEED": seed}
+            result = subprocess.run(
+                [sys.executable, "-c", code], cwd=SOURCE_PATH, env=env, capture_output=True, text=True, check=True
+            )
+            outputs.append(result.stdout)
+
+        assert outputs[0] == outputs[1]
+        assert "similarity=1.0" in outputs[0] and "similarity=0." in outputs[0]
+
+    def test_records(self) -> None:
+        """
+        Тестирование объединения компактных записей: ключи записей совпадают с ключами моделей.
+        """
+
+        with SourcesReader(TEMPLATE_FILE_PATH) as reader:
+            models = reader.read()
+        with SourcesReader(TEMPLATE_FILE_PATH, compact=True) as reader:
+            records = reader.read()
+
+        index = DedupIndex()
+        assert [index.get_key(item) for item in models] == [index.get_key(item) for item in records]
+        assert len(list(index.filter(("", 0, item) for item in models + records))) == len(models)
+
+    def test_save_report_failure(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование удаления временного файла при ошибке сохранения отчета.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param monkeypatch: Фикстура для подмены атрибутов
+        """
+
+        def fail(*args: object) -> None:
+            raise OSError("нет места на диске")
+
+        monkeypatch.setattr(dedup.os, "replace", fail)
+        with pytest.raises(OSError):
+            save_report(get_report_path(tmp_path / "output.docx"), [])
+        assert not list(tmp_path.iterdir())
+
+    def test_command(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование объединения источников при генерации выходного файла, отчета об объединенных источниках
+        с номерами строк входного файла и восстановления отчета из кэша результатов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param pytest.MonkeyPatch monkeypatch: Фикстура для подмены директории кэша
+        """
+
+        monkeypatch.setattr(cache, "CACHE_PATH", str(tmp_path / "cache"))
+        with SourcesReader(TEMPLATE_FILE_PATH) as reader:
+            models = reader.read()
+        # входной файл с повтором первого источника после пустой строки
+        path_input = tmp_path / "input.jsonl"
+        write_sources(str(path_input), models)
+        with open(path_input, encoding="utf-8") as file:
+            first = file.readline()
+        with open(path_input, "a", encoding="utf-8") as file:
+            file.write("\n" + first)
+
+        path_output = tmp_path / "output.txt"
+        path_report = get_report_path(path_output)
+        args = ["-pi", str(path_input), "-po", str(path_output), "-f", "txt", "--dedup"]
+        # последний запуск получает выходной файл и отчет из кэша результатов
+        for options in (["--no-cache"], ["--no-cache", "-s"], ["--cache"], ["--cache"]):
+            path_output.unlink(missing_ok=True)
+            path_report.unlink(missing_ok=True)
+            result = CliRunner().invoke(process_input, args + options)
+            assert result.exit_code == 0, result.output
+
+            report = json.loads(path_report.read_text(encoding="utf-8"))
+            assert len(report) == 1
+            assert report[0]["similarity"] == 1.0
+            assert (report[0]["sheet"], report[0]["row"]) == ("Книга", len(models) + 2)
+            assert (report[0]["kept_sheet"], report[0]["kept_row"]) == ("Книга", 1)
+            lines = path_output.read_text(encoding="utf-8").splitlines()
+            assert sum(line[:1].isdigit() for line in lines) == len(models)
+
+        # в кэше сохранены выходной файл и отчет
+        assert len(list((tmp_path / "cache").iterdir())) == 2
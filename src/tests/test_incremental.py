@@ -0,0 +1,124 @@
+"""
+Тестирование инкрементального форматирования.
+"""
+import dataclasses
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from formatters.models import BookModel
+from formatters.records import to_record
+from formatters.styles.apa import APABook, APACitationFormatter
+from formatters.styles.gost import GOSTBook, GOSTCitationFormatter
+import incremental
+from incremental import format_incremental, get_manifest_path, get_source_hash, save_manifest
+from main import process_input
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+@pytest.fixture(name="records")
+def records_fixture() -> list:
+    """
+    Фикстура компактных записей из файла шаблона.
+
+    :return: Записи источников
+    """
+
+    with SourcesReader(TEMPLATE_FILE_PATH, compact=True) as reader:
+        return reader.read()
+
+
+class TestIncremental:
+    """
+    Тестирование инкрементального форматирования.
+    """
+
+    def test_source_hash(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование зависимости хэша источника от стиля и значений атрибутов источника.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        source_hash = get_source_hash(GOSTBook(book_model_fixture, True))
+
+        assert source_hash == get_source_hash(GOSTBook(to_record(book_model_fixture), True))
+        assert source_hash != get_source_hash(APABook(book_model_fixture, True))
+        assert source_hash != get_source_hash(GOSTBook(book_model_fixture.copy(update={"pages": 1}), True))
+
+    def test_save_failure(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование удаления временного файла при ошибке сохранения манифеста.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param monkeypatch: Фикстура для подмены атрибутов
+        """
+
+        def fail(*args: object) -> None:
+            raise OSError("нет места на диске")
+
+        monkeypatch.setattr(incremental.os, "replace", fail)
+        with pytest.raises(OSError):
+            save_manifest(tmp_path / "output.docx.manifest.json", GOSTCitationFormatter, [])
+        assert not list(tmp_path.iterdir())
+
+    def test_changes(self, tmp_path: Path, records: list) -> None:
+        """
+        Тестирование форматирования только добавленных и измененных источников.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param list records: Фикстура записей источников
+        """
+
+        path = tmp_path / "output.docx"
+        items, stats = format_incremental(GOSTCitationFormatter, records, path)
+        assert [item.formatted for item in items] == [str(item) for item in GOSTCitationFormatter(records).format()]
+        assert (stats.retained, stats.formatted, stats.removed) == (0, len(records), 0)
+        assert get_manifest_path(path).exists()
+
+        # изменение, добавление (повтор существующего источника) и удаление источников
+        changed = list(records)
+        changed[0] = dataclasses.replace(changed[0], title="Другое название")
+        changed.append(changed[-1])
+        del changed[1]
+
+        items, stats = format_incremental(GOSTCitationFormatter, changed, path)
+        assert [item.formatted for item in items] == [str(item) for item in GOSTCitationFormatter(changed).format()]
+        assert (stats.retained, stats.formatted, stats.removed) == (len(records) - 2, 2, 2)
+
+        _, stats = format_incremental(GOSTCitationFormatter, changed, path)
+        assert (stats.retained, stats.formatted, stats.removed) == (len(changed), 0, 0)
+
+    def test_other_style(self, tmp_path: Path, records: list) -> None:
+        """
+        Тестирование игнорирования манифеста другого стиля цитирования.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param list records: Фикстура записей источников
+        """
+
+        path = tmp_path / "output.docx"
+        format_incremental(GOSTCitationFormatter, records, path)
+        items, stats = format_incremental(APACitationFormatter, records, path)
+
+        assert [item.formatted for item in items] == [str(item) for item in APACitationFormatter(records).format()]
+        assert stats.formatted == len(records)
+
+    def test_process_input(self, tmp_path: Path) -> None:
+        """
+        Тестирование инкрементальной генерации выходного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        contents = []
+        for incremental in (False, True, True):
+            path = tmp_path / "output.txt"
+            args = ["-pi", TEMPLATE_FILE_PATH, "-po", str(path), "-f", "txt"]
+            result = CliRunner().invoke(process_input, args + (["--incremental"] if incremental else []))
+            assert result.exit_code == 0, result.output
+            contents.append(path.read_text(encoding="utf-8"))
+
+        assert contents[0] == contents[1] == contents[2]
@@ -0,0 +1,59 @@
+"""
+Тестирование настройки логирования.
+"""
+import logging
+
+from logger import QUEUE_HANDLER, SamplingFilter, get_logger, log_progress
+
+
+class TestLogger:
+    """
+    Тестирование настройки логирования.
+    """
+
+    def test_get_logger(self) -> None:
+        """
+        Тестирование однократного добавления обработчика при повторных вызовах.
+        """
+
+        logger = get_logger("tests.logger")
+        assert get_logger("tests.logger") is logger
+        assert logger.handlers == [QUEUE_HANDLER]
+
+    def test_sampling_filter(self) -> None:
+        """
+        Тестирование прореживания записей отладочного уровня.
+        """
+
+        sampling_filter = SamplingFilter(10)
+
+        def make_record(name: str, level: int) -> logging.LogRecord:
+            return logging.LogRecord(name, level, __file__, 0, "message", None, None)
+
+        assert sum(sampling_filter.filter(make_record("first", logging.DEBUG)) for _ in range(100)) == 10
+        assert sampling_filter.filter(make_record("second", logging.DEBUG))
+        assert all(sampling_filter.filter(make_record("first", logging.INFO)) for _ in range(10))
+
+    def test_log_progress(self) -> None:
+        """
+        Тестирование сводных записей о ходе обработки.
+        """
+
+        class Logger:
+            """
+            Логгер, сохраняющий записи.
+            """
+
+            def __init__(self) -> None:
+                self.records: list[int] = []
+
+            def info(self, message: str, count: int) -> None:
+                self.records.append(count)
+
+        logger = Logger()
+        assert list(log_progress(logger, range(25), "%s", interval=10)) == list(range(25))  # type: ignore
+        assert logger.records == [10, 20, 25]
+
+        logger = Logger()
+        assert not list(log_progress(logger, [], "%s", interval=10))  # type: ignore
+        assert not logger.records
@@ -0,0 +1,138 @@
+"""
+Тестирование консольной команды генерации выходного файла.
+"""
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from docx import Document
+
+from main import process_input
+from settings import TEMPLATE_FILE_PATH
+
+
+def read_paragraphs(path: Path) -> list[str]:
+    """
+    Чтение текста абзацев Word-файла.
+
+    :param Path path: Путь к Word-файлу
+    :return: Список строк
+    """
+
+    return [paragraph.text for paragraph in Document(str(path)).paragraphs]
+
+
+class TestProcessInput:
+    """
+    Тестирование консольной команды генерации выходного файла.
+    """
+
+    @pytest.mark.parametrize("citation", ["gost", "apa"])
+    def test_streaming(self, tmp_path: Path, citation: str) -> None:
+        """
+        Тестирование совпадения результатов обычной и потоковой обработки.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param str citation: Стиль цитирования
+        """
+
+        paths = {}
+        for mode in ("default", "streaming"):
+            paths[mode] = tmp_path / f"{mode}.docx"
+            args = ["-c", citation, "-pi", TEMPLATE_FILE_PATH, "-po", str(paths[mode])]
+            result = CliRunner().invoke(process_input, args + (["--streaming"] if mode == "streaming" else []))
+            assert result.exit_code == 0, result.output
+
+        paragraphs = read_paragraphs(paths["default"])
+        assert len(paragraphs) == 11
+        assert read_paragraphs(paths["streaming"]) == paragraphs
+
+    @pytest.mark.parametrize("output_format", ["txt", "html", "md", "bibtex", "csl_json"])
+    def test_format(self, tmp_path: Path, output_format: str) -> None:
+        """
+        Тестирование совпадения результатов обычной и потоковой обработки для текстовых форматов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param str output_format: Формат выходного файла
+        """
+
+        contents = set()
+        for streaming in (False, True):
+            path = tmp_path / f"{streaming}.{output_format}"
+            args = ["-f", output_format, "-pi", TEMPLATE_FILE_PATH, "-po", str(path)]
+            result = CliRunner().invoke(process_input, args + (["--streaming"] if streaming else []))
+            assert result.exit_code == 0, result.output
+            contents.add(path.read_text(encoding="utf-8"))
+
+        assert len(contents) == 1
+        assert "Наука как искусство" in contents.pop()
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_several_citations(self, tmp_path: Path, streaming: bool) -> None:
+        """
+        Тестирование генерации выходных файлов нескольких стилей цитирования за один запуск.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param bool streaming: Потоковая обработка
+        """
+
+        expected = {}
+        for citation in ("gost", "apa"):
+            path = tmp_path / f"{citation}.txt"
+            args = ["-c", citation, "-f", "txt", "-pi", TEMPLATE_FILE_PATH, "-po", str(path)]
+            result = CliRunner().invoke(process_input, args)
+            assert result.exit_code == 0, result.output
+            expected[citation] = path.read_text(encoding="utf-8")
+
+        args = ["-c", "gost", "-c", "apa", "-f", "txt", "-pi", TEMPLATE_FILE_PATH, "-po", str(tmp_path / "output.txt")]
+        result = CliRunner().invoke(process_input, args + (["--streaming"] if streaming else []))
+        assert result.exit_code == 0, result.output
+
+        for citation, content in expected.items():
+            assert (tmp_path / f"output_{citation}.txt").read_text(encoding="utf-8") == content
+        assert not (tmp_path / "output.txt").exists()
+
+
+class TestBatch:
+    """
+    Тестирование пакетной обработки входных файлов.
+    """
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_directory(self, tmp_path: Path, workers: int) -> None:
+        """
+        Тестирование обработки директории с входными файлами, включая файл с ошибкой.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param int workers: Количество процессов
+        """
+
+        for name in ("first.xlsx", "second.xlsx"):
+            shutil.copy(TEMPLATE_FILE_PATH, tmp_path / name)
+        (tmp_path / "broken.xlsx").write_bytes(b"not a workbook")
+
+        result = CliRunner().invoke(process_input, ["batch", str(tmp_path), "-w", str(workers), "-c", "apa"])
+
+        assert result.exit_code == 1
+        assert "Обработано файлов: 3, успешно: 2, с ошибками: 1" in result.output
+        assert "ОШИБКА  " + str(tmp_path / "broken.xlsx") in result.output
+        assert read_paragraphs(tmp_path / "first.docx") == read_paragraphs(tmp_path / "second.docx")
+        assert len(read_paragraphs(tmp_path / "first.docx")) == 11
+
+    def test_manifest(self, tmp_path: Path) -> None:
+        """
+        Тестирование обработки файла-манифеста.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        (tmp_path / "inputs").mkdir()
+        shutil.copy(TEMPLATE_FILE_PATH, tmp_path / "inputs" / "input.xlsx")
+        manifest = tmp_path / "manifest.txt"
+        manifest.write_text("# входные файлы\n\ninputs/input.xlsx\n", encoding="utf-8")
+
+        result = CliRunner().invoke(process_input, ["batch", str(manifest), "-f", "txt"])
+
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "inputs" / "input.txt").read_text(encoding="utf-8").startswith("Список")
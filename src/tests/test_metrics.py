@@ -0,0 +1,143 @@
+"""
+Тестирование замера этапов обработки и отчета о профилировании.
+"""
+import json
+import pstats
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from main import generate, process_input
+from metrics import StageTimings, measure_stage, profiling
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestStageTimings:
+    """
+    Тестирование замера этапов обработки.
+    """
+
+    def test_nested(self) -> None:
+        """
+        Тестирование учета вложенных этапов, записей и замера этапов только при включенном профилировании.
+        """
+
+        timings = StageTimings()
+        with measure_stage("вне профилирования"):
+            pass
+
+        with profiling(timings):
+            with timings.measure("внешний") as stage:
+                stage.entries = 3
+                with measure_stage("вложенный") as nested:
+                    assert list(nested.count(range(5))) == [0, 1, 2, 3, 4]
+
+        assert list(timings.stages) == ["внешний", "вложенный"]
+        outer, inner = timings.stages["внешний"], timings.stages["вложенный"]
+        assert (outer.calls, outer.entries, inner.entries) == (1, 3, 5)
+        assert outer.own <= outer.elapsed - inner.elapsed + 1e-6
+        assert timings.hot_stage in timings.stages
+
+    def test_memory(self) -> None:
+        """
+        Тестирование пикового объема памяти этапов: память, выделенная вложенным этапом, учитывается во внешнем
+        этапе, но не в последующих этапах.
+        """
+
+        size = 10 * 2**20
+        timings = StageTimings()
+        with profiling(timings):
+            with measure_stage("внешний"):
+                with measure_stage("выделение памяти"):
+                    data = bytearray(size)
+                    del data
+                with measure_stage("без выделения памяти"):
+                    pass
+            with measure_stage("следующий"):
+                pass
+
+        stages = timings.stages
+        # объем памяти учитывается с точностью до служебных объектов интерпретатора
+        assert abs(stages["выделение памяти"].peak_memory - size) < 2**20
+        assert abs(stages["внешний"].peak_memory - size) < 2**20
+        assert stages["без выделения памяти"].peak_memory < 2**20
+        assert stages["следующий"].peak_memory < 2**20
+        assert not tracemalloc.is_tracing()
+
+        # без отслеживания памяти пиковый объем памяти этапов не замеряется
+        timings = StageTimings()
+        with profiling(timings, trace_memory=False):
+            with measure_stage("выделение памяти"):
+                data = bytearray(size)
+                del data
+        assert timings.stages["выделение памяти"].peak_memory == 0
+
+    def test_profile(self, tmp_path: Path) -> None:
+        """
+        Тестирование отчета о выполнении этапов и статистики cProfile выбранного этапа.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path_profile = tmp_path / "profile.json"
+        args = [
+            "-pi",
+            TEMPLATE_FILE_PATH,
+            "-po",
+            str(tmp_path / "output.txt"),
+            "-f",
+            "txt",
+            "--no-cache",
+            "--profile",
+            str(path_profile),
+            "--profile-stage",
+            "форматирование источников",
+        ]
+        result = CliRunner().invoke(process_input, args)
+        assert result.exit_code == 0, result.output
+
+        report = json.loads(path_profile.read_text(encoding="utf-8"))
+        stages = report["stages"]
+        assert {"чтение строк", "проверка и сборка моделей", "форматирование источников", "сортировка"} <= set(stages)
+        assert stages["чтение источников"]["entries"] == 10
+        assert stages["запись выходного файла"]["entries"] == 10
+        assert stages["запись выходного файла"]["entries_per_second"] > 0
+        assert stages["чтение источников"]["peak_memory"] > 0
+        assert report["peak_rss"] > 0
+        assert report["hot_stage"] in stages
+
+        stats = pstats.Stats(str(tmp_path / "profile.pstats"))
+        assert stats.total_calls > 0
+
+    @pytest.mark.parametrize("external_sort", [False, True])
+    def test_default_stages(self, tmp_path: Path, external_sort: bool) -> None:
+        """
+        Тестирование замера чтения строк и сортировки при генерации с параметрами по умолчанию
+        (один процесс чтения, вывод всех источников) и при внешней сортировке.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param bool external_sort: Внешняя сортировка отформатированных строк
+        """
+
+        timings = StageTimings()
+        with profiling(timings):
+            generate(TEMPLATE_FILE_PATH, str(tmp_path / "output.docx"), external_sort=external_sort, timings=timings)
+
+        stages = timings.stages
+        assert stages["чтение строк"].entries == 10
+        assert stages["сортировка"].entries == 10
+        if external_sort:
+            # внешняя сортировка выполняется при получении строк рендерером и не входит в собственное время записи
+            writing = stages["запись выходного файла"]
+            assert writing.own <= writing.elapsed - stages["сортировка"].elapsed + 1e-6
+
+    def test_profile_stage_without_report(self) -> None:
+        """
+        Тестирование ошибки при указании этапа для профилирования без отчета.
+        """
+
+        result = CliRunner().invoke(process_input, ["--profile-stage", "сортировка"])
+
+        assert result.exit_code != 0
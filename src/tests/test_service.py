@@ -0,0 +1,158 @@
+"""
+Тестирование HTTP-сервиса генерации библиографических списков.
+"""
+import asyncio
+import json
+from http import HTTPStatus
+from io import BytesIO
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import pytest
+from docx import Document
+
+import service as service_module
+from service import RenderService, render_job
+from settings import TEMPLATE_FILE_PATH
+
+
+async def request(
+    port: int, method: str, target: str, body: bytes = b"", content_type: str = "application/octet-stream"
+) -> tuple[int, dict[str, str], bytes]:
+    """
+    Отправка HTTP-запроса сервису.
+
+    :param int port: Порт сервиса
+    :param str method: Метод запроса
+    :param str target: Адрес и строка запроса
+    :param bytes body: Тело запроса
+    :param str content_type: Тип содержимого тела запроса
+    :return: Код ответа, заголовки (наименования в нижнем регистре) и тело ответа
+    """
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    head = f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Type: {content_type}\r\n"
+    writer.write(f"{head}Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+
+    response = await reader.read()
+    writer.close()
+    head_bytes, _, payload = response.partition(b"\r\n\r\n")
+    status_line, *lines = head_bytes.decode("latin-1").split("\r\n")
+    headers = {name.lower(): value.strip() for name, _, value in (line.partition(":") for line in lines)}
+
+    return int(status_line.split(" ")[1]), headers, payload
+
+
+def run_with_service(scenario: Callable[[RenderService], Awaitable[None]], **kwargs: int) -> None:
+    """
+    Запуск сценария тестирования с сервисом на свободном порту.
+
+    :param scenario: Сценарий тестирования
+    :param kwargs: Параметры сервиса
+    """
+
+    async def run() -> None:
+        service = RenderService(**kwargs)
+        await service.start("127.0.0.1", 0)
+        try:
+            await scenario(service)
+        finally:
+            await service.close()
+
+    asyncio.run(run())
+
+
+class TestRenderService:
+    """
+    Тестирование HTTP-сервиса генерации библиографических списков.
+    """
+
+    def test_workbook(self) -> None:
+        """
+        Тестирование генерации Word-файла из загруженной рабочей книги и параллельных запросов.
+        """
+
+        workbook = Path(TEMPLATE_FILE_PATH).read_bytes()
+
+        async def scenario(service: RenderService) -> None:
+            responses = await asyncio.gather(
+                *(request(service.port, "POST", "/render?citation=apa", workbook) for _ in range(3))
+            )
+            for status, headers, body in responses:
+                assert status == HTTPStatus.OK
+                assert headers["content-type"].endswith("wordprocessingml.document")
+                assert len(Document(BytesIO(body)).paragraphs) == 11
+
+        run_with_service(scenario, workers=2, queue_size=4)
+
+    def test_json(self) -> None:
+        """
+        Тестирование генерации текстового файла из списка источников в формате JSON и ошибок валидации.
+        """
+
+        sources = {
+            "sources": [
+                {
+                    "type": "internet_resource",
+                    "article": "Наука как искусство",
+                    "website": "Ведомости",
+                    "link": "https://www.vedomosti.ru",
+                    "access_date": "01.01.2021",
+                }
+            ]
+        }
+
+        async def scenario(service: RenderService) -> None:
+            body = json.dumps(sources).encode("utf-8")
+            status, _, payload = await request(service.port, "POST", "/render?format=txt", body, "application/json")
+            assert status == HTTPStatus.OK
+            assert payload.decode("utf-8").endswith(
+                "1. Наука как искусство // Ведомости URL: https://www.vedomosti.ru (дата обращения: 01.01.2021).\n"
+            )
+
+            invalid = json.dumps({"sources": [{"type": "book", "title": "Наука"}]}).encode("utf-8")
+            status, _, payload = await request(service.port, "POST", "/render", invalid, "application/json")
+            assert status == HTTPStatus.BAD_REQUEST
+            assert "authors" in json.loads(payload)["error"]
+
+            status, _, _ = await request(service.port, "POST", "/render?citation=mla", body, "application/json")
+            assert status == HTTPStatus.BAD_REQUEST
+
+        run_with_service(scenario, workers=1, queue_size=0)
+
+    def test_back_pressure(self) -> None:
+        """
+        Тестирование ответа кодом 503 при превышении количества ожидающих запросов.
+        """
+
+        async def scenario(service: RenderService) -> None:
+            status, _, payload = await request(service.port, "GET", "/health")
+            assert status == HTTPStatus.OK
+            assert json.loads(payload)["capacity"] == 2
+
+            service.pending = service.capacity
+            status, headers, _ = await request(service.port, "POST", "/render", b"{}", "application/json")
+            assert status == HTTPStatus.SERVICE_UNAVAILABLE
+            assert headers["retry-after"] == "1"
+
+        run_with_service(scenario, workers=1, queue_size=1)
+
+    def test_render_job_errors(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование кода 400 для ошибок входных данных и кода 500 для остальных ошибок.
+
+        :param monkeypatch: Фикстура для подмены атрибутов
+        """
+
+        for payload in (b"{", b'{"items": []}', b'{"sources": [1]}'):
+            status, _, _ = render_job(payload, True, "GOST", "TXT", None)
+            assert status == HTTPStatus.BAD_REQUEST
+
+        def fail(*args: object) -> None:
+            raise TypeError("внутренняя ошибка")
+
+        monkeypatch.setattr(service_module, "render_models", fail)
+        status, message, _ = render_job(b"[]", True, "GOST", "TXT", None)
+        assert status == HTTPStatus.INTERNAL_SERVER_ERROR
+        assert "TypeError" not in message.decode("utf-8")
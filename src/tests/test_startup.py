@@ -0,0 +1,81 @@
+"""
+Тестирование времени запуска приложения.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import main
+
+# директория с исходным кодом приложения
+SOURCE_PATH = Path(main.__file__).parent
+
+# модули, которые не должны импортироваться при запуске приложения
+LAZY_MODULES = (
+    "openpyxl",
+    "docx",
+    "pydantic",
+    "readers.reader",
+    "formatters.styles.gost",
+    "formatters.styles.apa",
+    "text_renderer",
+)
+
+# ограничение суммарного времени импорта модуля `main` (в секундах);
+# до перехода на отложенный импорт время составляло около 0.4 с
+STARTUP_IMPORT_LIMIT = 0.3
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    """
+    Запуск кода в отдельном процессе интерпретатора.
+
+    :param str code: Код для запуска
+    :param options: Параметры интерпретатора
+    :return: Результат выполнения процесса
+    """
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join((str(SOURCE_PATH), os.environ.get("PYTHONPATH", "")))}
+
+    return subprocess.run(
+        [sys.executable, *options, "-c", code], cwd=SOURCE_PATH, env=env, capture_output=True, text=True, check=True
+    )
+
+
+class TestStartup:
+    """
+    Тестирование времени запуска приложения.
+    """
+
+    def test_import_time(self) -> None:
+        """
+        Тестирование отложенного импорта библиотек и времени импорта модуля `main` (по данным `-X importtime`).
+        """
+
+        result = run_python("import main", "-X", "importtime")
+
+        # строки вида "import time: <собственное время, мкс> | <суммарное время, мкс> | <модуль>"
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, total, name = line.split("|")
+                if total.strip().isdigit():
+                    cumulative[name.strip()] = int(total) / 10**6
+
+        assert not [name for name in cumulative if name.split(".")[0] in LAZY_MODULES or name in LAZY_MODULES]
+        assert cumulative["main"] < STARTUP_IMPORT_LIMIT
+
+    def test_help(self) -> None:
+        """
+        Тестирование вывода справки без импорта библиотек.
+        """
+
+        result = run_python(
+            "import sys, main\n"
+            "main.process_input(['--help'], standalone_mode=False)\n"
+            f"print(sorted(name for name in {LAZY_MODULES!r} if name in sys.modules))"
+        )
+
+        assert "Usage" in result.stdout
+        assert result.stdout.strip().endswith("[]")
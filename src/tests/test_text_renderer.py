@@ -0,0 +1,118 @@
+"""
+Тестирование генерации выходных файлов текстовых форматов.
+"""
+import json
+from pathlib import Path
+
+from formatters.models import ArticlesCollectionModel, BookModel, InternetResourceModel
+from formatters.records import to_record
+from formatters.styles.gost import GOSTCitationFormatter
+from text_renderer import (
+    BibTeXRenderer,
+    CSLJSONRenderer,
+    HTMLRenderer,
+    MarkdownRenderer,
+    PlainTextRenderer,
+)
+
+
+class TestTextRenderers:
+    """
+    Тестирование генерации выходных файлов текстовых форматов.
+    """
+
+    rows = ("Smith J. & Jones <A.> *Science* (2020).", "Иванов И.М. Наука как искусство.")
+
+    def test_plain_text(self, tmp_path: Path) -> None:
+        """
+        Тестирование генерации файла с простым текстом.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "output.txt"
+        PlainTextRenderer(iter(self.rows), title="Список", numbered=True).render(path)
+
+        assert path.read_text(encoding="utf-8") == f"Список\n\n1. {self.rows[0]}\n2. {self.rows[1]}\n"
+
+    def test_html(self, tmp_path: Path) -> None:
+        """
+        Тестирование генерации HTML-файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "output.html"
+        HTMLRenderer(self.rows, title="References").render(path)
+
+        content = path.read_text(encoding="utf-8")
+        assert "<h1>References</h1>\n<ul>\n<li>Smith J. &amp; Jones &lt;A.&gt; *Science* (2020).</li>\n" in content
+        assert content.endswith("</ul>\n</body>\n</html>\n")
+
+    def test_markdown(self, tmp_path: Path) -> None:
+        """
+        Тестирование генерации Markdown-файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "output.md"
+        MarkdownRenderer(self.rows, title="Список", numbered=True).render(path)
+
+        assert path.read_text(encoding="utf-8").splitlines()[2] == r"1. Smith J. & Jones \<A.\> \*Science\* (2020)."
+
+    def test_bibtex(
+        self,
+        tmp_path: Path,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+    ) -> None:
+        """
+        Тестирование генерации файла BibTeX.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        """
+
+        path = tmp_path / "output.bib"
+        entries = [("", to_record(book_model_fixture)), ("", internet_resource_model_fixture)]
+        BibTeXRenderer(entries).render(path)
+
+        content = path.read_text(encoding="utf-8")
+        assert "@book{ref1,\n  author = {Иванов И.М. and Петров С.Н.},\n" in content
+        assert "  edition = {3-е},\n" in content
+        assert "@online{ref2,\n" in content
+        assert "  urldate = {2021-01-01}\n}\n" in content
+
+    def test_csl_json(
+        self,
+        tmp_path: Path,
+        book_model_fixture: BookModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование генерации файла CSL-JSON из отсортированного списка источников.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        """
+
+        path = tmp_path / "output.json"
+        models = [articles_collection_model_fixture, book_model_fixture]
+        CSLJSONRenderer(GOSTCitationFormatter.stream(models, entries=True)).render(path)
+
+        items = json.loads(path.read_text(encoding="utf-8"))
+        assert [item["type"] for item in items] == ["chapter", "book"]
+        assert items[1] == {
+            "id": "ref2",
+            "type": "book",
+            "author": [{"literal": "Иванов И.М."}, {"literal": "Петров С.Н."}],
+            "title": "Наука как искусство",
+            "edition": "3-е",
+            "publisher-place": "СПб.",
+            "publisher": "Просвещение",
+            "issued": {"date-parts": [[2020]]},
+            "number-of-pages": 999,
+        }
@@ -0,0 +1,130 @@
+"""
+Тестирование потоковой записи Word-файла.
+"""
+import zipfile
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from renderer import DOCUMENT_PART, APARenderer, DocxRenderer, GOSTRenderer
+
+
+def read_parts(path: Path) -> dict[str, bytes]:
+    """
+    Чтение частей пакета Word-файла.
+
+    :param Path path: Путь к Word-файлу
+    :return: Содержимое частей пакета по наименованиям
+    """
+
+    with zipfile.ZipFile(path) as package:
+        return {name: package.read(name) for name in package.namelist()}
+
+
+class TestWordprocessingWriter:
+    """
+    Тестирование потоковой записи Word-файла.
+    """
+
+    @pytest.fixture
+    def rows(self) -> tuple[str, ...]:
+        """
+        Получение строк со специальными символами XML, пробелами, табуляцией и переводами строк.
+
+        :return: Строки для сохранения в файле
+        """
+
+        return (
+            "Иванов И.М. Наука как искусство. – СПб.: Просвещение, 2020. – 999 с.",
+            'Smith J. & Jones <A.> "Science" (2020).',
+            " Пробел в начале и в конце ",
+            "Табуляция\tи перевод\nстроки\r\n",
+            "",
+        )
+
+    @pytest.mark.parametrize("renderer", [GOSTRenderer, APARenderer])
+    def test_compatibility(self, tmp_path: Path, rows: tuple[str, ...], renderer: type[DocxRenderer]) -> None:
+        """
+        Тестирование совпадения потоковой записи с документом, построенным python-docx.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param tuple[str, ...] rows: Строки для сохранения в файле
+        :param type[DocxRenderer] renderer: Рендерер стиля цитирования
+        """
+
+        paths = {}
+        for streaming in (False, True):
+            paths[streaming] = tmp_path / f"{streaming}.docx"
+            # строки передаются генератором, как при потоковой обработке
+            renderer((row for row in rows), streaming=streaming).render(paths[streaming])
+
+        assert read_parts(paths[True]) == read_parts(paths[False])
+
+        paragraphs = Document(str(paths[True])).paragraphs[1:]
+        assert [paragraph.style.name for paragraph in paragraphs] == [renderer.paragraph_style] * len(rows)
+        assert paragraphs[1].text == rows[1]
+
+    def test_invalid_chars(self, tmp_path: Path) -> None:
+        """
+        Тестирование ошибки при записи символов, недопустимых в XML.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        with pytest.raises(ValueError):
+            GOSTRenderer(["Строка\x00"], streaming=True).render(tmp_path / "output.docx")
+
+    def test_document_part(self, tmp_path: Path) -> None:
+        """
+        Тестирование количества абзацев при записи нескольких пакетов абзацев.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "output.docx"
+        APARenderer((f"Строка №{number}" for number in range(2500)), streaming=True).render(path)
+
+        with zipfile.ZipFile(path) as package:
+            assert package.read(DOCUMENT_PART).count(b"<w:p>") == 2501
+
+
+class TestBaseDocumentCache:
+    """
+    Тестирование кэша оформленных документов рендереров.
+    """
+
+    @pytest.mark.parametrize("renderer", [GOSTRenderer, APARenderer])
+    def test_copies(self, renderer: type[DocxRenderer]) -> None:
+        """
+        Тестирование независимости копий оформленного документа.
+
+        :param type[DocxRenderer] renderer: Рендерер стиля цитирования
+        """
+
+        renderer.clear_cache()
+        document = renderer.get_base_document()
+        document.add_paragraph("Строка №1")
+        document.styles["Normal"].font.size = None
+
+        copy = renderer.get_base_document()
+        assert len(copy.paragraphs) == 1
+        assert copy.styles["Normal"].font.size == renderer.create_document().styles["Normal"].font.size
+        assert renderer.get_writer() is renderer.get_writer()
+
+    def test_render(self, tmp_path: Path) -> None:
+        """
+        Тестирование совпадения результатов генерации с кэшем и без кэша.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        paths = []
+        for number in range(2):
+            GOSTRenderer.clear_cache()
+            for streaming in (False, True):
+                path = tmp_path / f"{number}_{streaming}.docx"
+                GOSTRenderer(["Строка №1", "Строка №2"], streaming=streaming).render(path)
+                paths.append(path)
+
+        assert len({tuple(sorted(read_parts(path).items())) for path in paths}) == 1
@@ -0,0 +1,432 @@
+"""
+Функции для генерации выходных файлов текстовых форматов: простой текст, HTML, Markdown, BibTeX и CSL-JSON.
+
+Строки записываются в файл по мере получения через буфер размером `WRITE_BUFFER_SIZE`,
+поэтому объем памяти не зависит от количества источников.
+"""
+from __future__ import annotations
+import html
+import json
+import re
+from abc import abstractmethod
+from datetime import datetime
+from itertools import count
+from pathlib import Path
+from typing import Any, ClassVar, Iterable, Optional, TextIO, Union
+
+from pydantic import BaseModel
+
+from formatters.models import (
+    ArticlesCollectionModel,
+    BookModel,
+    DissertationModel,
+    InternetResourceModel,
+    NormativeActModel,
+)
+from formatters.records import Source, get_model_type
+from metrics import measure_stage
+from renderer import BaseRenderer
+from settings import WRITE_BUFFER_SIZE
+
+# экранирование специальных символов Markdown
+MARKDOWN_SPECIAL_CHARS = re.compile(r"([\\`*_\[\]<>|#])")
+# экранирование специальных символов BibTeX
+BIBTEX_SPECIAL_CHARS = str.maketrans(
+    {
+        "\\": r"\textbackslash{}",
+        "{": r"\{",
+        "}": r"\}",
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+    }
+)
+# формат дат в атрибутах источников
+DATE_FORMAT = "%d.%m.%Y"
+
+
+def split_authors(authors: str) -> list[str]:
+    """
+    Разделение списка авторов источника.
+
+    :param str authors: Авторы через запятую (например, "Иванов И.М., Петров С.Н.").
+    :return: Список авторов.
+    """
+
+    return [author.strip() for author in authors.split(",") if author.strip()]
+
+
+def escape_markdown(text: str) -> str:
+    """
+    Экранирование специальных символов Markdown.
+
+    :param str text: Текст.
+    :return: Экранированный текст.
+    """
+
+    return MARKDOWN_SPECIAL_CHARS.sub(r"\\\1", text)
+
+
+def parse_date(value: str) -> Optional[datetime]:
+    """
+    Разбор даты в формате атрибутов источников.
+
+    :param str value: Дата в формате `DATE_FORMAT`.
+    :return: Дата или `None`, если значение не соответствует формату.
+    """
+
+    try:
+        return datetime.strptime(value, DATE_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+class TextRenderer(BaseRenderer):
+    """
+        Базовый класс для создания файла текстового формата.
+    """
+
+    def __init__(self, rows: Iterable[Any], title: str = "", numbered: bool = False):
+        """
+            Конструктор.
+
+            :param Iterable[Any] rows: Отформатированные строки или пары строк и источников, если установлен
+                признак `entries` (в том числе генератор при потоковой обработке).
+            :param str title: Заголовок списка использованных источников.
+            :param bool numbered: Признак нумерации источников.
+        """
+
+        super().__init__(rows)
+        self.title = title
+        self.numbered = numbered
+
+    def get_header(self) -> str:
+        """
+            Получение начала файла.
+
+            :return: Текст, записываемый перед строками источников.
+        """
+
+        return ""
+
+    def get_footer(self) -> str:
+        """
+            Получение окончания файла.
+
+            :return: Текст, записываемый после строк источников.
+        """
+
+        return ""
+
+    @abstractmethod
+    def format_row(self, number: int, row: Any) -> str:
+        """
+            Получение текста строки источника.
+
+            :param int number: Номер источника в списке (начиная с 1).
+            :param Any row: Отформатированная строка или пара строки и источника.
+            :return: Текст для записи в файл.
+        """
+
+    def write(self, file: TextIO, rows: Iterable[Any]) -> None:
+        """
+            Запись списка использованных источников в открытый файл.
+
+            :param TextIO file: Файл, открытый для записи.
+            :param Iterable[Any] rows: Отформатированные строки или пары строк и источников.
+        """
+
+        file.write(self.get_header())
+        file.writelines(map(self.format_row, count(1), rows))
+        file.write(self.get_footer())
+
+    def render(self, path: Path | str) -> None:
+        with measure_stage("запись выходного файла") as stage:
+            with open(path, "w", encoding="utf-8", newline="\n", buffering=WRITE_BUFFER_SIZE) as file:
+                self.write(file, stage.count(self.rows))
+
+
+class PlainTextRenderer(TextRenderer):
+    """
+        Создание файла с простым текстом.
+    """
+
+    extension = ".txt"
+    media_type = "text/plain; charset=utf-8"
+
+    def get_header(self) -> str:
+        return f"{self.title}\n\n" if self.title else ""
+
+    def format_row(self, number: int, row: str) -> str:
+        return f"{number}. {row}\n" if self.numbered else f"{row}\n"
+
+
+class HTMLRenderer(TextRenderer):
+    """
+        Создание HTML-файла.
+    """
+
+    extension = ".html"
+    media_type = "text/html; charset=utf-8"
+
+    def get_header(self) -> str:
+        title = html.escape(self.title)
+        heading = f"<h1>{title}</h1>\n" if title else ""
+        tag = "ol" if self.numbered else "ul"
+
+        return (
+            '<!DOCTYPE html>\n<html lang="ru">\n<head>\n<meta charset="utf-8">\n'
+            f"<title>{title}</title>\n</head>\n<body>\n{heading}<{tag}>\n"
+        )
+
+    def get_footer(self) -> str:
+        tag = "ol" if self.numbered else "ul"
+
+        return f"</{tag}>\n</body>\n</html>\n"
+
+    def format_row(self, number: int, row: str) -> str:
+        return f"<li>{html.escape(row, quote=False)}</li>\n"
+
+
+class MarkdownRenderer(TextRenderer):
+    """
+        Создание Markdown-файла.
+    """
+
+    extension = ".md"
+    media_type = "text/markdown; charset=utf-8"
+
+    def get_header(self) -> str:
+        return f"# {escape_markdown(self.title)}\n\n" if self.title else ""
+
+    def format_row(self, number: int, row: str) -> str:
+        marker = f"{number}." if self.numbered else "-"
+
+        return f"{marker} {escape_markdown(row)}\n"
+
+
+class BibTeXRenderer(TextRenderer):
+    """
+        Создание файла BibTeX (типы записей и атрибуты biblatex).
+    """
+
+    extension = ".bib"
+    media_type = "application/x-bibtex; charset=utf-8"
+    entries = True
+
+    def format_row(self, number: int, row: tuple[str, Source]) -> str:
+        data = row[1]
+        entry_type, fields = getattr(self, self.fields_map[get_model_type(data)])(data)
+        lines = ",\n".join(
+            f"  {name} = {{{value if name == 'url' else str(value).translate(BIBTEX_SPECIAL_CHARS)}}}"
+            for name, value in fields.items()
+            if value is not None and value != ""
+        )
+
+        return f"@{entry_type}{{ref{number},\n{lines}\n}}\n\n"
+
+    @staticmethod
+    def get_date(value: str) -> str:
+        """
+            Получение даты в формате biblatex (ISO 8601).
+
+            :param str value: Дата в формате атрибутов источников.
+            :return: Дата в формате ISO 8601 или исходное значение.
+        """
+
+        date = parse_date(value)
+
+        return date.strftime("%Y-%m-%d") if date else value
+
+    @staticmethod
+    def get_book(data: Any) -> tuple[str, dict[str, Any]]:
+        return "book", {
+            "author": " and ".join(split_authors(data.authors)),
+            "title": data.title,
+            "edition": data.edition,
+            "address": data.city,
+            "publisher": data.publishing_house,
+            "year": data.year,
+            "pagetotal": data.pages,
+        }
+
+    @classmethod
+    def get_internet_resource(cls, data: Any) -> tuple[str, dict[str, Any]]:
+        return "online", {
+            "title": data.article,
+            "organization": data.website,
+            "url": data.link,
+            "urldate": cls.get_date(data.access_date),
+        }
+
+    @staticmethod
+    def get_articles_collection(data: Any) -> tuple[str, dict[str, Any]]:
+        return "incollection", {
+            "author": " and ".join(split_authors(data.authors)),
+            "title": data.article_title,
+            "booktitle": data.collection_title,
+            "address": data.city,
+            "publisher": data.publishing_house,
+            "year": data.year,
+            "pages": data.pages,
+        }
+
+    @staticmethod
+    def get_dissertation(data: Any) -> tuple[str, dict[str, Any]]:
+        return "thesis", {
+            "author": data.author,
+            "title": data.title,
+            "type": f"дис. ... {data.author_degree} {data.science_branch} наук: {data.branch_code}",
+            "address": data.city,
+            "year": data.year,
+            "pagetotal": data.page_count,
+        }
+
+    @classmethod
+    def get_normative_act(cls, data: Any) -> tuple[str, dict[str, Any]]:
+        return "legislation", {
+            "title": data.title,
+            "type": data.type,
+            "number": data.number,
+            "date": cls.get_date(data.acceptance_date),
+            "journaltitle": data.publication_source,
+            "year": data.publication_year,
+            "issue": data.source_number,
+            "note": f"ст. {data.article_number}"
+            + (f", ред. от {data.edition_date}" if data.edition_date else ""),
+        }
+
+    # методы получения типа записи и атрибутов BibTeX для типов источников
+    fields_map: ClassVar[dict[type[BaseModel], str]] = {
+        BookModel: "get_book",
+        InternetResourceModel: "get_internet_resource",
+        ArticlesCollectionModel: "get_articles_collection",
+        DissertationModel: "get_dissertation",
+        NormativeActModel: "get_normative_act",
+    }
+
+
+class CSLJSONRenderer(TextRenderer):
+    """
+        Создание файла CSL-JSON (массив объектов Citation Style Language).
+    """
+
+    extension = ".json"
+    media_type = "application/vnd.citationstyles.csl+json"
+    entries = True
+
+    def get_header(self) -> str:
+        return "[\n"
+
+    def get_footer(self) -> str:
+        return "\n]\n"
+
+    def format_row(self, number: int, row: tuple[str, Source]) -> str:
+        data = row[1]
+        item = {"id": f"ref{number}", **getattr(self, self.fields_map[get_model_type(data)])(data)}
+        separator = "" if number == 1 else ",\n"
+
+        return f"{separator}{json.dumps({key: value for key, value in item.items() if value}, ensure_ascii=False)}"
+
+    @staticmethod
+    def get_date(value: Union[str, int]) -> dict[str, Any]:
+        """
+            Получение даты в формате CSL-JSON.
+
+            :param Union[str, int] value: Год или дата в формате атрибутов источников.
+            :return: Дата в формате CSL-JSON.
+        """
+
+        if isinstance(value, int):
+            return {"date-parts": [[value]]}
+
+        date = parse_date(value)
+
+        return {"date-parts": [[date.year, date.month, date.day]]} if date else {"raw": value}
+
+    @staticmethod
+    def get_authors(authors: str) -> list[dict[str, str]]:
+        """
+            Получение списка авторов в формате CSL-JSON.
+
+            :param str authors: Авторы через запятую.
+            :return: Список авторов.
+        """
+
+        return [{"literal": author} for author in split_authors(authors)]
+
+    @classmethod
+    def get_book(cls, data: Any) -> dict[str, Any]:
+        return {
+            "type": "book",
+            "author": cls.get_authors(data.authors),
+            "title": data.title,
+            "edition": data.edition,
+            "publisher-place": data.city,
+            "publisher": data.publishing_house,
+            "issued": cls.get_date(data.year),
+            "number-of-pages": data.pages,
+        }
+
+    @classmethod
+    def get_internet_resource(cls, data: Any) -> dict[str, Any]:
+        return {
+            "type": "webpage",
+            "title": data.article,
+            "container-title": data.website,
+            "URL": data.link,
+            "accessed": cls.get_date(data.access_date),
+        }
+
+    @classmethod
+    def get_articles_collection(cls, data: Any) -> dict[str, Any]:
+        return {
+            "type": "chapter",
+            "author": cls.get_authors(data.authors),
+            "title": data.article_title,
+            "container-title": data.collection_title,
+            "publisher-place": data.city,
+            "publisher": data.publishing_house,
+            "issued": cls.get_date(data.year),
+            "page": data.pages,
+        }
+
+    @classmethod
+    def get_dissertation(cls, data: Any) -> dict[str, Any]:
+        return {
+            "type": "thesis",
+            "author": cls.get_authors(data.author),
+            "title": data.title,
+            "genre": f"дис. ... {data.author_degree} {data.science_branch} наук: {data.branch_code}",
+            "publisher-place": data.city,
+            "issued": cls.get_date(data.year),
+            "number-of-pages": data.page_count,
+        }
+
+    @classmethod
+    def get_normative_act(cls, data: Any) -> dict[str, Any]:
+        return {
+            "type": "legislation",
+            "title": data.title,
+            "genre": data.type,
+            "number": data.number,
+            "issued": cls.get_date(data.acceptance_date),
+            "container-title": data.publication_source,
+            "issue": data.source_number,
+            "section": f"ст. {data.article_number}",
+            "note": f"опубл. в {data.publication_year} г."
+            + (f", ред. от {data.edition_date}" if data.edition_date else ""),
+        }
+
+    # методы получения атрибутов CSL-JSON для типов источников
+    fields_map: ClassVar[dict[type[BaseModel], str]] = {
+        BookModel: "get_book",
+        InternetResourceModel: "get_internet_resource",
+        ArticlesCollectionModel: "get_articles_collection",
+        DissertationModel: "get_dissertation",
+        NormativeActModel: "get_normative_act",
+    }